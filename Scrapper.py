@@ -1,15 +1,19 @@
 import os
+import argparse
+import json
 import tempfile
 import random
 import time
-import requests
-from bs4 import BeautifulSoup
-import smtplib, ssl
-from email.mime.text import MIMEText
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from datetime import datetime
 
-from job_filters import is_relevant_title  # your regex-based filter
+from job_identity import extract_job_id, normalize_job_url
+from parse_pool import ParsePool, filter_spec  # parsing + regex-based title filter
+from search_urls import RESULTS_PER_PAGE, build_search_url
+from poll_scheduler import PollScheduler
+from profiling import StageProfiler, profiling_requested
 
 # ─── CONFIG ──────────────────────────────────────────────────────────
 load_dotenv()
@@ -18,10 +22,49 @@ EMAIL_ADDRESS = os.getenv("JOBBOT_EMAIL")
 EMAIL_PASSWORD = os.getenv("JOBBOT_APP_PASSWORD")
 TO_EMAIL = os.getenv("JOBBOT_TO", EMAIL_ADDRESS)
 
-SEEN_FILE = "seen_jobs.txt"
+SEEN_FILE = "seen_jobs.txt"            # one LinkedIn job ID per line
 ALREADY_SEEN = set()
 PAGES_TO_SCRAPE = 3                   # ~25 jobs per page
-CHECK_INTERVAL_SECONDS = 300          # 5 minutes
+CHECK_INTERVAL_SECONDS = 300          # 5 minutes (fixed interval, or the adaptive starting point)
+
+# Adaptive polling: learn new-job arrival rates per hour of day and poll more
+# often when postings arrive, less often when they do not (JOBBOT_ADAPTIVE=0
+# polls every CHECK_INTERVAL_SECONDS)
+ADAPTIVE_POLLING = os.getenv("JOBBOT_ADAPTIVE", "1") != "0"
+POLL_STATE_FILE = "poll_state.json"
+MIN_INTERVAL_SECONDS = int(os.getenv("JOBBOT_MIN_INTERVAL", "60"))
+MAX_INTERVAL_SECONDS = int(os.getenv("JOBBOT_MAX_INTERVAL", "1800"))
+
+# Incremental crawl: results are sorted newest first, so stop paginating once a
+# page is mostly jobs seen in earlier cycles; keep going past PAGES_TO_SCRAPE
+# (up to MAX_PAGES_TO_SCRAPE) while pages are entirely new.
+INCREMENTAL_CRAWL = os.getenv("JOBBOT_INCREMENTAL", "1") != "0"
+SEEN_STOP_RATIO = 0.8                 # stop after a page with >= 80% seen jobs
+MAX_PAGES_TO_SCRAPE = 10
+
+# Saved searches (JSON list, see saved_searches_example.json); without the file
+# the notifier runs DEFAULT_SEARCHES. All searches run concurrently each cycle
+# and share REQUEST_BUDGET page requests (every search gets its first page).
+SAVED_SEARCHES_FILE = os.getenv("JOBBOT_SEARCHES", "saved_searches.json")
+SEARCH_WORKERS = int(os.getenv("JOBBOT_SEARCH_WORKERS", "4"))
+REQUEST_BUDGET = int(os.getenv("JOBBOT_REQUEST_BUDGET", "12"))
+# Worker processes for parsing result pages (0/1: parse in the fetch threads)
+PARSE_WORKERS = int(os.getenv("JOBBOT_PARSE_WORKERS", "0"))
+_PARSE_POOL = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+# Per-stage profiling, enabled by --profile or JOBBOT_PROFILE=1 when run as a script;
+# summary printed on exit. --once runs a single cycle: `python Scrapper.py --once --profile`.
+PROFILER = StageProfiler()
+DEFAULT_SEARCHES = [{
+    "name": "us-entry-tech",
+    "keywords": ("software engineer OR software developer OR data analyst OR data engineer"
+                 " OR cloud engineer OR devops engineer"),
+    "location": "United States",
+    # Full-time only (no internships), Entry/Associate, last 24h
+    "filters": {"job_type": "full_time", "experience": ["internship", "entry"], "date_posted": "24h",
+                "geo_id": 103644278, "sort": "recent"},
+}]
 
 # ─── PRINT HELPERS (no logging module; terminal prints only) ─────────
 def _ts():
@@ -44,6 +87,10 @@ def print_job_match(title, company, loc, link):
 
 # ─── EMAIL ───────────────────────────────────────────────────────────
 def send_email(subject, body):
+    # Loaded only when there is something to send
+    import smtplib, ssl
+    from email.mime.text import MIMEText
+
     context = ssl.create_default_context()
     try:
         msg = MIMEText(body)
@@ -66,7 +113,8 @@ def load_seen() -> set:
         return set()
     try:
         with open(SEEN_FILE, "r", encoding="utf-8") as f:
-            seen = set(f.read().splitlines())
+            # Older seen files stored full links; map them to job IDs too
+            seen = {job_key_for(line) for line in f.read().splitlines() if line.strip()}
         info(f"Loaded seen set | count={len(seen)}")
         return seen
     except Exception as e:
@@ -86,102 +134,312 @@ def save_seen(seen: set):
         try: os.remove(tmp)
         except OSError: pass
 
-# ─── SCRAPER ─────────────────────────────────────────────────────────
-def scrape_linkedin():
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    # Full-time only (no internships), Entry/Associate, last 24h
-    base = (
-        "https://www.linkedin.com/jobs/search/"
-        "?f_JT=F&f_E=1%2C2&f_TPR=r86400"
-        "&geoId=103644278"
-        "&keywords=software%20engineer%20OR%20software%20developer%20OR%20data%20analyst%20OR%20data%20engineer%20OR%20cloud%20engineer%20OR%20devops%20engineer"
-        "&location=United%20States&origin=JOB_SEARCH_PAGE_JOB_FILTER&sortBy=DD"
-    )
+# ─── JOB IDENTITY ────────────────────────────────────────────────────
+def job_key_for(link: str) -> str:
+    """Dedup key for a job link: the LinkedIn job ID, else the normalized link."""
+    return extract_job_id(link) or normalize_job_url(link.strip())
 
+# ─── SCRAPER ─────────────────────────────────────────────────────────
+def next_page_decision(page_index, total, seen_count):
+    """
+    Whether the incremental crawl should fetch the page after page_index.
+
+    Returns (continue?, reason).
+    """
+    if total == 0:
+        return False, "empty page"
+    if seen_count >= total * SEEN_STOP_RATIO:
+        return False, f"page {page_index + 1} mostly seen ({seen_count}/{total})"
+    if seen_count == 0:
+        if page_index + 1 < MAX_PAGES_TO_SCRAPE:
+            return True, "page entirely new"
+        return False, f"max depth {MAX_PAGES_TO_SCRAPE} reached"
+    if page_index + 1 < PAGES_TO_SCRAPE:
+        return True, "partially new"
+    return False, f"depth {PAGES_TO_SCRAPE} reached"
+
+def load_saved_searches(path=None):
+    """
+    Saved searches from a JSON list; falls back to DEFAULT_SEARCHES.
+
+    Each entry: name, keywords, location, filters (search_urls names or raw
+    LinkedIn parameters), optional include/exclude title regexes and
+    default_excludes (job_filters.make_title_filter), optional max_pages.
+    """
+    path = path or SAVED_SEARCHES_FILE
+    entries = DEFAULT_SEARCHES
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            info(f"Loaded saved searches | file={path} | count={len(entries)}")
+        except Exception as e:
+            warn(f"Failed to read saved searches; using the default search. reason={e}")
+            entries = DEFAULT_SEARCHES
+
+    searches = []
+    for i, entry in enumerate(entries, 1):
+        search = dict(entry)
+        search["name"] = str(search.get("name") or f"search_{i}")
+        search["filters"] = {"sort": "recent", **(search.get("filters") or {})}
+        search["filter_spec"] = filter_spec(search.get("include"), search.get("exclude"),
+                                            search.get("default_excludes", True))
+        searches.append(search)
+    return searches
+
+class RequestBudget:
+    """Page requests allowed per cycle, shared by all searches; first pages are reserved."""
+
+    def __init__(self, total, reserved_first_pages=0):
+        self.lock = threading.Lock()
+        self.reserved = min(reserved_first_pages, total)
+        self.remaining = total - self.reserved
+
+    def take(self, first_page=False):
+        with self.lock:
+            if first_page and self.reserved > 0:
+                self.reserved -= 1
+                return True
+            if self.remaining > 0:
+                self.remaining -= 1
+                return True
+            return False
+
+class CycleDedup:
+    """Jobs discovered and notified this cycle, shared by concurrent searches."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.discovered = set()
+        self.notified = set()
+
+    def discover(self, key):
+        with self.lock:
+            self.discovered.add(key)
+
+    def claim(self, key) -> bool:
+        """True the first time a job is accepted by any search this cycle."""
+        with self.lock:
+            if key in self.notified:
+                return False
+            self.notified.add(key)
+            return True
+
+def get_parse_pool():
+    """The shared parse pool; search threads call this concurrently."""
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = ParsePool(workers=PARSE_WORKERS)
+        return _PARSE_POOL
+
+def close_parse_pool():
+    """Shut down the parse pool's worker processes, if any were started."""
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is not None:
+            _PARSE_POOL.close()
+            _PARSE_POOL = None
+
+def scrape_search(search, known, dedup, budget, session):
+    """
+    Fetch one saved search's result pages and return (accepted matches, stats).
+
+    known: job keys from earlier cycles; with INCREMENTAL_CRAWL they decide how
+    many pages are fetched. Matches are (title, link, location, company, search name).
+    """
+    import requests
+
+    name = search["name"]
+    started = time.time()
+    stats = {"name": name, "pages": 0, "cards": 0, "new": 0, "accepted": 0,
+             "seconds": 0.0, "stop": None, "error": None}
+    max_pages = search.get("max_pages", MAX_PAGES_TO_SCRAPE)
+    # Without any history (first run) fetch the usual fixed depth
+    incremental = INCREMENTAL_CRAWL and bool(known)
     results = []
-    all_links = set()
-
-    for i in range(PAGES_TO_SCRAPE):
-        url = base + (f"&start={i*25}" if i else "")
+    own_keys = set()
+    stats["stop"] = f"depth {PAGES_TO_SCRAPE} reached"
+
+    for i in range(max_pages if incremental else min(PAGES_TO_SCRAPE, max_pages)):
+        if not budget.take(first_page=(i == 0)):
+            stats["stop"] = "request budget exhausted"
+            break
+        url = build_search_url(search.get("keywords", ""), search.get("location"), search["filters"],
+                               start=i * RESULTS_PER_PAGE)
         try:
-            res = requests.get(url, headers=headers, timeout=(5, 30))
+            with PROFILER.stage("fetch"):
+                res = session.get(url, timeout=(5, 30))
             res.raise_for_status()
         except requests.RequestException as e:
-            warn(f"⚠️ Page {i+1}: request failed. reason={e}")
+            warn(f"⚠️ [{name}] Page {i+1}: request failed. reason={e}")
+            stats["error"] = str(e)
             time.sleep(1.0 + random.random())
             continue
 
-        soup = BeautifulSoup(res.text, 'html.parser')
-        cards = soup.find_all('div', class_='base-card')
-        info(f"Page {i+1}: parsed {len(cards)} job cards.")
+        # Parsed (same card parser as the browserless search engine) and title-filtered
+        # with this search's rules, in a worker process when JOBBOT_PARSE_WORKERS > 1
+        with PROFILER.stage("parse_filter"):
+            cards = get_parse_pool().submit(res.content, search["filter_spec"]).result()
+        stats["pages"] += 1
+        stats["cards"] += len(cards)
+        seen_on_page = sum(1 for card in cards if (card[0] or card[4]) in known or (card[0] or card[4]) in own_keys)
+        info(f"[{name}] Page {i+1}: parsed {len(cards)} job cards | already seen={seen_on_page}")
+
+        for job_id, title, company, loc, link, _, relevant in cards:
+            key = job_id or link
+            if key in known or key in own_keys:
+                continue
+            own_keys.add(key)
+            dedup.discover(key)
+            stats["new"] += 1
 
-        for card in cards:
-            a = (card.select_one("a.base-card__full-link")
-                 or card.find("a", href=lambda h: h and "/jobs/view/" in h))
-            if not a:
+            # Intern/co-op are excluded by default inside job_filters
+            if not relevant:
+                continue
+            # Several searches may match the same job; notify it once
+            if not dedup.claim(key):
                 continue
 
-            title = a.get_text(strip=True)
-            link = a["href"].partition("?")[0]
+            print_job_match(title, company, loc, link)
+            results.append((title, link, loc, company, name))
+            stats["accepted"] += 1
+
+        if incremental:
+            more, stats["stop"] = next_page_decision(i, len(cards), seen_on_page)
+            if not more:
+                break
+        elif not cards:
+            stats["stop"] = "empty page"
+            break
+        time.sleep(0.7 + random.random() * 0.8)
 
-            if link in ALREADY_SEEN:
-                continue
-            ALREADY_SEEN.add(link)
-            all_links.add(link)
+    stats["seconds"] = round(time.time() - started, 2)
+    return results, stats
 
-            loc_el = (card.select_one('span.job-search-card__location')
-                      or card.select_one('span.base-search-card__location')
-                      or card.find('span', class_='job-result-card__location'))
-            loc = loc_el.get_text(strip=True) if loc_el else ''
+def scrape_linkedin(known=None, searches=None):
+    """
+    Run every saved search concurrently under one request budget.
 
-            comp_el = (card.select_one('h4.base-search-card__subtitle')
-                       or card.select_one('h3.base-search-card__subtitle'))
-            company = comp_el.get_text(strip=True) if comp_el else ''
+    Returns (accepted matches, discovered job keys, per-search stats).
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
 
-            # Regex-based title filter (intern/co-op/senior excluded inside job_filters)
-            if not is_relevant_title(title):
-                continue
+    searches = searches if searches is not None else load_saved_searches()
+    known = set(known or ()) | ALREADY_SEEN
+    dedup = CycleDedup()
+    budget = RequestBudget(max(REQUEST_BUDGET, len(searches)), reserved_first_pages=len(searches))
 
-            # Print only accepted matches
-            print_job_match(title, company, loc, link)
-            results.append((title, link, loc))
+    session = requests.Session()
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    adapter = HTTPAdapter(pool_connections=SEARCH_WORKERS, pool_maxsize=SEARCH_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
 
-        time.sleep(0.7 + random.random() * 0.8)
+    results, all_stats = [], []
+    try:
+        with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+            futures = [executor.submit(scrape_search, search, known, dedup, budget, session)
+                       for search in searches]
+            for search, future in zip(searches, futures):
+                try:
+                    search_results, stats = future.result()
+                except Exception as e:
+                    error(f"[{search['name']}] search failed. reason={e}")
+                    search_results, stats = [], {"name": search["name"], "pages": 0, "cards": 0, "new": 0,
+                                                 "accepted": 0, "seconds": 0.0, "stop": "error", "error": str(e)}
+                results.extend(search_results)
+                all_stats.append(stats)
+    finally:
+        session.close()
 
-    info(f"Scrape complete | accepted={len(results)} | discovered_links={len(all_links)}")
-    return results, all_links
+    ALREADY_SEEN.update(dedup.discovered)
+    print_search_stats(all_stats)
+    info(f"Scrape complete | searches={len(searches)} | requests={sum(s['pages'] for s in all_stats)} | "
+         f"accepted={len(results)} | discovered={len(dedup.discovered)}")
+    return results, dedup.discovered, all_stats
+
+def print_search_stats(all_stats):
+    print(f"\n{'search':<24} {'pages':>5} {'cards':>6} {'new':>5} {'matched':>8} {'secs':>6}  stop")
+    for s in all_stats:
+        print(f"{s['name'][:24]:<24} {s['pages']:>5} {s['cards']:>6} {s['new']:>5} {s['accepted']:>8} "
+              f"{s['seconds']:>6.1f}  {s['stop']}" + (f" (error: {s['error'][:40]})" if s['error'] else ""))
+    print()
 
 # ─── MAIN CHECK ──────────────────────────────────────────────────────
 def check_and_notify():
+    """Run one cycle; returns the number of newly discovered jobs (before title filtering)."""
     info("Cycle start.")
-    seen = load_seen()
-
-    new_jobs = []
-    scraped_jobs, _ = scrape_linkedin()
+    with PROFILER.stage("seen_state"):
+        seen = load_seen()
+    seen_before = len(seen)
 
-    for title, link, loc in scraped_jobs:
-        if link not in seen:
-            new_jobs.append((title, link, loc))
+    with PROFILER.stage("scrape"):
+        scraped_jobs, discovered_keys, _ = scrape_linkedin(seen)
+    new_jobs = [job for job in scraped_jobs if job_key_for(job[1]) not in seen]
 
-    # Update seen file with all unique job links we just processed
-    seen.update(link for _, link, _ in scraped_jobs)
-    save_seen(seen)
+    # Record every discovered job (filtered-out titles too) so the next cycle's
+    # incremental crawl recognizes pages it has already covered
+    seen.update(job_key_for(link) for _, link, _, _, _ in scraped_jobs)
+    seen.update(discovered_keys)
+    with PROFILER.stage("seen_state"):
+        save_seen(seen)
 
     if new_jobs:
-        body = "\n\n".join([f"{t}\n{l}\nLocation: {loc}" for t, l, loc in new_jobs])
-        send_email("📬 New Job Listings", body)
-        info(f"📬 Email sent | new_jobs={len(new_jobs)}")
+        # One consolidated email per cycle, grouped by saved search
+        sections = {}
+        for title, link, loc, company, search_name in new_jobs:
+            sections.setdefault(search_name, []).append(
+                f"{title}\n{company + chr(10) if company else ''}{link}\nLocation: {loc}")
+        body = "\n\n".join(f"== {name} ({len(items)}) ==\n\n" + "\n\n".join(items)
+                            for name, items in sections.items())
+        with PROFILER.stage("email"):
+            send_email(f"📬 {len(new_jobs)} New Job Listings", body)
+        info(f"📬 Email sent | new_jobs={len(new_jobs)} | searches={len(sections)}")
     else:
         info("No new matches this cycle.")
 
     info("Cycle end.\n")
+    return len(seen) - seen_before
 
 # ─── SCHEDULE ────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    info("🚀 LinkedIn Job Notifier starting | interval={CHECK_INTERVAL_SECONDS}s | pages={PAGES_TO_SCRAPE}")
-    while True:
-        try:
-            check_and_notify()
-        except Exception as e:
-            error(f"Unhandled error in cycle. reason={e}")
-        time.sleep(CHECK_INTERVAL_SECONDS)
+    parser = argparse.ArgumentParser(description="Poll LinkedIn saved searches and email new matching jobs")
+    parser.add_argument('--once', action='store_true', help="Run a single cycle and exit")
+    parser.add_argument('--profile', action='store_true',
+                        help="Profile each stage and print a summary on exit (or set JOBBOT_PROFILE=1)")
+    args = parser.parse_args()
+    PROFILER.enabled = args.profile or profiling_requested([])
+
+    scheduler = None
+    if ADAPTIVE_POLLING:
+        scheduler = PollScheduler(POLL_STATE_FILE, base_interval=CHECK_INTERVAL_SECONDS,
+                                  min_interval=MIN_INTERVAL_SECONDS, max_interval=MAX_INTERVAL_SECONDS)
+    interval_text = (f"adaptive {MIN_INTERVAL_SECONDS}-{MAX_INTERVAL_SECONDS}s" if scheduler
+                     else f"{CHECK_INTERVAL_SECONDS}s")
+    info(f"🚀 LinkedIn Job Notifier starting | interval={interval_text} | pages={PAGES_TO_SCRAPE}"
+         f" | incremental={INCREMENTAL_CRAWL} (max pages={MAX_PAGES_TO_SCRAPE})")
+    if scheduler and scheduler.busiest_hours():
+        info("Busiest hours so far: " + ", ".join(f"{h:02d}h {r:.1f}/h" for h, r in scheduler.busiest_hours()))
+    try:
+        while True:
+            new_count = None
+            try:
+                new_count = check_and_notify()
+            except Exception as e:
+                error(f"Unhandled error in cycle. reason={e}")
+            if args.once:
+                break
+            if scheduler:
+                scheduler.record(new_count)
+                interval = scheduler.next_interval()
+                info(f"Schedule | {scheduler.summary()}")
+            else:
+                interval = CHECK_INTERVAL_SECONDS
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        info("Stopped.")
+    finally:
+        close_parse_pool()
+        PROFILER.print_summary()
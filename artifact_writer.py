@@ -0,0 +1,238 @@
+"""
+Buffered writer for generated artifacts (cover letters, CV sections)
+
+Generation threads hand finished artifacts to an ArtifactWriter, which writes
+them in batches from one background thread. File names are derived from the
+LinkedIn job ID, so concurrent jobs never collide. Instead of one file per job,
+a run's artifacts can also be packed into a single JSONL file or zip archive
+per artifact kind.
+"""
+import os
+import re
+import json
+import queue
+import hashlib
+import zipfile
+import threading
+from datetime import datetime
+from config import COVER_LETTERS_DIR, CV_SECTIONS_DIR
+from job_identity import job_key
+
+FORMATS = ('files', 'jsonl', 'zip')
+
+# Artifact kind -> (file name prefix, output directory)
+ARTIFACT_KINDS = {
+    'cover_letter': ("cover_letter", COVER_LETTERS_DIR),
+    'cv_section': ("cv_about_me", CV_SECTIONS_DIR),
+}
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
+def _slug(value, max_length):
+    return _SLUG_RE.sub("_", str(value or "")).strip("_")[:max_length]
+
+
+def artifact_filename(kind, job_data):
+    """
+    Collision-free file name for a job's artifact
+
+    Args:
+        kind (str): Artifact kind ('cover_letter' or 'cv_section')
+        job_data (dict): Job information
+
+    Returns:
+        str: e.g. cover_letter_3912345678_Acme_Corp_Backend_Engineer.txt
+    """
+    prefix = ARTIFACT_KINDS[kind][0]
+    key = job_key(job_data)
+    if not key.isdigit():
+        # No job ID: hash whatever identifies the job instead
+        source = key or f"{job_data.get('company')}|{job_data.get('title')}|{job_data.get('location')}"
+        key = hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]
+    company = _slug(job_data.get('company', 'company'), 30)
+    title = _slug(job_data.get('title', 'position'), 30)
+    return f"{prefix}_{key}_{company}_{title}.txt"
+
+
+def format_artifact(kind, text, job_data, generated=None):
+    """
+    Render an artifact as the text file content
+
+    Args:
+        kind (str): Artifact kind
+        text (str): Generated text
+        job_data (dict): Job information
+        generated (datetime): Generation time (default: now)
+
+    Returns:
+        str: File content
+    """
+    rule = "=" * 80
+    generated = (generated or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
+    header = "ADAPTED COVER LETTER" if kind == 'cover_letter' else "CUSTOMIZED CV - ABOUT ME SECTION"
+    body = text if kind == 'cover_letter' else f"CUSTOMIZED 'ABOUT ME' SECTION:\n{'-' * 80}\n\n{text}"
+    return (f"{rule}\n{header}\n{rule}\n\n"
+            f"Job Title: {job_data.get('title', 'N/A')}\n"
+            f"Company: {job_data.get('company', 'N/A')}\n"
+            f"Location: {job_data.get('location', 'N/A')}\n"
+            f"Generated: {generated}\n"
+            f"\n{rule}\n\n"
+            f"{body}"
+            f"\n\n{rule}\n"
+            f"Job Link: {job_data.get('link', 'N/A')}\n")
+
+
+def write_artifact(kind, text, job_data, filename=None, directory=None):
+    """
+    Write one artifact file synchronously (single write call)
+
+    Returns:
+        str: File path
+    """
+    directory = directory or ARTIFACT_KINDS[kind][1]
+    os.makedirs(directory, exist_ok=True)
+    filepath = os.path.join(directory, filename or artifact_filename(kind, job_data))
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(format_artifact(kind, text, job_data))
+    return filepath
+
+
+class ArtifactWriter:
+    def __init__(self, fmt='files', directories=None, batch_size=64, flush_interval=0.5, run_id=None):
+        """
+        Start the background writer
+
+        Args:
+            fmt (str): 'files' (one file per artifact), 'jsonl' (one JSON line per
+                artifact, one file per kind and run) or 'zip' (one archive per kind and run)
+            directories (dict): Optional kind -> output directory overrides
+            batch_size (int): Maximum artifacts written per batch
+            flush_interval (float): Seconds to wait for more artifacts before writing a batch
+            run_id (str): Name for the run's JSONL/zip files (default: timestamp)
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown artifact format '{fmt}'. Choose from: {', '.join(FORMATS)}")
+        self.fmt = fmt
+        self.directories = {kind: directory for kind, (_, directory) in ARTIFACT_KINDS.items()}
+        self.directories.update(directories or {})
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.stats = {'artifacts': 0, 'batches': 0, 'bytes': 0, 'errors': 0}
+        self.paths = set()
+
+        self._queue = queue.Queue()
+        self._archives = {}
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _target(self, kind, filename):
+        """Path of the file (or archive/JSONL file) an artifact ends up in"""
+        directory = self.directories[kind]
+        if self.fmt == 'files':
+            return os.path.join(directory, filename)
+        return os.path.join(directory, f"{kind}s_{self.run_id}.{self.fmt}")
+
+    def submit(self, kind, text, job_data, filename=None):
+        """
+        Queue an artifact for writing
+
+        Args:
+            kind (str): 'cover_letter' or 'cv_section'
+            text (str): Generated text
+            job_data (dict): Job information
+            filename (str): Optional file name (default: artifact_filename)
+
+        Returns:
+            str: Path the artifact is written to (the archive/JSONL file when packing)
+        """
+        if self._closed:
+            raise RuntimeError("ArtifactWriter is closed")
+        filename = filename or artifact_filename(kind, job_data)
+        self._queue.put((kind, filename, text, dict(job_data), datetime.now()))
+        return self._target(kind, filename)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            # Collect whatever else arrives shortly, up to batch_size
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._write_batch(batch)
+            if stop:
+                return
+
+    def _write_batch(self, batch):
+        try:
+            grouped = {}
+            for kind, filename, text, job_data, generated in batch:
+                content = format_artifact(kind, text, job_data, generated)
+                grouped.setdefault(self._target(kind, filename), []).append((filename, content, job_data, generated))
+
+            for target, items in grouped.items():
+                os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+                if self.fmt == 'files':
+                    for _, content, _, _ in items:
+                        with open(target, 'w', encoding='utf-8') as f:
+                            f.write(content)
+                        self.stats['bytes'] += len(content)
+                elif self.fmt == 'jsonl':
+                    lines = "".join(json.dumps({'file': filename, 'job_id': job_key(job_data),
+                                                'title': job_data.get('title'), 'company': job_data.get('company'),
+                                                'link': job_data.get('link'), 'generated': generated.isoformat(),
+                                                'content': content}, ensure_ascii=False) + "\n"
+                                    for filename, content, job_data, generated in items)
+                    with open(target, 'a', encoding='utf-8') as f:
+                        f.write(lines)
+                    self.stats['bytes'] += len(lines)
+                else:
+                    archive = self._archives.get(target)
+                    if archive is None:
+                        archive = self._archives[target] = zipfile.ZipFile(target, 'a', zipfile.ZIP_DEFLATED)
+                    for filename, content, _, _ in items:
+                        archive.writestr(filename, content)
+                        self.stats['bytes'] += len(content)
+                self.paths.add(target)
+
+            self.stats['artifacts'] += len(batch)
+            self.stats['batches'] += 1
+        except Exception as e:
+            self.stats['errors'] += len(batch)
+            print(f"Error writing {len(batch)} artifact(s): {e}")
+
+    def close(self):
+        """Write everything still queued and stop the background thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        for archive in self._archives.values():
+            archive.close()
+        self._archives.clear()
+
+    def summary(self):
+        """One-line description of what was written"""
+        s = self.stats
+        where = ", ".join(sorted(self.paths)) if self.fmt != 'files' else "individual files"
+        return (f"{s['artifacts']} artifact(s) written in {s['batches']} batch(es) "
+                f"({s['bytes'] / 1024:.0f} KB, {s['errors']} errors) to {where}")
@@ -0,0 +1,379 @@
+"""
+Non-interactive batch runner for the LinkedIn Job Scraper pipeline
+
+Reads a YAML or TOML job spec describing one or more profiles (CV, cover letter
+template, titles, locations, options) and runs every title x location
+combination with a single shared browser session and LLM client. A JSON run
+report is written to output/reports/ at the end of each run.
+
+Usage:
+    python batch.py jobs.yaml
+    python batch.py jobs.toml --headless
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from config import (OUTPUT_DIR, ARTIFACT_FORMAT, LEAN_BROWSER, SEARCH_MODE, SEARCH_ENGINE, TRACKER_FILE,
+                    XLSX_PER_RUN, ensure_output_dirs)
+from linkedin_scraper import LinkedInJobScraper
+from llm_helper import LLMHelper
+from llm_backends import create_backend
+from artifact_writer import ArtifactWriter
+from job_ranking import rank_jobs
+from cv_parser import parse_cv
+from profiling import StageProfiler, profiling_requested
+from main import (fetch_job_details, group_jobs_for_generation,
+                  generate_cover_letters_for_jobs, customize_cv_for_jobs)
+
+
+REPORTS_DIR = os.path.join(OUTPUT_DIR, "reports")
+
+PROFILE_DEFAULTS = {
+    'max_results': 50,
+    'generate_cover_letters': True,
+    'customize_cv': False,
+    'max_llm_jobs': 50,
+    'fetch_details': True,
+    'additional_context': {},
+    'filters': {},
+    'tracker_file': TRACKER_FILE,
+    'xlsx_per_run': XLSX_PER_RUN,
+}
+
+
+def load_spec(path):
+    """
+    Load a batch job spec from a YAML or TOML file
+
+    String values may reference environment variables ($VAR or ${VAR}), so
+    credentials and API keys do not have to be stored in the spec itself.
+
+    Args:
+        path (str): Path to a .yaml/.yml or .toml spec file
+
+    Returns:
+        dict: Parsed spec
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("PyYAML is required for YAML specs: pip install pyyaml")
+        with open(path, 'r', encoding='utf-8') as f:
+            spec = yaml.safe_load(f) or {}
+    elif ext == '.toml':
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ImportError("tomli is required for TOML specs on Python < 3.11: pip install tomli")
+        with open(path, 'rb') as f:
+            spec = tomllib.load(f)
+    else:
+        raise ValueError(f"Unsupported spec format '{ext}'. Use .yaml, .yml or .toml")
+
+    return _expand_env(spec)
+
+
+def _expand_env(value):
+    """Recursively expand environment variables in spec string values"""
+    if isinstance(value, str):
+        return os.path.expandvars(value)
+    if isinstance(value, list):
+        return [_expand_env(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _expand_env(v) for k, v in value.items()}
+    return value
+
+
+def _read_text(path, base_dir):
+    """Read a text file referenced by the spec, relative to the spec location"""
+    if not path:
+        return ""
+    if not os.path.isabs(path):
+        path = os.path.join(base_dir, path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().strip()
+
+
+def _as_list(value):
+    """Accept a single string or a list of strings"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def build_profiles(spec, base_dir):
+    """
+    Resolve profile entries in the spec into ready-to-run profile dictionaries
+
+    Args:
+        spec (dict): Parsed spec
+        base_dir (str): Directory used to resolve relative file paths
+
+    Returns:
+        list: Profile dictionaries
+    """
+    defaults = dict(PROFILE_DEFAULTS)
+    defaults.update(spec.get('defaults', {}))
+
+    profiles = []
+    for i, entry in enumerate(spec.get('profiles', []), 1):
+        profile = dict(defaults)
+        profile.update(entry)
+        profile['name'] = str(profile.get('name') or f"profile_{i}")
+        profile['titles'] = _as_list(profile.get('titles'))
+        profile['locations'] = _as_list(profile.get('locations'))
+        if not profile['titles'] or not profile['locations']:
+            raise ValueError(f"Profile '{profile['name']}' needs at least one title and one location")
+
+        profile['entire_cv'] = profile.get('cv') or _read_text(profile.get('cv_file'), base_dir)
+        profile['base_cover_letter'] = (profile.get('cover_letter')
+                                        or _read_text(profile.get('cover_letter_file'), base_dir))
+        profiles.append(profile)
+
+    if not profiles:
+        raise ValueError("Spec does not define any profiles")
+    return profiles
+
+
+def run_profile(scraper, llm_helper, profile, profiler=None):
+    """
+    Run the scrape -> generate -> export pipeline for one profile
+
+    Args:
+        scraper (LinkedInJobScraper): Shared scraper with its session opened
+        llm_helper (LLMHelper): Shared LLM helper
+        profile (dict): Resolved profile
+        profiler (StageProfiler): Optional stage profiler (stages accumulate across profiles)
+
+    Returns:
+        dict: Profile section of the run report
+    """
+    profiler = profiler or StageProfiler()
+    name = profile['name']
+    started = time.time()
+    report = {
+        'name': name,
+        'titles': profile['titles'],
+        'locations': profile['locations'],
+        'searches': [],
+        'errors': [],
+    }
+
+    print("\n" + "="*80)
+    print(f"Profile: {name}")
+    print("="*80)
+
+    try:
+        with profiler.stage("search"):
+            profile_jobs = scraper.search_jobs(profile['titles'], profile['locations'],
+                                               max_results=profile['max_results'],
+                                               filters=profile['filters'])
+    except Exception as e:
+        print(f"Error searching jobs for profile '{name}': {e}")
+        report['errors'].append(f"search: {e}")
+        profile_jobs = []
+    report['searches'] = list(scraper.search_stats)
+    report['errors'].extend(f"search '{s['title']}' in '{s['location']}': {s['error']}"
+                            for s in scraper.search_stats if s.get('error'))
+
+    report['jobs_scraped'] = len(profile_jobs)
+    if not profile_jobs:
+        print(f"No jobs found for profile '{name}'")
+        report['seconds'] = round(time.time() - started, 2)
+        return report
+
+    # Best-fit jobs first, so max_llm_jobs covers the most relevant postings
+    with profiler.stage("rank"):
+        profile_jobs = rank_jobs(profile_jobs, profile['entire_cv'], profile['titles'])
+
+    needs_llm = profile['generate_cover_letters'] or profile['customize_cv']
+    if profile['fetch_details'] and needs_llm:
+        with profiler.stage("job_details"):
+            report['details'] = fetch_job_details(profile_jobs[:profile['max_llm_jobs']])
+
+    with profiler.stage("near_duplicates"):
+        clusters = group_jobs_for_generation(profile_jobs, max_jobs=profile['max_llm_jobs'])
+    duplicates = sum(len(c) - 1 for c in clusters)
+    report['near_duplicates'] = duplicates
+    report['llm_calls_saved'] = 0
+
+    cover_letters_dict = {}
+    if profile['generate_cover_letters']:
+        with profiler.stage("cover_letters"):
+            cover_letters_dict = generate_cover_letters_for_jobs(
+                llm_helper, profile_jobs, profile['base_cover_letter'], profile['additional_context'],
+                clusters=clusters
+            )
+        report['llm_calls_saved'] += duplicates
+    report['cover_letters'] = len(cover_letters_dict)
+
+    if profile['customize_cv'] and profile['entire_cv']:
+        with profiler.stage("cv_sections"):
+            customize_cv_for_jobs(llm_helper, profile_jobs, parse_cv(profile['entire_cv']).summary,
+                                  profile['entire_cv'], clusters=clusters)
+        report['llm_calls_saved'] += duplicates
+
+    scraper.jobs = profile_jobs
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    safe_name = name.replace(' ', '_').replace('/', '_')
+    if profile['xlsx_per_run']:
+        with profiler.stage("export_xlsx"):
+            report['xlsx'] = scraper.export_to_xlsx(
+                filename=f"jobs_{safe_name}_{timestamp}.xlsx",
+                max_results=len(profile_jobs),
+                cover_letters=cover_letters_dict,
+            )
+    if profile['tracker_file']:
+        with profiler.stage("export_tracker"):
+            report['tracker'] = dict(scraper.export_to_tracker(profile['tracker_file'],
+                                                               cover_letters=cover_letters_dict),
+                                     path=profile['tracker_file'])
+    report['seconds'] = round(time.time() - started, 2)
+    return report
+
+
+def save_report(report):
+    """Write the run report as JSON and return its path"""
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = os.path.join(REPORTS_DIR, f"batch_{timestamp}.json")
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Run report saved to {filepath}")
+    return filepath
+
+
+def build_llm_helper(spec):
+    """
+    Create the shared LLMHelper from the spec's optional `llm` section
+
+    The section selects a backend and passes the remaining keys to it, e.g.
+    {backend: mock, latency: 0.3, tokens_per_second: 120} for an offline run or
+    {backend: openai, base_url: http://127.0.0.1:8000/v1} for a local server.
+    `model` forces one model for every operation and `routes` overrides
+    MODEL_ROUTES (operation -> [preferred model, fallbacks...]).
+
+    Generated artifacts go through one background ArtifactWriter using the
+    spec's `artifact_format` (files, jsonl or zip).
+
+    Args:
+        spec (dict): Batch spec
+
+    Returns:
+        LLMHelper: Helper for all profiles
+    """
+    writer = ArtifactWriter(spec.get('artifact_format', ARTIFACT_FORMAT))
+    options = dict(spec.get('llm') or {})
+    name = options.pop('backend', None)
+    model = options.pop('model', None)
+    routes = options.pop('routes', None)
+    api_key = spec.get('groq_api_key') or os.getenv("GROQ_API_KEY")
+    if name in (None, 'groq'):
+        return LLMHelper(api_key=api_key, base_url=options.get('base_url'), model=model, routes=routes, backend=name,
+                         artifact_writer=writer)
+    if name == 'replay' and options.get('record_with') == 'groq':
+        options.setdefault('api_key', api_key)
+    return LLMHelper(backend=create_backend(name, **options), model=model, routes=routes, artifact_writer=writer)
+
+
+def run_batch(spec_path, headless=None, profiling=False):
+    """
+    Run every profile in a spec with one shared browser and LLM client
+
+    Args:
+        spec_path (str): Path to the YAML/TOML spec
+        headless (bool): Override the spec's headless setting
+        profiling (bool): Profile each pipeline stage (see profiling.StageProfiler)
+
+    Returns:
+        dict: Run report
+    """
+    ensure_output_dirs()
+    spec = load_spec(spec_path)
+    profiles = build_profiles(spec, os.path.dirname(os.path.abspath(spec_path)))
+
+    if headless is None:
+        headless = spec.get('headless', True)
+    credentials = spec.get('linkedin', {})
+    needs_llm = any(p['generate_cover_letters'] or p['customize_cv'] for p in profiles)
+
+    report = {
+        'spec': os.path.abspath(spec_path),
+        'started_at': datetime.now().isoformat(),
+        'profiles': [],
+    }
+    started = time.time()
+
+    scraper = LinkedInJobScraper(headless=headless, lean=spec.get('lean_browser', LEAN_BROWSER),
+                                 search_mode=spec.get('search_mode', SEARCH_MODE),
+                                 engine=spec.get('search_engine', SEARCH_ENGINE))
+    llm_helper = build_llm_helper(spec) if needs_llm else None
+    profiler = StageProfiler(enabled=profiling)
+
+    try:
+        with profiler.stage("session"):
+            scraper.open_session(credentials.get('email'), credentials.get('password'))
+
+        for profile in profiles:
+            try:
+                report['profiles'].append(run_profile(scraper, llm_helper, profile, profiler))
+            except Exception as e:
+                print(f"Error running profile '{profile['name']}': {e}")
+                report['profiles'].append({'name': profile['name'], 'errors': [str(e)]})
+    finally:
+        scraper.close()
+        report['finished_at'] = datetime.now().isoformat()
+        report['seconds'] = round(time.time() - started, 2)
+        report['jobs_scraped'] = sum(p.get('jobs_scraped', 0) for p in report['profiles'])
+        if llm_helper:
+            with profiler.stage("artifacts"):
+                llm_helper.artifact_writer.close()
+            report['artifacts'] = dict(llm_helper.artifact_writer.stats,
+                                       paths=sorted(llm_helper.artifact_writer.paths))
+            report['llm_prompts'] = dict(llm_helper.prompt_stats)
+            report['llm_models'] = llm_helper.model_stats
+            report['llm_outputs'] = llm_helper.output_summary()
+            report['llm_rate_control'] = dict(llm_helper.rate_controller.stats,
+                                              final_limit=round(llm_helper.rate_controller.limit, 2))
+        if profiler.enabled:
+            report['stage_profiles'] = {'dir': profiler.run_dir, 'stages': {
+                name: {k: round(v, 3) for k, v in s.items() if k in ('calls', 'seconds', 'peak_mb')}
+                for name, s in profiler.stages.items()}}
+        save_report(report)
+        profiler.print_summary()
+
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the LinkedIn job pipeline from a YAML/TOML spec")
+    parser.add_argument('spec', help="Path to the batch job spec (.yaml, .yml or .toml)")
+    parser.add_argument('--headless', dest='headless', action='store_true', default=None,
+                        help="Force headless Chrome")
+    parser.add_argument('--no-headless', dest='headless', action='store_false',
+                        help="Force a visible Chrome window")
+    parser.add_argument('--profile', action='store_true',
+                        help="Profile each stage (cProfile + tracemalloc); also JOBBOT_PROFILE=1")
+    args = parser.parse_args(argv)
+
+    report = run_batch(args.spec, headless=args.headless,
+                       profiling=args.profile or profiling_requested([]))
+    failed = [p['name'] for p in report['profiles'] if p.get('errors')]
+    if failed:
+        print(f"Profiles with errors: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
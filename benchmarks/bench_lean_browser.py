@@ -0,0 +1,222 @@
+"""
+Benchmark: page load time and bytes per page with and without lean browsing
+
+Serves generated fixture job search pages from a local server. Each page has
+25 job cards with company logos, web fonts, a promo video and analytics
+beacons, all generated at runtime with a per-request latency. The pages are
+loaded in headless Chrome through LinkedInJobScraper with lean=False and
+lean=True. The benchmark reports load time (navigationStart to loadEventEnd)
+and the bytes and requests the server saw per page.
+
+Without Chrome (or with --estimate), an HTTP client fetches each page and its
+referenced resources, skipping those lean mode would block. That gives an
+estimate of the transfer savings only.
+
+Usage:
+    python benchmarks/bench_lean_browser.py --pages 5
+    python benchmarks/bench_lean_browser.py --estimate
+"""
+import os
+import re
+import sys
+import time
+import fnmatch
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin, urlparse, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linkedin_scraper import LinkedInJobScraper, BLOCKED_URL_PATTERNS
+
+CARDS_PER_PAGE = 25
+
+# Path prefix -> (content type, size in bytes, category)
+ASSETS = {
+    '/static/app.css': ('text/css', 40_000, 'css'),
+    '/static/app.js': ('application/javascript', 120_000, 'script'),
+    '/static/font-': ('font/woff2', 60_000, 'font'),
+    '/media/logo-': ('image/png', 9_000, 'image'),
+    '/media/hero.jpg': ('image/jpeg', 250_000, 'image'),
+    '/media/promo.mp4': ('video/mp4', 600_000, 'media'),
+    '/analytics/': ('application/javascript', 30_000, 'tracker'),
+    '/li/track': ('image/gif', 43, 'tracker'),
+}
+
+
+def fixture_page(page, total_pages=None):
+    cards = []
+    for i in range(CARDS_PER_PAGE if total_pages is None or page < total_pages else 0):
+        job_id = 3900000000 + page * CARDS_PER_PAGE + i
+        cards.append(f"""
+  <li><div class="base-card" data-entity-urn="urn:li:jobPosting:{job_id}">
+    <img class="artdeco-entity-image" src="/media/logo-{page}-{i}.png" alt="">
+    <h3 class="base-search-card__title">Backend Engineer {i}</h3>
+    <h4 class="base-search-card__subtitle">Company {i}</h4>
+    <span class="job-search-card__location">Remote</span>
+    <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{job_id}/">View</a>
+    <img src="/li/track?event=impression&job={job_id}" width="1" height="1" alt="">
+  </div></li>""")
+    return f"""<!DOCTYPE html>
+<html><head>
+<meta charset="utf-8"><title>Jobs page {page}</title>
+<link rel="stylesheet" href="/static/app.css">
+<link rel="preload" as="font" type="font/woff2" href="/static/font-regular.woff2" crossorigin>
+<link rel="preload" as="font" type="font/woff2" href="/static/font-bold.woff2" crossorigin>
+<style>@font-face {{ font-family: Sans; src: url(/static/font-regular.woff2) format('woff2'); }}
+body {{ font-family: Sans, sans-serif; }}</style>
+<script src="/static/app.js"></script>
+<script async src="/analytics/beacon.js"></script>
+</head><body>
+<img class="hero" src="/media/hero.jpg" alt="">
+<video src="/media/promo.mp4" preload="auto" muted></video>
+<ul class="jobs-search__results-list">{''.join(cards)}
+</ul>
+<button aria-label="See more jobs">See more jobs</button>
+</body></html>"""
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.02, total_pages=None):
+        super().__init__(address, _Handler)
+        self.latency = latency
+        self.total_pages = total_pages
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.bytes = {}
+            self.requests = {}
+
+    def record(self, category, size):
+        with self.lock:
+            self.bytes[category] = self.bytes.get(category, 0) + size
+            self.requests[category] = self.requests.get(category, 0) + 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        time.sleep(self.server.latency)
+        if re.match(r"^/jobs(-guest/jobs/api/seeMoreJobPostings)?/search/?$", path):
+            # ?page=N, or a search URL's ?start=offset
+            query = parse_qs(urlparse(self.path).query)
+            page = int(query.get('page', [int(query.get('start', ['0'])[0]) // CARDS_PER_PAGE])[0])
+            body = fixture_page(page, self.server.total_pages).encode('utf-8')
+            content_type, category = 'text/html; charset=utf-8', 'document'
+        else:
+            asset = next((v for prefix, v in ASSETS.items() if path.startswith(prefix)), None)
+            if asset is None:
+                self.send_error(404)
+                return
+            content_type, size, category = asset
+            body = b" " * size
+        self.server.record(category, len(body))
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'max-age=3600')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def blocked(url, lean):
+    return lean and any(fnmatch.fnmatch(url, pattern) for pattern in BLOCKED_URL_PATTERNS)
+
+
+def run_browser(base_url, pages, lean, server):
+    scraper = LinkedInJobScraper(headless=True, cookies_file=None, profile_dir=None, lean=lean)
+    scraper.start_driver()
+    results = []
+    try:
+        for page in range(pages):
+            server.reset()
+            scraper.driver.get(f"{base_url}/jobs/search?page={page}")
+            load_ms = 0
+            for _ in range(100):
+                load_ms = scraper.driver.execute_script(
+                    "var t = performance.timing; return t.loadEventEnd ? t.loadEventEnd - t.navigationStart : 0;")
+                if load_ms:
+                    break
+                time.sleep(0.05)
+            results.append((load_ms / 1000.0, dict(server.bytes), dict(server.requests)))
+    finally:
+        scraper.close()
+    return results
+
+
+def run_estimate(base_url, pages, lean, server):
+    """HTTP-only approximation: page plus its referenced resources, 6 at a time"""
+    import requests
+    session = requests.Session()
+    results = []
+    for page in range(pages):
+        server.reset()
+        started = time.perf_counter()
+        url = f"{base_url}/jobs/search?page={page}"
+        html = session.get(url).text
+        refs = set(re.findall(r'(?:src|href)="([^"]+)"', html) + re.findall(r"url\(([^)]+)\)", html))
+        refs = [urljoin(url, ref) for ref in refs if not ref.startswith("https://www.linkedin.com/")]
+        refs = [ref for ref in refs if not blocked(ref, lean)]
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(lambda ref: session.get(ref).content, refs))
+        results.append((time.perf_counter() - started, dict(server.bytes), dict(server.requests)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pages', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0.02, help="Server latency per request in seconds")
+    parser.add_argument('--estimate', action='store_true', help="Use the HTTP estimate instead of Chrome")
+    args = parser.parse_args()
+
+    server = FixtureServer(('127.0.0.1', 0), latency=args.latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    runner = run_estimate if args.estimate else run_browser
+    if not args.estimate:
+        try:
+            from selenium import webdriver
+            probe = webdriver.ChromeOptions()
+            probe.add_argument('--headless')
+            webdriver.Chrome(options=probe).quit()
+        except Exception as e:
+            print(f"Chrome is not available ({str(e).splitlines()[0]}); using the HTTP estimate instead\n")
+            runner = run_estimate
+    mode = "HTTP estimate (no browser)" if runner is run_estimate else "headless Chrome"
+
+    print(f"{args.pages} pages, {mode}")
+    print(f"{'mode':<6} {'load s/page':>12} {'KB/page':>9} {'requests/page':>14}  KB by type")
+    summary = {}
+    for lean in (False, True):
+        results = runner(base_url, args.pages, lean, server)
+        load = sum(r[0] for r in results) / len(results)
+        kb = sum(sum(r[1].values()) for r in results) / len(results) / 1024
+        requests_per_page = sum(sum(r[2].values()) for r in results) / len(results)
+        by_type = {}
+        for _, sizes, _ in results:
+            for category, size in sizes.items():
+                by_type[category] = by_type.get(category, 0) + size / len(results) / 1024
+        name = "lean" if lean else "full"
+        summary[name] = (load, kb)
+        print(f"{name:<6} {load:>12.3f} {kb:>9.0f} {requests_per_page:>14.1f}  "
+              + ", ".join(f"{c} {v:.0f}" for c, v in sorted(by_type.items())))
+    server.shutdown()
+
+    full, lean = summary['full'], summary['lean']
+    print(f"\nLean mode: {100 * (1 - lean[1] / full[1]):.0f}% fewer bytes, "
+          f"{100 * (1 - lean[0] / full[0]):.0f}% faster loads per page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark: result page parsing throughput by worker process count
+
+Parses saved fixture result pages (LinkedIn guest search markup, 25 cards per
+page) with parse_pool.ParsePool at 1, 2, 4, ... worker processes and several
+chunk sizes, and reports pages and cards per second and the speedup over
+inline parsing. The fixture pages are generated once into
+output/cache/bench_fixtures/ and reused by later runs. It also compares the
+pickled size of the compact tuples with the equivalent job dictionaries.
+
+Usage:
+    python benchmarks/bench_parse_pool.py --pages 400
+    python benchmarks/bench_parse_pool.py --workers 1 2 4 8 --chunk-sizes 1 4 16
+"""
+import os
+import sys
+import time
+import random
+import pickle
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import CACHE_DIR
+from parse_pool import ParsePool, COMPACT_FIELDS, filter_spec
+
+FIXTURES_DIR = os.path.join(CACHE_DIR, "bench_fixtures")
+CARDS_PER_PAGE = 25
+TITLES = ["Software Engineer", "Senior Backend Developer", "Data Analyst", "Software Engineer Intern",
+          "Cloud Engineer", "Product Manager", "DevOps Engineer", "Data Engineer II", "Sales Associate"]
+
+
+def fixture_page(page, rng):
+    cards = []
+    for i in range(CARDS_PER_PAGE):
+        job_id = 3900000000 + page * CARDS_PER_PAGE + i
+        title = rng.choice(TITLES)
+        company = f"Company {rng.randint(1, 5000)}"
+        cards.append(f"""<li>
+  <div class="base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card base-search-card--link job-search-card" data-entity-urn="urn:li:jobPosting:{job_id}" data-impression-id="jobs-search-result-{i}" data-reference-id="{rng.getrandbits(64):x}" data-tracking-id="{rng.getrandbits(64):x}" data-column="1" data-row="{i + 1}">
+    <a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="https://www.linkedin.com/jobs/view/{title.lower().replace(' ', '-')}-at-company-{job_id}?position={i + 1}&amp;pageNum={page}&amp;refId={rng.getrandbits(32):x}&amp;trackingId={rng.getrandbits(32):x}" data-tracking-control-name="public_jobs_jserp-result_search-card" data-tracking-will-navigate>
+      <span class="sr-only">{title}</span>
+    </a>
+    <div class="search-entity-media">
+      <img class="artdeco-entity-image artdeco-entity-image--square-4 lazy-loaded" data-delayed-url="https://media.licdn.com/dms/image/{rng.getrandbits(48):x}/company-logo_100_100/0/{job_id}" alt="{company}">
+    </div>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">
+            {title}
+      </h3>
+      <h4 class="base-search-card__subtitle">
+          <a class="hidden-nested-link" data-tracking-control-name="public_jobs_jserp-result_job-search-card-subtitle" href="https://www.linkedin.com/company/company-{rng.randint(1, 5000)}?trk=public_jobs_jserp-result_job-search-card-subtitle">
+            {company}
+          </a>
+      </h4>
+      <div class="base-search-card__metadata">
+          <span class="job-search-card__location">
+            {rng.choice(["Remote", "New York, NY", "Austin, TX", "Seattle, WA", "United States"])}
+          </span>
+          <div class="job-posting-benefits text-sm">
+            <icon class="job-posting-benefits__icon" data-svg-class-name="job-posting-benefits__icon-svg" data-delayed-url="https://static.licdn.com/aero-v1/sc/h/{rng.getrandbits(40):x}"></icon>
+            <span class="job-posting-benefits__text">Actively Hiring</span>
+          </div>
+          <time class="job-search-card__listdate--new" datetime="2026-10-{rng.randint(1, 19):02d}">
+            {rng.randint(1, 59)} minutes ago
+          </time>
+      </div>
+    </div>
+  </div>
+</li>""")
+    return ("<!DOCTYPE html><html><head><meta charset='utf-8'></head><body><ul class='jobs-search__results-list'>"
+            + "\n".join(cards) + "</ul></body></html>").encode('utf-8')
+
+
+def load_fixtures(count):
+    """Fixture pages from disk, generating any that are missing"""
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    rng = random.Random(7)
+    pages = []
+    for page in range(count):
+        path = os.path.join(FIXTURES_DIR, f"search_page_{page:04d}.html")
+        if not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(fixture_page(page, rng))
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        help="Worker counts (default: 1, 2, 4, ... up to the CPU count)")
+    parser.add_argument('--chunk-sizes', type=int, nargs='+', default=[1, 4, 16])
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    workers_list = args.workers or sorted({1, *[2 ** i for i in range(1, 8) if 2 ** i <= cpus], cpus})
+    pages = load_fixtures(args.pages)
+    spec = filter_spec()
+    print(f"{len(pages)} fixture pages ({sum(map(len, pages)) / len(pages) / 1024:.0f} KB each), {cpus} CPU(s)")
+
+    baseline = None
+    print(f"\n{'workers':>7} {'chunk':>5} {'seconds':>8} {'pages/s':>8} {'cards/s':>8} {'speedup':>8}")
+    for workers in workers_list:
+        for chunk_size in (args.chunk_sizes if workers > 1 else [len(pages)]):
+            with ParsePool(workers=workers, chunk_size=chunk_size, min_pages=1) as pool:
+                if workers > 1:
+                    pool.parse_pages(pages[:workers], spec)  # start the worker processes
+                started = time.perf_counter()
+                results = pool.parse_pages(pages, spec)
+                elapsed = time.perf_counter() - started
+            cards = sum(len(page) for page in results)
+            if baseline is None:
+                baseline = elapsed
+            chunk_text = str(chunk_size) if workers > 1 else "-"
+            print(f"{workers:>7} {chunk_text:>5} {elapsed:>8.2f} {len(pages) / elapsed:>8.0f} "
+                  f"{cards / elapsed:>8.0f} {baseline / elapsed:>7.2f}x")
+
+    compact = pickle.dumps(results[0])
+    as_dicts = pickle.dumps([dict(zip(COMPACT_FIELDS, card)) for card in results[0]])
+    print(f"\nPickled result per page: {len(compact)} bytes as tuples, {len(as_dicts)} bytes as dicts; "
+          f"raw page {len(pages[0])} bytes")
+    if cpus == 1:
+        print("Only one CPU is available, so worker processes cannot run in parallel here")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Benchmark: end-to-end post-scrape pipeline throughput, offline
+
+Runs the main.py stages after scraping (ranking, near-duplicate grouping,
+cover letter generation, CV customization) on saved or synthetic jobs with an
+offline LLM backend: the deterministic mock with simulated latency and token
+rate, or completions replayed from a cassette. Generated files go to a
+temporary directory.
+
+Usage:
+    python benchmarks/bench_pipeline.py --jobs 50 --latency 0.3 --tps 150
+    python benchmarks/bench_pipeline.py --model-profile llama-3.1-8b-instant=0.1:600
+    python benchmarks/bench_pipeline.py --jobs-file output/jobs/jobs_20250101_120000.json
+    python benchmarks/bench_pipeline.py --backend replay --cassette output/cache/llm_cassette.jsonl
+"""
+import os
+import io
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_helper import LLMHelper
+from artifact_writer import ArtifactWriter
+from llm_backends import create_backend
+from rate_control import AdaptiveConcurrencyController
+from job_ranking import rank_jobs
+from main import group_jobs_for_generation, generate_cover_letters_for_jobs, customize_cv_for_jobs
+
+CV = """Jane Doe
+jane@example.com
+
+Summary
+Backend engineer with eight years of experience building Python and Go services, data pipelines and APIs.
+
+Experience
+Acme Corp | Senior Backend Engineer | 2020 - Present
+- Built Kafka and PostgreSQL event pipelines processing 2M events per day
+- Led migration of a monolith to Kubernetes services
+
+Globex | Software Engineer | 2016 - 2020
+- Developed Django REST APIs and React dashboards
+
+Skills
+Python, Go, Kafka, PostgreSQL, Kubernetes, AWS, Django, React
+"""
+
+TEMPLATE = ("Dear Hiring Manager,\n\nI am a backend engineer with eight years of experience building "
+            "Python services and data pipelines.\n\nSincerely,\nJane Doe")
+
+TITLES = ["Backend Engineer", "Python Developer", "Data Engineer", "Platform Engineer", "Frontend Developer"]
+STACKS = ["Python, Kafka and PostgreSQL", "Go and Kubernetes", "Django and React", "AWS, Spark and Airflow",
+          "TypeScript and React"]
+DUTIES = ["own features end to end", "design public APIs", "mentor junior engineers", "run on-call rotations",
+          "improve observability", "scale our data platform", "partner with product managers",
+          "migrate legacy services", "optimize query performance", "build internal tooling",
+          "shape the technical roadmap", "review architecture proposals"]
+DOMAINS = ["fintech", "healthcare", "logistics", "e-commerce", "gaming", "climate", "education", "security"]
+
+# Full descriptions (as fetched by job_details.py) carry benefits and EEO text
+# that prompt compression removes
+DESCRIPTION = """About the role
+We are a {domain} startup. {snippet}
+Requirements
+{years}+ years of experience building services with {stack}.
+Experience with {duty} in production.
+Nice to have
+Familiarity with {other_stack}.
+Benefits
+Competitive salary and equity.
+Medical, dental and vision insurance.
+401(k) with company match and unlimited paid time off.
+We are an equal opportunity employer. All qualified applicants will receive consideration for employment \
+without regard to race, color, religion, sex, sexual orientation, gender identity, national origin, disability \
+or veteran status."""
+
+
+def synthetic_jobs(n, seed=7):
+    """n varied jobs with a few reposts of the same posting, like real search results"""
+    rng = random.Random(seed)
+    postings = []
+    for i in range(n):
+        if i % 7 == 6:
+            # Repost of the previous posting under a new job ID
+            postings.append(dict(postings[-1]))
+            continue
+        duties = rng.sample(DUTIES, 3)
+        domain, stack, other_stack = rng.choice(DOMAINS), rng.choice(STACKS), rng.choice(STACKS)
+        snippet = (f"Join our {domain} startup to build services with {stack}. You will {duties[0]}, "
+                   f"{duties[1]} and {duties[2]} in a team of {rng.randint(3, 12)} engineers.")
+        postings.append({
+            'title': rng.choice(TITLES),
+            'company': f"Company {i}",
+            'description_snippet': snippet,
+            'description': DESCRIPTION.format(domain=domain, snippet=snippet, years=rng.randint(2, 6),
+                                              stack=stack, duty=duties[0], other_stack=other_stack),
+        })
+    jobs = []
+    for i, posting in enumerate(postings):
+        job_id = str(3900000000 + i)
+        jobs.append(dict(posting, job_id=job_id, location="Remote",
+                         link=f"https://www.linkedin.com/jobs/view/{job_id}/"))
+    return jobs
+
+
+def load_jobs(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _stage(timings, name, fn, quiet):
+    started = time.perf_counter()
+    if quiet:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = fn()
+    else:
+        result = fn()
+    timings.append((name, time.perf_counter() - started))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--jobs', type=int, default=50, help="Number of synthetic jobs")
+    parser.add_argument('--jobs-file', help="Jobs JSON saved by LinkedInJobScraper.save_jobs_json")
+    parser.add_argument('--max-llm-jobs', type=int, default=50)
+    parser.add_argument('--backend', choices=['mock', 'replay'], default='mock')
+    parser.add_argument('--cassette', default=os.path.join("output", "cache", "llm_cassette.jsonl"))
+    parser.add_argument('--latency', type=float, default=0.3, help="Mock latency per call in seconds")
+    parser.add_argument('--tps', type=float, default=150.0, help="Mock output tokens per second")
+    parser.add_argument('--output-tokens', type=int, default=350, help="Mock tokens per completion")
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help="Mock probability of a 429")
+    parser.add_argument('--model-profile', action='append', default=[], metavar="MODEL=LATENCY:TPS",
+                        help="Mock latency and tokens/s for one model (repeatable)")
+    parser.add_argument('--max-limit', type=int, default=16, help="Maximum LLM concurrency")
+    parser.add_argument('--artifacts', choices=['files', 'jsonl', 'zip'], default='files',
+                        help="Artifact storage format")
+    parser.add_argument('--no-cv', action='store_true', help="Skip the CV customization stage")
+    parser.add_argument('--verbose', action='store_true', help="Show pipeline output")
+    args = parser.parse_args()
+
+    if args.backend == 'mock':
+        profiles = {}
+        for value in args.model_profile:
+            model, speed = value.rsplit('=', 1)
+            latency, tps = speed.split(':')
+            profiles[model] = {'latency': float(latency), 'tokens_per_second': float(tps)}
+        backend = create_backend('mock', latency=args.latency, tokens_per_second=args.tps,
+                                 output_tokens=args.output_tokens, rate_limit_rate=args.rate_limit_rate,
+                                 model_profiles=profiles)
+    else:
+        backend = create_backend('replay', cassette=args.cassette, simulate_latency=True)
+    controller = AdaptiveConcurrencyController(max_limit=args.max_limit, base_backoff=0.2)
+    helper = LLMHelper(backend=backend, rate_controller=controller)
+
+    jobs = load_jobs(args.jobs_file) if args.jobs_file else synthetic_jobs(args.jobs)
+    quiet = not args.verbose
+    timings = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = ArtifactWriter(args.artifacts, directories={'cover_letter': tmp, 'cv_section': tmp})
+        helper.artifact_writer = writer
+        started = time.perf_counter()
+        jobs = _stage(timings, "rank", lambda: rank_jobs(jobs, CV, TITLES[:2]), quiet)
+        clusters = _stage(timings, "group", lambda: group_jobs_for_generation(jobs, args.max_llm_jobs), quiet)
+        letters = _stage(timings, "cover letters", lambda: generate_cover_letters_for_jobs(
+            helper, jobs, TEMPLATE, clusters=clusters), quiet)
+        if not args.no_cv:
+            _stage(timings, "cv sections", lambda: customize_cv_for_jobs(
+                helper, jobs, None, CV, clusters=clusters), quiet)
+        _stage(timings, "write artifacts", writer.close, quiet)
+        total = time.perf_counter() - started
+
+    processed = min(len(jobs), args.max_llm_jobs)
+    print(f"{len(jobs)} jobs, {processed} sent to the LLM in {len(clusters)} clusters, "
+          f"{len(letters)} cover letters, backend '{backend.name}'")
+    for name, seconds in timings:
+        print(f"  {name:<16} {seconds:>8.2f}s")
+    print(f"  {'total':<16} {total:>8.2f}s  ({processed / total:.2f} jobs/s)")
+    print(f"  rate control: {controller.summary()}")
+    print(f"  artifacts: {writer.summary()}")
+    helper.print_prompt_stats()
+    helper.print_model_stats()
+    helper.print_output_stats()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark: adaptive LLM concurrency vs. the old fixed-sleep loop against a fake server
+
+Starts benchmarks/fake_llm_server.py in-process with a concurrency capacity,
+optional quota window and injected 503s, then generates cover letters for N
+fake jobs through LLMHelper. Reports throughput, 429s seen, retries and the
+concurrency limit the controller converged on.
+
+Usage:
+    python benchmarks/bench_rate_control.py --jobs 40 --capacity 6 --error-rate 0.05
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_llm_server import start_server
+from llm_helper import LLMHelper
+from rate_control import AdaptiveConcurrencyController
+from main import _run_clusters
+
+TEMPLATE = "Dear Hiring Manager,\n\nI build reliable backend services in Python.\n\nSincerely,\nCandidate"
+
+
+def _jobs(n):
+    return [{'job_id': str(3900000000 + i), 'title': f"Backend Engineer {i}", 'company': f"Company {i}",
+             'description_snippet': "Python, Kafka and PostgreSQL services."} for i in range(n)]
+
+
+def run_adaptive(base_url, jobs, max_limit):
+    controller = AdaptiveConcurrencyController(max_limit=max_limit, base_backoff=0.2)
+    helper = LLMHelper(api_key="fake", base_url=base_url, rate_controller=controller)
+    started = time.time()
+    failures = _run_clusters(helper, [[job] for job in jobs],
+                             lambda i, cluster: helper.adapt_cover_letter(cluster[0], TEMPLATE))
+    return time.time() - started, failures, controller
+
+
+def run_fixed_sleep(base_url, jobs):
+    """The pre-controller behaviour: one call at a time with a 1s sleep after each"""
+    controller = AdaptiveConcurrencyController(initial_limit=1, max_limit=1, base_backoff=0.2)
+    helper = LLMHelper(api_key="fake", base_url=base_url, rate_controller=controller)
+    started = time.time()
+    failures = 0
+    for job in jobs:
+        try:
+            helper.adapt_cover_letter(job, TEMPLATE)
+        except Exception:
+            failures += 1
+        time.sleep(1)
+    return time.time() - started, failures, controller
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--jobs', type=int, default=40)
+    parser.add_argument('--capacity', type=int, default=6, help="Server concurrency before 429")
+    parser.add_argument('--rpw', type=int, default=0, help="Server requests per window (0 = unlimited)")
+    parser.add_argument('--window', type=float, default=5.0)
+    parser.add_argument('--latency', type=float, default=0.5)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--max-limit', type=int, default=16)
+    parser.add_argument('--skip-fixed', action='store_true', help="Skip the fixed-sleep baseline")
+    args = parser.parse_args()
+
+    runs = [('adaptive', lambda url, jobs: run_adaptive(url, jobs, args.max_limit))]
+    if not args.skip_fixed:
+        runs.append(('fixed 1s sleep', run_fixed_sleep))
+
+    print(f"{'mode':<16} {'secs':>7} {'jobs/s':>7} {'fail':>5} {'429s':>5} {'retries':>8} {'limit':>6} {'peak':>5}")
+    for name, run in runs:
+        server = start_server(capacity=args.capacity, requests_per_window=args.rpw, window_seconds=args.window,
+                              latency=args.latency, error_rate=args.error_rate, retry_after=0.5)
+        base_url = f"http://127.0.0.1:{server.server_port}"
+        elapsed, failures, controller = run(base_url, _jobs(args.jobs))
+        server.shutdown()
+        stats = controller.stats
+        print(f"{name:<16} {elapsed:>7.1f} {args.jobs / elapsed:>7.2f} {failures:>5} "
+              f"{server.stats['rate_limited']:>5} {stats['retries']:>8} {controller.limit:>6.1f} "
+              f"{server.stats['peak_in_flight']:>5}")
+
+
+if __name__ == "__main__":
+    main()
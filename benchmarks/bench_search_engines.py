@@ -0,0 +1,106 @@
+"""
+Benchmark: CPU, memory and time per search, browserless HTTP engine vs Chrome
+
+Runs the same title/location searches against the generated fixture result
+pages of bench_lean_browser.py (25 cards per page, a fixed number of pages per
+search) with LinkedInJobScraper's 'http' and 'selenium' engines. Reports wall
+time, CPU seconds of this process plus its children (chromedriver and Chrome),
+peak RSS of this process and of its children, and the number of jobs found. The selenium run is
+skipped when Chrome is not available.
+
+Usage:
+    python benchmarks/bench_search_engines.py --searches 4 --pages 4
+"""
+import os
+import sys
+import time
+import argparse
+import resource
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import linkedin_scraper
+from linkedin_scraper import LinkedInJobScraper
+from http_search import HTTPJobSearch
+from bench_lean_browser import FixtureServer, CARDS_PER_PAGE
+
+
+def cpu_seconds():
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def run_engine(engine, base_url, searches, max_results):
+    scraper = LinkedInJobScraper(headless=True, cookies_file=None, profile_dir=None, engine=engine)
+    if engine == 'http':
+        scraper.http_search = HTTPJobSearch(base_url=f"{base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search",
+                                            delay=0)
+    else:
+        # Point the browser's result page URLs at the fixture server
+        linkedin_scraper.build_search_url = _fixture_url_builder(base_url)
+        scraper.start_driver()
+    titles = [f"Backend Engineer {i}" for i in range(searches)]
+    cpu_before = cpu_seconds()
+    started = time.perf_counter()
+    try:
+        jobs = scraper.search_jobs(titles, ["Remote"], max_results=max_results)
+    finally:
+        scraper.close()
+    wall = time.perf_counter() - started
+    cpu = cpu_seconds() - cpu_before
+    # ru_maxrss is a lifetime peak, so the http engine runs first
+    own_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    children_rss_mb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    found = sum(s['found'] for s in scraper.search_stats)
+    return wall, cpu, own_rss_mb, children_rss_mb, found
+
+
+def _fixture_url_builder(base_url):
+    from search_urls import build_search_url
+
+    def build(keywords, location=None, filters=None, start=0, **kwargs):
+        return build_search_url(keywords, location, filters, start, base_url=f"{base_url}/jobs/search")
+    return build
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--searches', type=int, default=4, help="Title searches per engine")
+    parser.add_argument('--pages', type=int, default=4, help="Result pages per search")
+    parser.add_argument('--latency', type=float, default=0.05, help="Server latency per request in seconds")
+    args = parser.parse_args()
+
+    server = FixtureServer(('127.0.0.1', 0), latency=args.latency, total_pages=args.pages)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    max_results = args.pages * CARDS_PER_PAGE
+
+    engines = ['http', 'selenium']
+    try:
+        from selenium import webdriver
+        probe = webdriver.ChromeOptions()
+        probe.add_argument('--headless')
+        webdriver.Chrome(options=probe).quit()
+    except Exception as e:
+        print(f"Chrome is not available ({str(e).splitlines()[0]}); running the http engine only\n")
+        engines = ['http']
+
+    print(f"{args.searches} searches x {args.pages} pages, {args.latency * 1000:.0f} ms server latency")
+    results = {}
+    for engine in engines:
+        results[engine] = run_engine(engine, base_url, args.searches, max_results)
+    server.shutdown()
+
+    print(f"\n{'engine':<9} {'wall s':>7} {'CPU s':>6} {'RSS MB':>7} {'child RSS MB':>13} {'found':>6}")
+    for engine, (wall, cpu, own_rss, children_rss, found) in results.items():
+        print(f"{engine:<9} {wall:>7.2f} {cpu:>6.2f} {own_rss:>7.0f} {children_rss:>13.0f} {found:>6}")
+    if len(results) == 2:
+        http, browser = results['http'], results['selenium']
+        print(f"\nHTTP engine: {browser[0] / http[0]:.1f}x faster, {browser[1] / max(http[1], 1e-3):.1f}x less CPU")
+
+
+if __name__ == "__main__":
+    main()
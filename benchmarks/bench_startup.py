@@ -0,0 +1,98 @@
+"""
+Benchmark: cold-start import time of each entry point, with budgets
+
+Imports every entry point in a fresh interpreter with `python -X importtime`,
+takes the best of several runs of the module's cumulative import time, and
+lists its slowest direct imports. Fails (exit code 1) when an entry point is
+over its time budget or loads a heavy dependency (Selenium, pandas, NumPy,
+Groq, ...) at import time instead of on the code path that needs it.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 10 --budget-scale 2
+"""
+import os
+import sys
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Entry point -> import time budget in milliseconds
+BUDGETS_MS = {
+    'main': 200,
+    'batch': 200,
+    'Scrapper': 100,
+    'linkedin_scraper': 100,
+    'llm_helper': 150,
+}
+
+# Must only be imported when the code path using them runs
+HEAVY_MODULES = ('selenium', 'pandas', 'numpy', 'scipy', 'groq', 'openpyxl', 'tiktoken', 'requests', 'bs4')
+
+
+def import_profile(module):
+    """
+    Import a module in a fresh interpreter under -X importtime
+
+    Returns:
+        tuple: (cumulative microseconds for the module, {imported module: cumulative us},
+            [(cumulative us, name) of its direct imports])
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((depth, name.strip(), int(cumulative_us)))
+
+    # importtime prints children before their parent; the module's own line is at depth 0
+    index = max(i for i, (depth, name, _) in enumerate(entries) if depth == 0 and name == module)
+    start = index
+    while start > 0 and entries[start - 1][0] > 0:
+        start -= 1
+    subtree = entries[start:index + 1]
+    modules = {name: us for _, name, us in subtree}
+    children = sorted(((us, name) for depth, name, us in subtree if depth == 1), reverse=True)
+    return entries[index][2], modules, children
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per entry point (best is kept)")
+    parser.add_argument('--budget-scale', type=float, default=1.0, help="Multiply all budgets (slow machines)")
+    parser.add_argument('--top', type=int, default=3, help="Slowest direct imports to show")
+    parser.add_argument('modules', nargs='*', help="Entry points to check (default: all)")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'entry point':<18} {'best ms':>8} {'budget':>7}  slowest imports")
+    for module in args.modules or BUDGETS_MS:
+        runs = [import_profile(module) for _ in range(args.repeat)]
+        best_us, modules, children = min(runs, key=lambda run: run[0])
+        budget = BUDGETS_MS.get(module, 200) * args.budget_scale
+        slowest = ", ".join(f"{name} {us / 1000:.0f}ms" for us, name in children[:args.top])
+        print(f"{module:<18} {best_us / 1000:>8.1f} {budget:>7.0f}  {slowest}")
+
+        if best_us / 1000 > budget:
+            failures.append(f"{module}: {best_us / 1000:.1f} ms is over the {budget:.0f} ms budget")
+        heavy = sorted({name.split('.')[0] for name in modules if name.split('.')[0] in HEAVY_MODULES})
+        if heavy:
+            failures.append(f"{module}: imports {', '.join(heavy)} at startup")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nAll entry points within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Local fake OpenAI/Groq-compatible chat completions server for offline testing
+
+Serves POST /openai/v1/chat/completions (Groq SDK path) and
+/v1/chat/completions (OpenAI-compatible path) with a canned completion after a
+simulated latency. It enforces a concurrency capacity and a requests-per-window
+quota and answers 429 with Retry-After and x-ratelimit-* headers when they are
+exceeded, and can inject random 503s.
+
+Usage:
+    python benchmarks/fake_llm_server.py --port 8089 --capacity 4 --latency 0.3
+    GROQ_BASE_URL=http://127.0.0.1:8089 python main.py
+"""
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+COMPLETION_TEXT = (
+    "Dear Hiring Manager,\n\n"
+    "I am excited to apply for this role. My experience building reliable backend services "
+    "matches the requirements you describe.\n\n"
+    "Thank you for your consideration.\n\nSincerely,\nCandidate"
+)
+
+
+class FakeLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, capacity=4, requests_per_window=0, window_seconds=10.0,
+                 latency=0.3, tokens_per_second=0.0, error_rate=0.0, retry_after=1.0):
+        """
+        Args:
+            address (tuple): (host, port) to bind
+            capacity (int): Concurrent requests served before answering 429
+            requests_per_window (int): Requests allowed per window (0 = unlimited)
+            window_seconds (float): Length of the quota window
+            latency (float): Base latency per request in seconds
+            tokens_per_second (float): If set, add output_tokens / tokens_per_second latency
+            error_rate (float): Probability of answering 503
+            retry_after (float): Retry-After seconds sent with concurrency 429s
+        """
+        super().__init__(address, _Handler)
+        self.capacity = capacity
+        self.requests_per_window = requests_per_window
+        self.window_seconds = window_seconds
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.window_start = time.monotonic()
+        self.window_count = 0
+        self.stats = {'requests': 0, 'ok': 0, 'rate_limited': 0, 'errors': 0, 'peak_in_flight': 0}
+
+    def admit(self):
+        """Return (status, headers) for a new request; status None means admitted"""
+        with self.lock:
+            self.stats['requests'] += 1
+            now = time.monotonic()
+            if now - self.window_start >= self.window_seconds:
+                self.window_start, self.window_count = now, 0
+            reset = self.window_seconds - (now - self.window_start)
+
+            if self.requests_per_window and self.window_count >= self.requests_per_window:
+                self.stats['rate_limited'] += 1
+                return 429, {'retry-after': f"{reset:.2f}", 'x-ratelimit-remaining-requests': '0',
+                             'x-ratelimit-reset-requests': f"{reset:.2f}s"}
+            if self.in_flight >= self.capacity:
+                self.stats['rate_limited'] += 1
+                return 429, {'retry-after': f"{self.retry_after:.2f}"}
+            if random.random() < self.error_rate:
+                self.stats['errors'] += 1
+                return 503, {}
+
+            self.window_count += 1
+            self.in_flight += 1
+            self.stats['peak_in_flight'] = max(self.stats['peak_in_flight'], self.in_flight)
+            headers = {}
+            if self.requests_per_window:
+                headers = {'x-ratelimit-limit-requests': str(self.requests_per_window),
+                           'x-ratelimit-remaining-requests': str(self.requests_per_window - self.window_count),
+                           'x-ratelimit-reset-requests': f"{reset:.2f}s"}
+            return None, headers
+
+    def finish(self, ok):
+        with self.lock:
+            self.in_flight -= 1
+            if ok:
+                self.stats['ok'] += 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self._send(404, {'error': {'message': 'not found'}})
+            return
+
+        server = self.server
+        status, headers = server.admit()
+        if status is not None:
+            self._send(status, {'error': {'message': 'Rate limit reached' if status == 429 else 'Overloaded',
+                                          'type': 'rate_limit_exceeded' if status == 429 else 'server_error'}},
+                       headers)
+            return
+
+        text = COMPLETION_TEXT
+        max_tokens = payload.get('max_tokens') or 2000
+        words = text.split(' ')
+        if len(words) > max_tokens:
+            text = ' '.join(words[:max_tokens])
+        output_tokens = len(text.split())
+        prompt_tokens = sum(len(str(m.get('content', '')).split()) for m in payload.get('messages', []))
+
+        delay = server.latency
+        if server.tokens_per_second:
+            delay += output_tokens / server.tokens_per_second
+        time.sleep(delay)
+        server.finish(ok=True)
+
+        self._send(200, {
+            'id': f"chatcmpl-fake-{random.getrandbits(32):08x}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': payload.get('model', 'fake-model'),
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text},
+                         'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': output_tokens,
+                      'total_tokens': prompt_tokens + output_tokens},
+        }, headers)
+
+
+def start_server(port=0, **options):
+    """
+    Start a FakeLLMServer on a background thread
+
+    Args:
+        port (int): Port to bind (0 picks a free port)
+        **options: FakeLLMServer options
+
+    Returns:
+        FakeLLMServer: Running server; its base URL is http://127.0.0.1:<server.server_port>
+    """
+    server = FakeLLMServer(('127.0.0.1', port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake OpenAI/Groq-compatible server that injects 429s")
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--capacity', type=int, default=4, help="Concurrent requests before 429")
+    parser.add_argument('--rpw', type=int, default=0, help="Requests per window before 429 (0 = unlimited)")
+    parser.add_argument('--window', type=float, default=10.0, help="Quota window in seconds")
+    parser.add_argument('--latency', type=float, default=0.3, help="Base latency per request in seconds")
+    parser.add_argument('--tps', type=float, default=0.0, help="Simulated output tokens per second")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Probability of a 503")
+    args = parser.parse_args()
+
+    server = FakeLLMServer(('127.0.0.1', args.port), capacity=args.capacity, requests_per_window=args.rpw,
+                           window_seconds=args.window, latency=args.latency, tokens_per_second=args.tps,
+                           error_rate=args.error_rate)
+    print(f"Fake LLM server listening on http://127.0.0.1:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nStats: {server.stats}")
@@ -6,13 +6,63 @@ load_dotenv()
 # Groq API Configuration - will be set by user input
 GROQ_API_KEY = None
 
+# LLM backend: groq (default), openai (OpenAI-compatible server at LLM_BASE_URL),
+# mock (offline, simulated latency) or replay (completions from LLM_CASSETTE)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "groq")
+LLM_BASE_URL = os.getenv("LLM_BASE_URL")
+LLM_CASSETTE = os.getenv("LLM_CASSETTE", os.path.join("output", "cache", "llm_cassette.jsonl"))
+
+# Models per LLM operation: the first is preferred, the others are fallbacks
+# used when it is rate limited or times out
+MODEL_ROUTES = {
+    'cover_letter': ["openai/gpt-oss-120b", "llama-3.3-70b-versatile"],
+    'cv_about_me': ["llama-3.1-8b-instant", "openai/gpt-oss-20b"],
+}
+
 # Output directories
 OUTPUT_DIR = "output"
 JOBS_DIR = os.path.join(OUTPUT_DIR, "jobs")
 COVER_LETTERS_DIR = os.path.join(OUTPUT_DIR, "cover_letters")
 CV_SECTIONS_DIR = os.path.join(OUTPUT_DIR, "cv_sections")
+CACHE_DIR = os.path.join(OUTPUT_DIR, "cache")
+DESCRIPTIONS_CACHE_DIR = os.path.join(CACHE_DIR, "descriptions")
+
+# Per-stage cProfile/tracemalloc output (--profile or JOBBOT_PROFILE=1)
+PROFILES_DIR = os.path.join(OUTPUT_DIR, "profiles")
+
+# Per-selector hit/miss counts; the scraper tries the best-hitting selector first
+SELECTOR_STATS_FILE = os.path.join(CACHE_DIR, "selector_stats.json")
+
+# Master tracker workbook, upserted by job ID every run (JOBBOT_TRACKER= to disable).
+# XLSX_PER_RUN=0 skips the timestamped per-run workbook.
+TRACKER_FILE = os.getenv("JOBBOT_TRACKER", os.path.join(OUTPUT_DIR, "job_tracker.xlsx"))
+XLSX_PER_RUN = os.getenv("XLSX_PER_RUN", "1") != "0"
+
+# Saved LinkedIn session, so routine runs can skip the login flow. Set
+# CHROME_PROFILE_DIR to keep a whole Chrome profile instead of just cookies.
+SESSION_DIR = os.path.join(CACHE_DIR, "session")
+COOKIES_FILE = os.path.join(SESSION_DIR, "linkedin_cookies.json")
+CHROME_PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR")
+
+# Block images, fonts, media and trackers in the scraping browser (LEAN_BROWSER=0 to disable)
+LEAN_BROWSER = os.getenv("LEAN_BROWSER", "1") != "0"
+
+# How job searches are run: url (load result pages by URL, paginate by offset)
+# or form (search form, infinite scroll and "See more jobs")
+SEARCH_MODE = os.getenv("SEARCH_MODE", "url")
+
+# Search engine: selenium (Chrome, logged in), or opt in to http (public guest
+# result pages over pooled HTTP, no browser) or auto (http, falling back to
+# Chrome when it is refused or returns no results)
+SEARCH_ENGINE = os.getenv("SEARCH_ENGINE", "selenium")
+
+# How generated cover letters/CV sections are stored: files (one per job),
+# jsonl or zip (one file per artifact kind and run)
+ARTIFACT_FORMAT = os.getenv("ARTIFACT_FORMAT", "files")
+
 
-# Create directories if they don't exist
-for directory in [OUTPUT_DIR, JOBS_DIR, COVER_LETTERS_DIR, CV_SECTIONS_DIR]:
-    os.makedirs(directory, exist_ok=True)
+def ensure_output_dirs():
+    """Create the output directories if they don't exist (called before writing)"""
+    for directory in [OUTPUT_DIR, JOBS_DIR, COVER_LETTERS_DIR, CV_SECTIONS_DIR]:
+        os.makedirs(directory, exist_ok=True)
 
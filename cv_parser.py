@@ -0,0 +1,240 @@
+"""
+CV section parser with a content-hash cache and per-job section selection
+
+The CV is split once into structured sections (summary, experience entries,
+skills, education, ...). For each job, only the sections most relevant to that
+job are put into the prompt, within a token budget, instead of cutting the raw
+CV text at a fixed character count.
+"""
+import re
+import hashlib
+from job_ranking import tokenize, bm25_scores
+from prompt_compression import count_tokens, fit_to_budget, CV_TOKEN_BUDGET
+
+# Canonical section name -> heading phrases
+SECTION_HEADINGS = {
+    'summary': ["about me", "about", "summary", "professional summary", "profile", "professional profile",
+                "overview", "objective", "career objective"],
+    'experience': ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "career history"],
+    'projects': ["projects", "personal projects", "selected projects", "key projects"],
+    'skills': ["skills", "technical skills", "core skills", "key skills", "competencies",
+               "core competencies", "technologies", "tech stack", "tools"],
+    'education': ["education", "academic background", "qualifications", "education and training"],
+    'certifications': ["certifications", "certificates", "licenses", "licenses and certifications"],
+    'awards': ["awards", "honors", "achievements", "awards and honors"],
+    'languages': ["languages"],
+    'publications': ["publications"],
+    'volunteering': ["volunteer", "volunteering", "volunteer experience"],
+    'interests': ["interests", "hobbies"],
+}
+_HEADING_LOOKUP = {phrase: name for name, phrases in SECTION_HEADINGS.items() for phrase in phrases}
+
+_DATE_RE = re.compile(r"\b(?:19|20)\d{2}\b|\bpresent\b|\bcurrent\b", re.I)
+_BULLET_RE = re.compile(r"^\s*(?:[-*•·▪◦]|\d+[.)])\s+")
+_CONTACT_RE = re.compile(r"@|\+?\d[\d\s().-]{7,}|linkedin\.com|github\.com|https?://", re.I)
+
+_CACHE = {}
+_CACHE_SIZE = 32
+
+
+class ParsedCV:
+    """Structured representation of a CV"""
+
+    def __init__(self, text):
+        self.text = text
+        self.preamble = ""
+        self.sections = {}        # canonical name -> raw section text, in CV order
+        self.headings = {}        # canonical name -> heading as written in the CV
+        self.experience = []      # one string per role
+        self.projects = []        # one string per project
+        self.skills = []          # individual skills
+        self.summary = ""
+
+    def section(self, name):
+        return self.sections.get(name, "")
+
+    def __repr__(self):
+        return (f"ParsedCV(sections={list(self.sections)}, experience={len(self.experience)}, "
+                f"skills={len(self.skills)})")
+
+
+def _heading_name(line):
+    """Canonical section name if the line is a section heading, else None"""
+    stripped = line.strip().strip('#').strip().rstrip(':').strip()
+    if not stripped or len(stripped) > 40:
+        return None
+    return _HEADING_LOOKUP.get(re.sub(r"\s+", " ", stripped.lower().replace('&', 'and')))
+
+
+def _split_entries(text):
+    """
+    Split an experience/projects section into entries
+
+    Blank lines separate entries when present; otherwise a new entry starts at
+    each non-bullet line containing a date (e.g. "Acme Corp | 2020 - Present").
+    """
+    blocks = [block.strip() for block in re.split(r"\n\s*\n", text) if block.strip()]
+    if len(blocks) > 1:
+        return blocks
+
+    entries, current = [], []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        starts_entry = not _BULLET_RE.match(line) and _DATE_RE.search(line)
+        if starts_entry and current and any(_BULLET_RE.match(l) or not _DATE_RE.search(l) for l in current):
+            entries.append("\n".join(current).strip())
+            current = []
+        current.append(line)
+    if current:
+        entries.append("\n".join(current).strip())
+    return entries
+
+
+def _split_skills(text):
+    skills = []
+    for line in text.splitlines():
+        line = _BULLET_RE.sub("", line)
+        # "Languages: Python, Go" -> drop the category label
+        if ':' in line:
+            line = line.split(':', 1)[1]
+        skills.extend(part.strip() for part in re.split(r"[,;|•·/]", line) if part.strip())
+    return skills
+
+
+def _fallback_summary(preamble, text):
+    """First real paragraph before any heading, skipping name/contact lines"""
+    for paragraph in re.split(r"\n\s*\n", preamble or text):
+        lines = [l for l in paragraph.splitlines() if l.strip() and not _CONTACT_RE.search(l)]
+        if len(" ".join(lines).split()) >= 8:
+            return "\n".join(lines).strip()
+    first_paragraph = text.split('\n\n')[0] if '\n\n' in text else '\n'.join(text.split('\n')[:5])
+    return first_paragraph.strip()
+
+
+def _parse(text):
+    parsed = ParsedCV(text)
+    current, buffer, preamble = None, [], []
+
+    def flush():
+        if current is not None:
+            body = "\n".join(buffer).strip()
+            # Repeated headings (e.g. two "Projects" blocks) are merged
+            parsed.sections[current] = (parsed.sections.get(current, "") + "\n\n" + body).strip()
+
+    for line in text.splitlines():
+        name = _heading_name(line)
+        if name:
+            flush()
+            current, buffer = name, []
+            parsed.headings.setdefault(name, line.strip().strip('#').strip().rstrip(':'))
+        elif current is None:
+            preamble.append(line)
+        else:
+            buffer.append(line)
+    flush()
+
+    parsed.preamble = "\n".join(preamble).strip()
+    parsed.summary = parsed.section('summary') or _fallback_summary(parsed.preamble, text)
+    parsed.experience = _split_entries(parsed.section('experience')) if parsed.section('experience') else []
+    parsed.projects = _split_entries(parsed.section('projects')) if parsed.section('projects') else []
+    parsed.skills = _split_skills(parsed.section('skills'))
+    return parsed
+
+
+def parse_cv(text):
+    """
+    Parse a CV into sections, reusing the cached result for identical text
+
+    Args:
+        text (str): Entire CV content
+
+    Returns:
+        ParsedCV: Parsed CV
+    """
+    text = (text or "").strip()
+    key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    parsed = _CACHE.get(key)
+    if parsed is None:
+        parsed = _parse(text)
+        if len(_CACHE) >= _CACHE_SIZE:
+            _CACHE.pop(next(iter(_CACHE)))
+        _CACHE[key] = parsed
+    return parsed
+
+
+def select_cv_context(parsed, job_data, max_tokens=CV_TOKEN_BUDGET):
+    """
+    Build a CV excerpt with the sections most relevant to a job within a token budget
+
+    The summary and the skills matching the job come first, then experience
+    and project entries in order of BM25 relevance to the job (shown in CV
+    order), then education and certifications while budget remains.
+
+    Args:
+        parsed (ParsedCV): Parsed CV
+        job_data (dict): Job information dictionary
+        max_tokens (int): Token budget
+
+    Returns:
+        str: CV excerpt
+    """
+    job_text = " ".join(str(job_data.get(k) or "") for k in ('title', 'description', 'description_snippet'))
+    job_terms = set(tokenize(job_text))
+    query = {term: 1.0 for term in job_terms}
+    for term in tokenize(job_data.get('title')):
+        query[term] = 3.0
+
+    blocks = []   # (cv_order, heading, text)
+    used = 0
+
+    def add(order, heading, text, budget_left=None):
+        nonlocal used
+        text = text.strip()
+        if not text:
+            return False
+        limit = max_tokens - used if budget_left is None else min(budget_left, max_tokens - used)
+        cost = count_tokens(text) + count_tokens(heading) + 2
+        if cost > limit:
+            text = fit_to_budget(text, limit - count_tokens(heading) - 2)
+            if not text:
+                return False
+            cost = count_tokens(text) + count_tokens(heading) + 2
+        blocks.append((order, heading, text))
+        used += cost
+        return True
+
+    order_of = {name: i for i, name in enumerate(parsed.sections)}
+
+    if parsed.summary:
+        add(-1, parsed.headings.get('summary', "Summary"), parsed.summary, max_tokens // 4)
+
+    if parsed.skills:
+        matching = [s for s in parsed.skills if set(tokenize(s)) & job_terms]
+        others = [s for s in parsed.skills if s not in matching]
+        add(order_of.get('skills', 0), parsed.headings.get('skills', "Skills"),
+            ", ".join(matching + others), max_tokens // 5)
+
+    entries = [('experience', e) for e in parsed.experience] + [('projects', p) for p in parsed.projects]
+    if entries:
+        scores = bm25_scores([tokenize(text) for _, text in entries], query)
+        for i in sorted(range(len(entries)), key=lambda i: -scores[i]):
+            name, text = entries[i]
+            add(order_of.get(name, 0) + i / 1000.0, parsed.headings.get(name, name.title()), text)
+
+    for name in ('education', 'certifications'):
+        if parsed.section(name):
+            add(order_of.get(name, 0), parsed.headings.get(name, name.title()), parsed.section(name))
+
+    if not blocks:
+        return fit_to_budget(parsed.text, max_tokens)
+
+    # Group selected blocks under their headings, in CV order
+    lines, last_heading = [], None
+    for _, heading, text in sorted(blocks, key=lambda b: b[0]):
+        if heading != last_heading:
+            lines.append(f"\n{heading}:")
+            last_heading = heading
+        lines.append(text)
+    return "\n".join(lines).strip()
@@ -0,0 +1,230 @@
+"""
+Browserless job search over pooled HTTP
+
+LinkedIn serves public (guest) job search results as plain HTML fragments, the
+same cards the notifier in Scrapper.py parses. HTTPJobSearch fetches those
+result pages over one pooled requests session, several pages at a time, and
+parses the cards into the same job dictionaries LinkedInJobScraper builds from
+the browser, without starting Chrome.
+
+Manual check against the fixture server of the lean browser benchmark:
+    python http_search.py "Backend Engineer" Remote --base-url http://127.0.0.1:8000/jobs/search
+"""
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from job_identity import JobIndex, canonical_job_url, extract_job_id, normalize_job_url
+from search_urls import RESULTS_PER_PAGE, build_search_url
+
+# Public job search fragment; takes the same parameters as the search page
+GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+DEFAULT_WORKERS = 4
+
+# Responses that mean LinkedIn is refusing guest requests (999 is its bot wall)
+BLOCKED_STATUS_CODES = (401, 403, 429, 999)
+
+
+class HTTPSearchError(Exception):
+    """Guest search request failed or was refused; the browser is needed instead"""
+
+
+def _text(card, *selectors):
+    for selector in selectors:
+        element = card.select_one(selector)
+        if element and element.get_text(strip=True):
+            return element
+    return None
+
+
+def parse_job_cards(html):
+    """
+    Parse public job search cards into job dictionaries
+
+    Args:
+        html (str): Search results page or guest API fragment
+
+    Returns:
+        list: Job dictionaries with the keys LinkedInJobScraper produces
+            (title, link, job_id, company, company_link, location, posted_date,
+            description_snippet, scraped_at)
+    """
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    scraped_at = datetime.now().isoformat()
+    jobs = []
+    for card in soup.select("div.base-card, div.job-search-card"):
+        link_elem = (card.select_one("a.base-card__full-link")
+                     or card.find("a", href=lambda h: h and "/jobs/view/" in h))
+        title_elem = _text(card, "h3.base-search-card__title", "a.base-card__full-link")
+        href = link_elem.get('href') if link_elem else None
+        job_id = extract_job_id(card.get('data-entity-urn')) or extract_job_id(href)
+        if not (job_id or href):
+            continue
+
+        company_elem = _text(card, "h4.base-search-card__subtitle", "h3.base-search-card__subtitle")
+        company_link = company_elem.select_one("a") if company_elem else None
+        location_elem = _text(card, "span.job-search-card__location", "span.base-search-card__location",
+                              "span.job-result-card__location")
+        date_elem = card.select_one("time.job-search-card__listdate, time[datetime]")
+        snippet_elem = _text(card, "p.base-search-card__snippet", "p.job-search-card__snippet")
+
+        jobs.append({
+            'title': title_elem.get_text(strip=True) if title_elem else "N/A",
+            'link': canonical_job_url(job_id) if job_id else (normalize_job_url(href) or "N/A"),
+            'job_id': job_id,
+            'company': company_elem.get_text(strip=True) if company_elem else "N/A",
+            'company_link': (company_link.get('href') if company_link else None) or "N/A",
+            'location': location_elem.get_text(strip=True) if location_elem else "N/A",
+            'posted_date': ((date_elem.get('datetime') or date_elem.get_text(strip=True))
+                            if date_elem else "N/A"),
+            'description_snippet': snippet_elem.get_text(strip=True) if snippet_elem else "N/A",
+            'scraped_at': scraped_at,
+        })
+    return jobs
+
+
+class HTTPJobSearch:
+    def __init__(self, base_url=GUEST_SEARCH_URL, max_workers=DEFAULT_WORKERS, timeout=(5, 30),
+                 per_page=RESULTS_PER_PAGE, delay=0.5):
+        """
+        Initialize the HTTP search engine
+
+        Args:
+            base_url (str): Search endpoint (guest API, or a local fixture server)
+            max_workers (int): Result pages fetched concurrently (and pooled connections)
+            timeout (tuple): requests (connect, read) timeout
+            per_page (int): Expected cards per page; the first page's card count is used
+                as the offset step when the endpoint returns fewer
+            delay (float): Pause between waves of concurrent page requests
+        """
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.per_page = per_page
+        self.delay = delay
+        self.stats = {'requests': 0, 'bytes': 0, 'errors': 0}
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        retry = Retry(total=2, backoff_factor=1.0, status_forcelist=[500, 502, 503, 504],
+                      allowed_methods=["GET"], respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0', 'Accept-Language': 'en-US,en;q=0.9'})
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def fetch_page(self, title, location, filters=None, start=0):
+        """
+        Fetch and parse one result page
+
+        Returns:
+            list: Job dictionaries on the page (empty past the last page)
+
+        Raises:
+            HTTPSearchError: The request failed or LinkedIn refused it
+        """
+        import requests
+        url = build_search_url(title, location, filters, start=start, base_url=self.base_url)
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            self.stats['errors'] += 1
+            raise HTTPSearchError(f"request failed: {e}") from e
+        self.stats['requests'] += 1
+        self.stats['bytes'] += len(response.content)
+        if response.status_code in BLOCKED_STATUS_CODES:
+            self.stats['errors'] += 1
+            raise HTTPSearchError(f"HTTP {response.status_code} from {self.base_url}")
+        if response.status_code == 400 and start:
+            # The guest API answers 400 for offsets past the last result
+            return []
+        if response.status_code != 200:
+            self.stats['errors'] += 1
+            raise HTTPSearchError(f"HTTP {response.status_code} from {self.base_url}")
+        return parse_job_cards(response.text)
+
+    def search(self, title, location, max_results=50, filters=None, stats=None):
+        """
+        Search one title/location combination
+
+        The first page is fetched alone (it tells the page size); the remaining
+        offsets are fetched max_workers pages at a time until max_results jobs
+        are collected or a page comes back empty.
+
+        Args:
+            title (str): Job title to search for
+            location (str): Location to search in
+            max_results (int): Maximum number of results
+            filters (dict): Optional search filters (see search_urls.build_search_url)
+            stats (dict): Optional stats dict; 'pages' is set to the pages fetched
+
+        Returns:
+            list: List of job dictionaries
+
+        Raises:
+            HTTPSearchError: The first page could not be fetched
+        """
+        title_jobs = JobIndex()
+        first_page = self.fetch_page(title, location, filters)
+        pages = 1
+        for job in first_page:
+            if len(title_jobs) < max_results:
+                title_jobs.add(job)
+
+        step = min(len(first_page), self.per_page)
+        next_start = step
+        done = not first_page or len(title_jobs) >= max_results
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while not done:
+                remaining_pages = -(-(max_results - len(title_jobs)) // step)
+                offsets = [next_start + i * step for i in range(min(self.max_workers, remaining_pages))]
+                next_start = offsets[-1] + step
+                time.sleep(self.delay)
+                results = list(executor.map(lambda start: self._fetch_quietly(title, location, filters, start),
+                                            offsets))
+                pages += len(offsets)
+                # Merge in page order so results keep LinkedIn's ranking
+                for page_jobs in results:
+                    added = sum(1 for job in page_jobs
+                                if len(title_jobs) < max_results and title_jobs.add(job))
+                    if not page_jobs or not added or len(title_jobs) >= max_results:
+                        done = True
+                        break
+
+        if stats is not None:
+            stats['pages'] = pages
+        return title_jobs.jobs()
+
+    def _fetch_quietly(self, title, location, filters, start):
+        """fetch_page for later pages: a failed page ends the search instead of failing it"""
+        try:
+            return self.fetch_page(title, location, filters, start)
+        except HTTPSearchError as e:
+            print(f"HTTP search page at offset {start} failed: {e}")
+            return []
+
+    def close(self):
+        self.session.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search LinkedIn's public job listings without a browser")
+    parser.add_argument('title')
+    parser.add_argument('location')
+    parser.add_argument('--max-results', type=int, default=50)
+    parser.add_argument('--base-url', default=GUEST_SEARCH_URL,
+                        help="Search endpoint (e.g. a local fixture server)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    args = parser.parse_args()
+
+    engine = HTTPJobSearch(base_url=args.base_url, max_workers=args.workers)
+    started = time.time()
+    found = engine.search(args.title, args.location, args.max_results)
+    for job in found:
+        print(f"{job['job_id'] or '-':>12}  {job['title'][:40]:<40}  {job['company'][:25]:<25}  {job['location']}")
+    print(f"\n{len(found)} jobs, {engine.stats['requests']} requests, "
+          f"{engine.stats['bytes'] / 1024:.0f} KB, {time.time() - started:.1f}s")
+    engine.close()
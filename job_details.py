@@ -0,0 +1,215 @@
+"""
+Job detail-page fetcher with concurrent pooled HTTP and an on-disk TTL cache
+
+Search cards only carry a one-line snippet. This fetches the full description
+of the selected jobs from LinkedIn's public job posting pages, several at a
+time over one pooled HTTP session, and caches each description on disk by job
+ID so later runs do not fetch the same posting again.
+
+Manual check against a local fixture page:
+    python -m http.server 8000
+    python job_details.py 3900000001 --url-template http://127.0.0.1:8000/fixtures/job_posting.html --no-cache
+"""
+import os
+import json
+import time
+import tempfile
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from config import DESCRIPTIONS_CACHE_DIR
+from job_identity import job_key, extract_job_id
+
+# Public (guest) job posting fragment; {job_id} is the numeric LinkedIn job ID
+JOB_POSTING_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_WORKERS = 4
+
+DESCRIPTION_SELECTORS = [
+    "div.show-more-less-html__markup",
+    "div.description__text",
+    "section.description",
+    "div.jobs-description__content",
+]
+
+
+def parse_description(html):
+    """
+    Extract the job description text from a job posting page
+
+    Args:
+        html (str): Job posting HTML
+
+    Returns:
+        str: Description text with one line per paragraph/list item, or None
+    """
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    for selector in DESCRIPTION_SELECTORS:
+        element = soup.select_one(selector)
+        if element:
+            text = element.get_text("\n", strip=True)
+            if text:
+                return text
+    return None
+
+
+class JobDetailFetcher:
+    def __init__(self, cache_dir=DESCRIPTIONS_CACHE_DIR, ttl_seconds=DEFAULT_TTL_SECONDS,
+                 max_workers=DEFAULT_WORKERS, url_template=JOB_POSTING_URL, timeout=(5, 30),
+                 use_cache=True):
+        """
+        Initialize the fetcher
+
+        Args:
+            cache_dir (str): Directory holding one cached description per job ID
+            ttl_seconds (int): Age after which cached descriptions are re-fetched
+            max_workers (int): Number of concurrent fetches (and pooled connections)
+            url_template (str): Posting URL with a {job_id} placeholder; point it at
+                a local server to run against fixture pages
+            timeout (tuple): requests (connect, read) timeout
+            use_cache (bool): Read and write the on-disk cache
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_workers = max_workers
+        self.url_template = url_template
+        self.timeout = timeout
+        self.use_cache = use_cache
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        retry = Retry(total=2, backoff_factor=1.0, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=["GET"], respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _cache_path(self, job_id):
+        return os.path.join(self.cache_dir, f"{job_id}.json")
+
+    def get_cached(self, job_id):
+        """
+        Return a cached description if it exists and has not expired
+
+        Args:
+            job_id (str): LinkedIn job ID
+
+        Returns:
+            str: Cached description, or None
+        """
+        if not self.use_cache:
+            return None
+        try:
+            with open(self._cache_path(job_id), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get('fetched_at', 0) > self.ttl_seconds:
+            return None
+        return entry.get('description')
+
+    def _store(self, job_id, description):
+        if not self.use_cache:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f"{job_id}_", suffix=".tmp", dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'job_id': job_id, 'fetched_at': time.time(), 'description': description},
+                          f, ensure_ascii=False)
+            os.replace(tmp, self._cache_path(job_id))
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def fetch(self, job_id):
+        """
+        Fetch and parse one job posting (no cache lookup)
+
+        Args:
+            job_id (str): LinkedIn job ID
+
+        Returns:
+            str: Description text, or None if the page had no description
+        """
+        response = self.session.get(self.url_template.format(job_id=job_id), timeout=self.timeout)
+        response.raise_for_status()
+        description = parse_description(response.text)
+        if description:
+            self._store(job_id, description)
+        return description
+
+    def fetch_all(self, jobs):
+        """
+        Add full descriptions to jobs, using the cache and fetching the rest concurrently
+
+        Each job with a description gets a 'description' key; jobs without a
+        job ID or whose fetch fails keep only their snippet.
+
+        Args:
+            jobs (list): Job dictionaries
+
+        Returns:
+            dict: Counts of 'cached', 'fetched', 'failed' and 'skipped' jobs
+        """
+        stats = {'cached': 0, 'fetched': 0, 'failed': 0, 'skipped': 0}
+        started = time.time()
+
+        pending = {}
+        for job in jobs:
+            job_id = job.get('job_id') or extract_job_id(job_key(job))
+            if not job_id:
+                stats['skipped'] += 1
+                continue
+            cached = self.get_cached(job_id)
+            if cached:
+                job['description'] = cached
+                stats['cached'] += 1
+            else:
+                pending.setdefault(job_id, []).append(job)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self.fetch, job_id): job_id for job_id in pending}
+                for future in as_completed(futures):
+                    job_id = futures[future]
+                    try:
+                        description = future.result()
+                    except Exception as e:
+                        print(f"Error fetching job details for {job_id}: {e}")
+                        description = None
+                    if description:
+                        for job in pending[job_id]:
+                            job['description'] = description
+                        stats['fetched'] += 1
+                    else:
+                        stats['failed'] += 1
+
+        print(f"Job details: {stats['cached']} cached, {stats['fetched']} fetched, "
+              f"{stats['failed']} failed, {stats['skipped']} without job ID "
+              f"({time.time() - started:.1f}s)")
+        return stats
+
+    def close(self):
+        self.session.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fetch full LinkedIn job descriptions by job ID")
+    parser.add_argument('job_ids', nargs='+', help="LinkedIn job IDs")
+    parser.add_argument('--url-template', default=JOB_POSTING_URL,
+                        help="Posting URL with a {job_id} placeholder (e.g. a local fixture server)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('--no-cache', action='store_true', help="Bypass the on-disk cache")
+    args = parser.parse_args()
+
+    fetcher = JobDetailFetcher(max_workers=args.workers, url_template=args.url_template,
+                               use_cache=not args.no_cache)
+    jobs = [{'job_id': job_id} for job_id in args.job_ids]
+    fetcher.fetch_all(jobs)
+    for job in jobs:
+        print(f"\n{'='*80}\nJob {job['job_id']}\n{'='*80}\n{job.get('description', 'N/A')}")
+    fetcher.close()
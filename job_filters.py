@@ -14,7 +14,7 @@ _INCLUDE_PHRASES = [
     r"business\s+analyst",
     r"data\s+visualization\s+engineer",
     r"cloud\s+(?:engineer|developer|infrastructure\s+engineer)",
-    r"devops\s+engineer",,
+    r"devops\s+engineer",
     r"(?:mlops|machine\s+learning|ml)\s+engineer",
     r"(?:ai|applied)\s+(?:engineer|scientist)",
 ]
@@ -50,3 +50,28 @@ def is_relevant_title(title: str) -> bool:
     if EXCLUDE_RE.search(t):
         return False
     return bool(INCLUDE_RE.search(t))
+
+def _compile_phrases(phrases):
+    return re.compile(r"\b(?:" + r"|".join(f"(?:{p})" for p in phrases) + r")\b", re.I)
+
+def make_title_filter(include=None, exclude=None, default_excludes=True):
+    """
+    Build a title predicate for a saved search.
+
+    include: regex phrases a title must match (default: the built-in include list).
+    exclude: regex phrases that reject a title, on top of the built-in excludes
+    unless default_excludes is False.
+    """
+    if not include and not exclude and default_excludes:
+        return is_relevant_title
+    include_re = _compile_phrases(include) if include else INCLUDE_RE
+    excludes = [EXCLUDE_RE] if default_excludes else []
+    if exclude:
+        excludes.append(_compile_phrases(exclude))
+
+    def matches(title: str) -> bool:
+        t = normalize_title(title)
+        if any(r.search(t) for r in excludes):
+            return False
+        return bool(include_re.search(t))
+    return matches
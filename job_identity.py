@@ -0,0 +1,135 @@
+"""
+Canonical LinkedIn job identity: job ID parsing, URL normalization and a dedup index
+
+The same posting shows up under many URLs (tracking parameters, slugs, guest vs
+logged-in paths). Everything that deduplicates jobs - both scrapers, the seen
+store and the exporters - keys jobs by the numeric job ID parsed here.
+"""
+import re
+
+# /jobs/view/<id> or /jobs/view/<slug>-<id>
+JOB_VIEW_RE = re.compile(r"/jobs/view/(?:[^/?#]*?-)?(\d{6,})(?=[/?#]|$)")
+# urn:li:jobPosting:<id> (data-entity-urn attributes on guest search cards)
+JOB_URN_RE = re.compile(r"urn:li:(?:fs_normalized_)?jobPosting:(\d{6,})")
+# currentJobId=<id> (search result URLs with a job selected)
+CURRENT_JOB_RE = re.compile(r"[?&]currentJobId=(\d{6,})")
+# Bare numeric ID (data-job-id attributes)
+BARE_ID_RE = re.compile(r"^\s*(\d{6,})\s*$")
+
+JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{job_id}/"
+
+
+def extract_job_id(value):
+    """
+    Parse the numeric LinkedIn job ID from a URL or attribute value
+
+    Args:
+        value (str): Job URL, data-job-id value or jobPosting URN
+
+    Returns:
+        str: Job ID, or None if the value does not contain one
+    """
+    if not value:
+        return None
+    value = str(value)
+    for pattern in (BARE_ID_RE, JOB_VIEW_RE, JOB_URN_RE, CURRENT_JOB_RE):
+        match = pattern.search(value)
+        if match:
+            return match.group(1)
+    return None
+
+
+def canonical_job_url(job_id):
+    """Return the canonical /jobs/view/ URL for a job ID"""
+    return JOB_VIEW_URL.format(job_id=job_id)
+
+
+def normalize_job_url(url):
+    """
+    Normalize a job URL so every variant of the same posting compares equal
+
+    Args:
+        url (str): Job URL
+
+    Returns:
+        str: Canonical /jobs/view/<id>/ URL if a job ID can be parsed, otherwise
+            the URL without query string and fragment
+    """
+    if not url or url == "N/A":
+        return url
+    job_id = extract_job_id(url)
+    if job_id:
+        return canonical_job_url(job_id)
+    return url.split('#', 1)[0].partition('?')[0]
+
+
+def job_key(job):
+    """
+    Build the deduplication key for a job dictionary
+
+    Args:
+        job (dict): Job data dictionary
+
+    Returns:
+        str: Job ID when known, otherwise the normalized link (empty string if
+            the job has no usable link)
+    """
+    job_id = job.get('job_id') or extract_job_id(job.get('link'))
+    if job_id:
+        return job_id
+    link = job.get('link') or ''
+    if link == "N/A":
+        return ''
+    return normalize_job_url(link)
+
+
+class JobIndex:
+    """
+    Hash index of jobs keyed by job ID, preserving insertion order
+
+    Used for O(1) duplicate checks wherever jobs are collected.
+    """
+
+    def __init__(self, jobs=None):
+        self._jobs = {}
+        for job in jobs or []:
+            self.add(job)
+
+    def add(self, job):
+        """
+        Add a job if it has not been seen yet
+
+        Args:
+            job (dict): Job data dictionary
+
+        Returns:
+            bool: True if the job was new and added, False for duplicates or
+                jobs without a usable key
+        """
+        key = job_key(job)
+        if not key or key in self._jobs:
+            return False
+        self._jobs[key] = job
+        return True
+
+    def get(self, key, default=None):
+        """Look up a job by job ID/key"""
+        return self._jobs.get(key, default)
+
+    def jobs(self):
+        """Return the indexed jobs in insertion order"""
+        return list(self._jobs.values())
+
+    def keys(self):
+        return self._jobs.keys()
+
+    def __contains__(self, item):
+        if isinstance(item, dict):
+            item = job_key(item)
+        return item in self._jobs
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def __iter__(self):
+        return iter(self._jobs.values())
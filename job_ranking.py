@@ -0,0 +1,153 @@
+"""
+Local relevance ranking of scraped jobs against the CV and searched titles
+
+Jobs are scored with BM25 over a sparse document-term matrix, so ranking
+thousands of jobs is a handful of vectorized NumPy/SciPy operations and needs
+no network. The LLM budget is then spent on the best-fit jobs first instead of
+whatever appeared first in the search results.
+"""
+import re
+import math
+import time
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Query weight of the searched job titles relative to CV terms
+TITLE_QUERY_WEIGHT = 3.0
+# Job title terms count this many times in the job document
+TITLE_FIELD_WEIGHT = 2
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have i in is it its me my of on or our that the their this to
+was we were will with you your they he she them his her who what when where which while than then
+also into over under about after before more most other some such only own same so too very can
+just should now
+""".split())
+
+
+def tokenize(text):
+    """Lowercase word tokens without stopwords"""
+    if not text or text == "N/A":
+        return []
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def _job_document(job):
+    """Tokens representing a job: title (weighted), company and description"""
+    tokens = tokenize(job.get('title')) * TITLE_FIELD_WEIGHT
+    tokens += tokenize(job.get('company'))
+    tokens += tokenize(job.get('description') or job.get('description_snippet'))
+    return tokens
+
+
+def bm25_scores(documents, query_weights):
+    """
+    Score tokenized documents against a weighted query with BM25
+
+    Args:
+        documents (list): List of token lists
+        query_weights (dict): Query term -> weight
+
+    Returns:
+        numpy.ndarray: One score per document
+    """
+    # NumPy/SciPy load on first use: tokenize() alone must stay cheap to import
+    import numpy as np
+    from scipy import sparse
+
+    n_docs = len(documents)
+    if n_docs == 0:
+        return np.zeros(0)
+
+    vocabulary = {}
+    rows, cols = [], []
+    for row, tokens in enumerate(documents):
+        for token in tokens:
+            rows.append(row)
+            cols.append(vocabulary.setdefault(token, len(vocabulary)))
+    if not vocabulary:
+        return np.zeros(n_docs)
+
+    # Duplicate (row, col) entries are summed into term frequencies
+    tf = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float64), (np.array(rows), np.array(cols))),
+        shape=(n_docs, len(vocabulary)),
+    )
+    tf.sum_duplicates()
+
+    doc_lengths = np.asarray(tf.sum(axis=1)).ravel()
+    avg_length = doc_lengths.mean() or 1.0
+    doc_freq = np.bincount(tf.indices, minlength=len(vocabulary))
+    idf = np.log1p((n_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    # BM25 term saturation applied to the non-zero entries only
+    row_of_entry = np.repeat(np.arange(n_docs), np.diff(tf.indptr))
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths[row_of_entry] / avg_length)
+    weighted = tf.copy()
+    weighted.data = idf[tf.indices] * tf.data * (BM25_K1 + 1) / (tf.data + norm)
+
+    query = np.zeros(len(vocabulary))
+    for term, weight in query_weights.items():
+        col = vocabulary.get(term)
+        if col is not None:
+            query[col] = weight
+    return weighted @ query
+
+
+def build_query(cv_text, titles=None):
+    """
+    Build weighted query terms from the CV and searched titles
+
+    CV term counts are log-damped so long CVs do not drown the title terms.
+
+    Args:
+        cv_text (str): Entire CV content
+        titles (list): Searched job titles
+
+    Returns:
+        dict: Term -> weight
+    """
+    counts = {}
+    for token in tokenize(cv_text):
+        counts[token] = counts.get(token, 0) + 1
+    weights = {term: 1.0 + math.log(count) for term, count in counts.items()}
+    for title in titles or []:
+        for token in tokenize(title):
+            weights[token] = weights.get(token, 0.0) + TITLE_QUERY_WEIGHT
+    return weights
+
+
+def rank_jobs(jobs, cv_text, titles=None, top_k=None):
+    """
+    Rank jobs by relevance to the CV and searched titles
+
+    Each job gets a 'relevance_score' key. Ties keep the original scrape order.
+
+    Args:
+        jobs (list): Job dictionaries
+        cv_text (str): Entire CV content
+        titles (list): Searched job titles
+        top_k (int): Return only the best top_k jobs (default: all)
+
+    Returns:
+        list: Jobs sorted by descending relevance
+    """
+    if not jobs:
+        return []
+    started = time.perf_counter()
+
+    scores = bm25_scores([_job_document(job) for job in jobs], build_query(cv_text, titles))
+    order = sorted(range(len(jobs)), key=lambda i: -scores[i])
+    if top_k is not None:
+        order = order[:top_k]
+
+    ranked = []
+    for i in order:
+        jobs[i]['relevance_score'] = round(float(scores[i]), 3)
+        ranked.append(jobs[i])
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"Ranked {len(jobs)} jobs against CV and titles in {elapsed_ms:.1f} ms")
+    return ranked
@@ -0,0 +1,290 @@
+"""
+Master job tracker workbook, updated in place by job ID
+
+Instead of a new timestamped XLSX per run, JobTracker keeps one workbook
+(output/job_tracker.xlsx by default) and upserts each run's jobs into it:
+jobs not in the workbook yet are appended, jobs whose exported fields changed
+are updated in place, and everything else is left alone. Columns the user adds
+(Status and Notes are created empty; any other header works too) are never
+written, and rows the user reorders or deletes are found again by their Job ID.
+
+A sidecar index (<workbook>.index.json) keeps a short hash of every exported
+field per job and the workbook's size and mtime. When every job of a run is
+unchanged the workbook is not opened at all; otherwise it is loaded and saved
+once. The index is rebuilt from the Job ID column whenever the workbook was
+edited outside the scraper.
+"""
+import os
+import json
+import hashlib
+import tempfile
+from config import TRACKER_FILE
+from job_identity import extract_job_id
+
+# Columns written by the scraper, in export order
+XLSX_COLUMNS = ['Job ID', 'Title', 'Company', 'Location', 'Posted Date', 'Link', 'Description Snippet',
+                'Relevance Score', 'Recommended Cover Letter', 'Scraped At']
+
+# Empty columns added to a new tracker for the user to fill in
+USER_COLUMNS = ['Status', 'Notes']
+
+# Fields that change on every run without the job changing (BM25 scores depend
+# on the other jobs of the run); refreshed only when a row is updated anyway
+VOLATILE_COLUMNS = ('Scraped At', 'Relevance Score')
+
+# Fields written once: a cover letter already in the tracker (possibly edited
+# or already sent) is never replaced by a regenerated one
+WRITE_ONCE_COLUMNS = ('Recommended Cover Letter',)
+
+MISSING = (None, "", "N/A")
+
+
+def xlsx_row(job, cover_letter=None):
+    """
+    Export row for a job
+
+    Args:
+        job (dict): Job data
+        cover_letter (str): Generated cover letter, if any
+
+    Returns:
+        dict: Column name -> value, in XLSX_COLUMNS order
+    """
+    job_link = job.get('link', '')
+    return {
+        'Job ID': job.get('job_id') or extract_job_id(job_link) or 'N/A',
+        'Title': job.get('title', 'N/A'),
+        'Company': job.get('company', 'N/A'),
+        'Location': job.get('location', 'N/A'),
+        'Posted Date': job.get('posted_date', 'N/A'),
+        'Link': job_link,
+        'Description Snippet': job.get('description_snippet', 'N/A'),
+        'Relevance Score': job.get('relevance_score', 'N/A'),
+        'Recommended Cover Letter': cover_letter or 'N/A',
+        'Scraped At': job.get('scraped_at', 'N/A')
+    }
+
+
+def _row_key(job_id, link):
+    """Tracker key: the job ID, or the link for jobs without one"""
+    if job_id not in MISSING:
+        return str(job_id)
+    return str(link) if link not in MISSING else None
+
+
+def _field_hash(value):
+    return hashlib.blake2b(str(value).encode('utf-8'), digest_size=6).hexdigest()
+
+
+class JobTracker:
+    def __init__(self, path=TRACKER_FILE, sheet_name='Jobs'):
+        """
+        Initialize the tracker
+
+        Args:
+            path (str): Tracker workbook path
+            sheet_name (str): Worksheet holding the jobs
+        """
+        self.path = path
+        self.index_path = path + ".index.json"
+        self.sheet_name = sheet_name
+        # index: {'workbook': [size, mtime], 'rows': {key: {column: field hash}}}
+        self.index = {'workbook': None, 'rows': {}}
+        self.stats = {'new': 0, 'updated': 0, 'unchanged': 0, 'written': False, 'reindexed': False}
+
+    def _signature(self):
+        stat = os.stat(self.path)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not read tracker index {self.index_path}: {e}")
+            self.index = {'workbook': None, 'rows': {}}
+
+    def _save_index(self):
+        self.index['workbook'] = self._signature()
+        directory = os.path.dirname(os.path.abspath(self.index_path))
+        fd, tmp = tempfile.mkstemp(prefix="tracker_index_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, separators=(',', ':'))
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            print(f"Could not save tracker index {self.index_path}: {e}")
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    @staticmethod
+    def _header(worksheet):
+        return {cell.value: cell.column for cell in next(worksheet.iter_rows(min_row=1, max_row=1))
+                if cell.value is not None}
+
+    def _reindex(self):
+        """
+        Rebuild the index after the workbook was edited outside the scraper
+
+        Keys are read from the Job ID and Link columns in read-only mode. Jobs
+        that are gone from the workbook are forgotten (a later run adds them
+        again); jobs not in the index get no hashes, so their next export
+        updates them.
+        """
+        from openpyxl import load_workbook
+        workbook = load_workbook(self.path, read_only=True)
+        try:
+            worksheet = workbook[self.sheet_name] if self.sheet_name in workbook.sheetnames else workbook.active
+            header = self._header(worksheet)
+            id_col, link_col = header.get('Job ID'), header.get('Link')
+            keys = set()
+            for row in worksheet.iter_rows(min_row=2, values_only=True):
+                key = _row_key(row[id_col - 1] if id_col and id_col <= len(row) else None,
+                               row[link_col - 1] if link_col and link_col <= len(row) else None)
+                if key:
+                    keys.add(key)
+        finally:
+            workbook.close()
+        rows = self.index.get('rows', {})
+        self.index['rows'] = {key: rows.get(key, {}) for key in keys}
+        self.stats['reindexed'] = True
+
+    def _changes(self, row, key):
+        """Hashes of the row's fields that differ from the tracker ({} if unchanged)"""
+        known = self.index['rows'].get(key, {})
+        changes = {}
+        for column, value in row.items():
+            if column in VOLATILE_COLUMNS or value in MISSING:
+                # Missing values never overwrite what an earlier run wrote
+                continue
+            if column in WRITE_ONCE_COLUMNS and column in known:
+                continue
+            digest = _field_hash(value)
+            if known.get(column) != digest:
+                changes[column] = digest
+        return changes
+
+    def upsert(self, rows):
+        """
+        Append new jobs and update changed ones
+
+        Args:
+            rows (list): Export rows (see xlsx_row)
+
+        Returns:
+            dict: Counts of new, updated and unchanged jobs, and whether the workbook was written
+        """
+        self.stats = {'new': 0, 'updated': 0, 'unchanged': 0, 'written': False, 'reindexed': False}
+        exists = os.path.exists(self.path)
+        if exists:
+            self._load_index()
+            if self.index.get('workbook') != self._signature():
+                self._reindex()
+        else:
+            self.index = {'workbook': None, 'rows': {}}
+
+        new_rows, updates = {}, {}
+        for row in rows:
+            key = _row_key(row.get('Job ID'), row.get('Link'))
+            if not key:
+                continue
+            if key not in self.index['rows'] and key not in new_rows:
+                new_rows[key] = row
+            elif key in self.index['rows']:
+                changes = self._changes(row, key)
+                if changes:
+                    updates[key] = (row, changes)
+                else:
+                    self.stats['unchanged'] += 1
+
+        if not new_rows and not updates:
+            print(f"Tracker {self.path}: {self.stats['unchanged']} jobs unchanged, nothing to write")
+            return self.stats
+
+        try:
+            self._write(new_rows, updates, exists)
+        except PermissionError as e:
+            # Typically the workbook is open in Excel
+            print(f"Could not update tracker {self.path} (is it open in another program?): {e}")
+            return self.stats
+
+        for key, row in new_rows.items():
+            self.index['rows'][key] = {column: _field_hash(value) for column, value in row.items()
+                                       if column not in VOLATILE_COLUMNS and value not in MISSING}
+        for key, (row, changes) in updates.items():
+            self.index['rows'][key].update(changes)
+        self._save_index()
+        self.stats['new'] = len(new_rows)
+        self.stats['updated'] = len(updates)
+        self.stats['written'] = True
+        print(f"Tracker {self.path}: {self.stats['new']} new, {self.stats['updated']} updated, "
+              f"{self.stats['unchanged']} unchanged")
+        return self.stats
+
+    def _write(self, new_rows, updates, exists):
+        """Apply the changes to the workbook and save it atomically"""
+        from openpyxl import Workbook, load_workbook
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+        from openpyxl.utils import get_column_letter
+
+        def clean(value):
+            return ILLEGAL_CHARACTERS_RE.sub("", value) if isinstance(value, str) else value
+
+        if exists:
+            workbook = load_workbook(self.path)
+            worksheet = (workbook[self.sheet_name] if self.sheet_name in workbook.sheetnames
+                         else workbook.active)
+        else:
+            workbook = Workbook()
+            worksheet = workbook.active
+            worksheet.title = self.sheet_name
+            worksheet.append(XLSX_COLUMNS + USER_COLUMNS)
+            worksheet.freeze_panes = "A2"
+            widths = {'Title': 40, 'Company': 25, 'Location': 25, 'Link': 50, 'Description Snippet': 60,
+                      'Recommended Cover Letter': 80, 'Notes': 40}
+            for idx, column in enumerate(XLSX_COLUMNS + USER_COLUMNS, 1):
+                worksheet.column_dimensions[get_column_letter(idx)].width = widths.get(column, 15)
+
+        header = self._header(worksheet)
+        # Exported columns the user deleted are added back at the end
+        for column in XLSX_COLUMNS:
+            if column not in header:
+                header[column] = worksheet.max_column + 1
+                worksheet.cell(row=1, column=header[column], value=column)
+
+        if updates:
+            id_col, link_col = header['Job ID'], header['Link']
+            for row_idx in range(2, worksheet.max_row + 1):
+                key = _row_key(worksheet.cell(row=row_idx, column=id_col).value,
+                               worksheet.cell(row=row_idx, column=link_col).value)
+                if key not in updates:
+                    continue
+                row, changes = updates[key]
+                for column in list(changes) + list(VOLATILE_COLUMNS):
+                    if row.get(column) in MISSING:
+                        continue
+                    cell = worksheet.cell(row=row_idx, column=header[column])
+                    if column in WRITE_ONCE_COLUMNS and cell.value not in MISSING:
+                        continue
+                    cell.value = clean(row[column])
+
+        next_row = worksheet.max_row + 1
+        for row in new_rows.values():
+            for column, value in row.items():
+                worksheet.cell(row=next_row, column=header[column], value=clean(value))
+            next_row += 1
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix="job_tracker_", suffix=".xlsx", dir=directory)
+        os.close(fd)
+        try:
+            workbook.save(tmp)
+            os.replace(tmp, self.path)
+        finally:
+            workbook.close()
+            if os.path.exists(tmp):
+                os.remove(tmp)
@@ -0,0 +1,115 @@
+"""
+Output length control for LLM generation
+
+Generation time grows with every output token, so each request gets a word
+target (derived from the user's template for cover letters), a token cap sized
+to that target, and an end marker used as a stop sequence so the model stops
+right after the letter instead of adding commentary. Outputs are checked
+afterwards: truncated text is trimmed to its last complete paragraph, and
+outputs far off target are regenerated once.
+"""
+import re
+import math
+
+END_MARKER = "[END]"
+
+# English prose averages about 0.75 words per token
+WORDS_PER_TOKEN = 0.75
+
+# A one-page cover letter
+COVER_LETTER_MIN_WORDS = 200
+COVER_LETTER_MAX_WORDS = 400
+CV_ABOUT_ME_WORDS = 150
+
+# Reasoning models spend output tokens on hidden reasoning before the answer
+REASONING_MODEL_PREFIXES = ("openai/gpt-oss-",)
+REASONING_HEADROOM_TOKENS = 512
+
+_PREAMBLE_RE = re.compile(r"^\s*(?:here(?:'s| is)|sure|certainly|below is)\b[^\n]*:\s*\n+", re.I)
+
+
+def count_words(text):
+    return len((text or "").split())
+
+
+def cover_letter_target_words(template):
+    """
+    Word target for an adapted cover letter: the template's length, kept within one page
+
+    Args:
+        template (str): The user's base cover letter
+
+    Returns:
+        int: Target word count
+    """
+    return max(COVER_LETTER_MIN_WORDS, min(COVER_LETTER_MAX_WORDS, count_words(template)))
+
+
+def token_cap(target_words, model=None, slack=1.3):
+    """
+    max_tokens for an output of about target_words words
+
+    Args:
+        target_words (int): Target word count
+        model (str): Model identifier; reasoning models get extra headroom
+        slack (float): Allowed overshoot before the output is cut
+
+    Returns:
+        int: Token cap
+    """
+    cap = int(target_words / WORDS_PER_TOKEN * slack) + 16
+    if model and model.startswith(REASONING_MODEL_PREFIXES):
+        cap += REASONING_HEADROOM_TOKENS
+    return cap
+
+
+def clean_output(text):
+    """Drop the end marker and anything after it, and a leading "Here is ..." line"""
+    text = text or ""
+    if END_MARKER in text:
+        text = text.split(END_MARKER, 1)[0]
+    return _PREAMBLE_RE.sub("", text, count=1).strip()
+
+
+def trim_to_paragraph(text):
+    """Cut truncated text back to its last complete paragraph (or sentence)"""
+    text = text.strip()
+    paragraphs = [p for p in re.split(r"\n\s*\n", text) if p.strip()]
+    if len(paragraphs) > 1:
+        return "\n\n".join(paragraphs[:-1]).strip()
+    sentence_end = max(text.rfind(". "), text.rfind(".\n"))
+    return text[:sentence_end + 1] if sentence_end > 0 else text
+
+
+def check_output(text, target_words, finish_reason="stop"):
+    """
+    Validate a generated output against its word target
+
+    Args:
+        text (str): Raw model output
+        target_words (int): Target word count
+        finish_reason (str): 'length' when the output hit the token cap
+
+    Returns:
+        tuple: (cleaned text, status) where status is 'ok', 'trimmed' or
+            'regenerate' (empty, cut off too early, or far over target)
+    """
+    text = clean_output(text)
+    words = count_words(text)
+    if finish_reason == 'length':
+        trimmed = trim_to_paragraph(text)
+        if count_words(trimmed) >= target_words * 0.6:
+            return trimmed, 'trimmed'
+        return text, 'regenerate'
+    if words < target_words * 0.3 or words > target_words * 1.6:
+        return text, 'regenerate'
+    return text, 'ok'
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)"""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = math.ceil(p / 100.0 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
@@ -6,46 +6,304 @@ import time
 import json
 import csv
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
-import pandas as pd
-from config import JOBS_DIR, OUTPUT_DIR
+from config import (JOBS_DIR, OUTPUT_DIR, COOKIES_FILE, CHROME_PROFILE_DIR, LEAN_BROWSER, SEARCH_MODE,
+                    SEARCH_ENGINE, TRACKER_FILE, ensure_output_dirs)
+from http_search import HTTPJobSearch, HTTPSearchError
+from job_tracker import JobTracker, xlsx_row
+from selector_registry import SelectorRegistry
+from job_identity import JobIndex, canonical_job_url, extract_job_id, job_key, normalize_job_url
+from search_urls import RESULTS_PER_PAGE, build_search_url, page_offsets
+
+
+LINKEDIN_HOME = "https://www.linkedin.com"
+SESSION_CHECK_URL = "https://www.linkedin.com/feed/"
+
+# URL fragments LinkedIn redirects to when the session is not valid
+LOGGED_OUT_URL_MARKERS = ("/login", "/authwall", "/checkpoint", "/uas/", "signup")
+
+# Lean mode: resources the scraper never reads. Stylesheets and scripts stay
+# allowed because LinkedIn needs them to render job cards and buttons.
+BLOCKED_URL_PATTERNS = [
+    # images and icons (company logos, profile photos)
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*.avif*",
+    "*media.licdn.com/dms/image*",
+    # fonts
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    # audio/video
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*",
+    # analytics and ad beacons
+    "*px.ads.linkedin.com*", "*/li/track*", "*/analytics/*", "*doubleclick.net*", "*google-analytics.com*",
+    "*googletagmanager.com*", "*bat.bing.com*", "*connect.facebook.net*",
+]
+
+# 'url' loads each results page straight from its URL and paginates by offset;
+# 'form' types into the search box and scrolls / clicks "See more jobs"
+SEARCH_MODES = ('url', 'form')
+
+# 'selenium' searches in Chrome; 'http' fetches public result pages without a
+# browser; 'auto' uses http and falls back to Chrome when LinkedIn refuses it
+SEARCH_ENGINES = ('selenium', 'http', 'auto')
+
+# CSS selector fallbacks per element, in default order (guest and logged-in
+# layouts). SelectorRegistry reorders them by hit rate at run time.
+SELECTORS = {
+    'job_card': [
+        "div.job-search-card",
+        "li.jobs-search-results__list-item",
+        "div[data-job-id]",
+        "article.job-card-container"
+    ],
+    'search_title_input': [
+        "input[aria-label*='Search jobs']",
+        "input[aria-label*='Search by title']",
+        "input.jobs-search-box__text-input[aria-label*='Search']",
+        "input[placeholder*='Search jobs']"
+    ],
+    'search_location_input': [
+        "input[aria-label*='City, state, or zip code']",
+        "input[aria-label*='Location']",
+        "input.jobs-search-box__text-input[aria-label*='Location']",
+        "input[placeholder*='Location']"
+    ],
+    'card_title': [
+        "h3.base-search-card__title a",
+        "h3.job-card-list__title a",
+        "a.job-card-list__title-link",
+        "h3 a[data-control-name='job_card_title_link']"
+    ],
+    'card_company': [
+        "h4.base-search-card__subtitle a",
+        "h4.job-card-container__company-name a",
+        "a.job-card-container__link",
+        "span.job-card-container__primary-description"
+    ],
+    'card_location': [
+        "span.job-search-card__location",
+        "li.job-card-container__metadata-item",
+        "span.job-card-container__metadata-item"
+    ],
+    'card_date': [
+        "time.job-search-card__listdate",
+        "time.job-card-container__listed-date",
+        "time[datetime]"
+    ],
+    'card_snippet': [
+        "p.base-search-card__snippet",
+        "p.job-card-container__description",
+        "div.job-card-container__description"
+    ],
+}
+
+LEAN_CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.managed_default_content_settings.geolocation": 2,
+}
 
 
 class LinkedInJobScraper:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, cookies_file=COOKIES_FILE, profile_dir=CHROME_PROFILE_DIR,
+                 lean=LEAN_BROWSER, search_mode=SEARCH_MODE, engine=SEARCH_ENGINE):
         """
         Initialize the LinkedIn Job Scraper
         
         Args:
             headless (bool): Run browser in headless mode
+            cookies_file (str): Where the LinkedIn session cookies are saved and
+                restored (None disables cookie persistence)
+            profile_dir (str): Optional Chrome user-data-dir that keeps the whole
+                browser profile (cookies included) between runs
+            lean (bool): Block images, fonts, media and tracker requests that the
+                scraper never reads (see BLOCKED_URL_PATTERNS)
+            search_mode (str): 'url' (build result page URLs and paginate by
+                offset) or 'form' (search form, infinite scroll, "See more jobs")
+            engine (str): 'selenium', 'http' (no browser) or 'auto' (http with
+                fallback to the browser)
         """
-        self.options = webdriver.ChromeOptions()
-        if headless:
-            self.options.add_argument('--headless')
-        self.options.add_argument('--no-sandbox')
-        self.options.add_argument('--disable-dev-shm-usage')
-        self.options.add_argument('--disable-blink-features=AutomationControlled')
-        self.options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        self.options.add_experimental_option('useAutomationExtension', False)
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{search_mode}'. Choose from: {', '.join(SEARCH_MODES)}")
+        if engine not in SEARCH_ENGINES:
+            raise ValueError(f"Unknown search engine '{engine}'. Choose from: {', '.join(SEARCH_ENGINES)}")
+        # Selenium, pandas and openpyxl are imported only where they are used
+        # so importing this module, and HTTP-only runs, stay cheap
+        self.headless = headless
+        self.cookies_file = cookies_file
+        self.profile_dir = profile_dir
+        self.lean = lean
+        self.search_mode = search_mode
+        self.engine = engine
         self.driver = None
+        # Selector hit rates, persisted between runs
+        self.selectors = SelectorRegistry()
+        self.http_search = None
+        self._http_refused = False
+        self._credentials = (None, None)
         self.jobs = []
+        self.search_stats = []
+
+    def _chrome_options(self):
+        """Chrome options for the scraping browser"""
+        from selenium import webdriver
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        if self.lean:
+            options.add_experimental_option("prefs", LEAN_CHROME_PREFS)
+            options.add_argument('--blink-settings=imagesEnabled=false')
+        if self.profile_dir:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            options.add_argument(f"--user-data-dir={os.path.abspath(self.profile_dir)}")
+        return options
 
     def start_driver(self):
         """Initialize the Chrome driver"""
+        from selenium import webdriver
         try:
-            self.driver = webdriver.Chrome(options=self.options)
+            self.driver = webdriver.Chrome(options=self._chrome_options())
             self.driver.maximize_window()
+            if self.lean:
+                self.block_resources()
             print("Chrome driver started successfully")
         except Exception as e:
             print(f"Error starting driver: {e}")
             raise
 
+    def block_resources(self, patterns=None):
+        """
+        Block requests matching URL patterns for the rest of the session (Chrome DevTools)
+        
+        Args:
+            patterns (list): URL wildcard patterns (default: BLOCKED_URL_PATTERNS)
+        
+        Returns:
+            bool: True if blocking is active
+        """
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns or BLOCKED_URL_PATTERNS})
+            return True
+        except Exception as e:
+            # Image blocking through prefs still applies
+            print(f"Could not enable request blocking: {e}")
+            return False
+
+    def save_cookies(self):
+        """
+        Save the browser's LinkedIn cookies so the next run can skip login
+        
+        Returns:
+            int: Number of cookies saved
+        """
+        if not self.cookies_file or not self.driver:
+            return 0
+        cookies = self.driver.get_cookies()
+        os.makedirs(os.path.dirname(self.cookies_file) or ".", exist_ok=True)
+        tmp_path = self.cookies_file + ".tmp"
+        # Session cookies are credentials: keep them readable by the owner only
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'saved_at': time.time(), 'cookies': cookies}, f)
+        os.replace(tmp_path, self.cookies_file)
+        return len(cookies)
+
+    def load_cookies(self):
+        """
+        Restore saved LinkedIn cookies into the browser
+        
+        Returns:
+            int: Number of cookies restored (0 if none are saved or all expired)
+        """
+        if not self.cookies_file or not os.path.exists(self.cookies_file):
+            return 0
+        try:
+            with open(self.cookies_file, 'r', encoding='utf-8') as f:
+                cookies = json.load(f).get('cookies', [])
+        except (OSError, ValueError) as e:
+            print(f"Could not read saved session: {e}")
+            return 0
+        
+        now = time.time()
+        cookies = [c for c in cookies if not c.get('expiry') or c['expiry'] > now]
+        if not any(c.get('name') == 'li_at' for c in cookies):
+            return 0
+        
+        # Cookies can only be set for the domain currently loaded
+        self.driver.get(f"{LINKEDIN_HOME}/robots.txt")
+        restored = 0
+        for cookie in cookies:
+            cookie = {k: v for k, v in cookie.items() if k in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'expiry', 'sameSite')}
+            if cookie.get('sameSite') not in ('Strict', 'Lax', 'None'):
+                cookie.pop('sameSite', None)
+            if 'expiry' in cookie:
+                cookie['expiry'] = int(cookie['expiry'])
+            try:
+                self.driver.add_cookie(cookie)
+                restored += 1
+            except Exception:
+                continue
+        return restored
+
+    def is_logged_in(self):
+        """
+        Check whether the browser holds a valid LinkedIn session
+        
+        Without the li_at session cookie this returns False without any request;
+        otherwise one page load tells whether LinkedIn redirects to the login wall.
+        
+        Returns:
+            bool: True if the session is valid
+        """
+        if not any(c.get('name') == 'li_at' for c in self.driver.get_cookies()):
+            # The cookie is only visible on a linkedin.com page
+            if not self.driver.current_url.startswith(LINKEDIN_HOME):
+                self.driver.get(f"{LINKEDIN_HOME}/robots.txt")
+            if not any(c.get('name') == 'li_at' for c in self.driver.get_cookies()):
+                return False
+        self.driver.get(SESSION_CHECK_URL)
+        current_url = self.driver.current_url.lower()
+        return "linkedin.com" in current_url and not any(m in current_url for m in LOGGED_OUT_URL_MARKERS)
+
+    def ensure_logged_in(self, email=None, password=None):
+        """
+        Reuse the saved session if it is still valid, otherwise log in
+        
+        The Chrome profile (profile_dir) or saved cookies are tried first; the
+        full login flow (with its captcha handling) only runs when the session
+        has expired. Cookies are saved after a successful login.
+        
+        Args:
+            email (str): LinkedIn email (optional when a saved session exists)
+            password (str): LinkedIn password
+        
+        Returns:
+            bool: True if a saved session was reused
+        """
+        started = time.time()
+        restored = 0 if self.profile_dir else self.load_cookies()
+        if (self.profile_dir or restored) and self.is_logged_in():
+            print(f"Reusing saved LinkedIn session ({time.time() - started:.1f}s)")
+            return True
+        
+        if not (email and password):
+            print("Saved LinkedIn session is missing or expired and no credentials were given; "
+                  "continuing without login")
+            return False
+        
+        if restored:
+            print("Saved LinkedIn session expired, logging in again")
+        self.login(email, password)
+        if any(c.get('name') == 'li_at' for c in self.driver.get_cookies()):
+            saved = self.save_cookies()
+            if saved:
+                print(f"LinkedIn session saved ({saved} cookies)")
+        return False
+
     def login(self, email, password):
         """
         Login to LinkedIn with captcha detection
@@ -54,6 +312,8 @@ class LinkedInJobScraper:
             email (str): LinkedIn email
             password (str): LinkedIn password
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
         try:
             self.driver.get("https://www.linkedin.com/login")
             time.sleep(2)
@@ -133,40 +393,144 @@ class LinkedInJobScraper:
             print(f"Login error: {e}")
             raise
 
-    def search_jobs(self, titles, location, max_results=50):
+    def open_session(self, email=None, password=None):
+        """
+        Prepare the scraper for searching
+        
+        With the selenium engine the browser starts and logs in right away;
+        otherwise the credentials are kept and the browser only starts if a
+        search has to fall back to it.
+        
+        Args:
+            email (str): LinkedIn email
+            password (str): LinkedIn password
+        
+        Returns:
+            bool: True if a saved browser session was reused
+        """
+        self._credentials = (email, password)
+        if self.engine == 'selenium':
+            self.start_driver()
+            return self.ensure_logged_in(email, password)
+        print(f"Search engine '{self.engine}': the browser starts only if a search needs it")
+        return False
+
+    def _ensure_browser(self):
+        """Start the browser (and log in) the first time a search needs it"""
+        if self.driver is None:
+            self.start_driver()
+            self.ensure_logged_in(*self._credentials)
+
+    def _http_engine(self):
+        if self.http_search is None:
+            self.http_search = HTTPJobSearch()
+        return self.http_search
+
+    def search_jobs(self, titles, locations, max_results=50, quotas=None, filters=None, mode=None):
         """
-        Search for jobs on LinkedIn (supports multiple job titles)
+        Search for jobs on LinkedIn (supports multiple job titles and locations)
+        
+        Every title x location combination is searched in the same browser
+        session. Results are deduplicated across combinations by LinkedIn job ID.
         
         Args:
             titles (str or list): Job title(s) to search for (can be a single string or list of strings)
-            location (str): Location to search in
-            max_results (int): Maximum number of results per title to scrape (default: 50)
+            locations (str or list): Location(s) to search in (can be a single string or list of strings)
+            max_results (int): Maximum number of results per title/location combination (default: 50)
+            quotas (dict): Optional per-combination overrides of max_results, keyed by
+                (title, location) tuples
+            filters (dict): Optional search filters for URL mode (see search_urls.build_search_url)
+            mode (str): 'url' or 'form' (default: the scraper's search_mode)
+        
+        Returns:
+            list: Unique job dictionaries
         """
-        # Convert single title to list
+        mode = mode or self.search_mode
+        if filters and mode != 'url' and self.engine == 'selenium':
+            print("Note: search filters are only applied in 'url' search mode")
+        # Convert single title/location to list
         if isinstance(titles, str):
             titles = [titles]
+        if isinstance(locations, str):
+            locations = [locations]
+        quotas = quotas or {}
         
-        all_jobs = []
+        index = JobIndex()
+        self.search_stats = []
         
-        for title in titles:
-            print(f"\nSearching for '{title}' jobs in '{location}'...")
-            title_jobs = self._search_single_title(title, location, max_results)
-            all_jobs.extend(title_jobs)
-            print(f"Found {len(title_jobs)} jobs for '{title}'")
-        
-        # Remove duplicates based on link
-        seen_links = set()
-        unique_jobs = []
-        for job in all_jobs:
-            job_link = job.get('link', '')
-            if job_link and job_link not in seen_links:
-                seen_links.add(job_link)
-                unique_jobs.append(job)
+        for location in locations:
+            for title in titles:
+                quota = quotas.get((title, location), max_results)
+                print(f"\nSearching for '{title}' jobs in '{location}' (quota: {quota})...")
+                started = time.time()
+                stats = {'title': title, 'location': location, 'quota': quota, 'mode': mode,
+                         'engine': None, 'found': 0, 'new': 0, 'duplicates': 0, 'error': None}
+                try:
+                    title_jobs = self._search_combination(title, location, quota, filters, mode, stats)
+                except Exception as e:
+                    print(f"Search failed for '{title}' in '{location}': {e}")
+                    title_jobs = []
+                    stats['error'] = str(e)
+                
+                # Remove duplicates based on LinkedIn job ID (falls back to normalized link)
+                for job in title_jobs:
+                    if job in index:
+                        stats['duplicates'] += 1
+                        continue
+                    job['search_title'] = title
+                    job['search_location'] = location
+                    if index.add(job):
+                        stats['new'] += 1
+                    else:
+                        stats['duplicates'] += 1
+                
+                stats['found'] = len(title_jobs)
+                stats['seconds'] = round(time.time() - started, 2)
+                self.search_stats.append(stats)
+                print(f"Found {stats['found']} jobs for '{title}' in '{location}' "
+                      f"({stats['new']} new, {stats['duplicates']} duplicates, {stats['seconds']}s)")
         
-        self.jobs = unique_jobs
+        self.jobs = index.jobs()
+        self.print_search_report()
         print(f"\nTotal unique jobs collected: {len(self.jobs)}")
         return self.jobs
     
+    def _search_combination(self, title, location, quota, filters, mode, stats):
+        """Search one title/location with the configured engine, falling back to the browser"""
+        if self.engine == 'http' or (self.engine == 'auto' and not self._http_refused):
+            stats['engine'] = 'http'
+            try:
+                jobs = self._http_engine().search(title, location, quota, filters, stats)
+                if jobs or self.engine == 'http':
+                    return jobs
+                # An empty first page is often an auth wall or throttling page
+                # served with status 200; let the logged-in browser check
+                print(f"HTTP search found no jobs for '{title}' in '{location}'; retrying in the browser")
+            except HTTPSearchError as e:
+                if self.engine == 'http':
+                    raise
+                # Refusals usually last; skip HTTP for the rest of the run
+                self._http_refused = True
+                print(f"HTTP search unavailable ({e}); falling back to the browser")
+        stats['engine'] = 'selenium'
+        self._ensure_browser()
+        if mode == 'url':
+            return self._search_by_url(title, location, quota, filters, stats)
+        return self._search_single_title(title, location, quota)
+
+    def print_search_report(self):
+        """Print per-combination results and timing for the last search_jobs call"""
+        if not self.search_stats:
+            return
+        print("\n" + "-"*80)
+        print(f"{'Title':<30} {'Location':<20} {'Engine':<8} {'Found':>6} {'New':>5} {'Secs':>7}")
+        print("-"*80)
+        for stats in self.search_stats:
+            print(f"{stats['title'][:30]:<30} {stats['location'][:20]:<20} {stats.get('engine') or '-':<8} "
+                  f"{stats['found']:>6} {stats['new']:>5} {stats['seconds']:>7.1f}"
+                  + ("  (error)" if stats['error'] else ""))
+        print("-"*80)
+    
     def _search_single_title(self, title, location, max_results=50):
         """
         Search for a single job title on LinkedIn
@@ -179,28 +543,24 @@ class LinkedInJobScraper:
         Returns:
             list: List of job dictionaries
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.support.ui import WebDriverWait
         try:
             # Navigate to jobs page
             self.driver.get("https://www.linkedin.com/jobs/")
             time.sleep(3)
             
-            # Find and fill job title search box (try multiple selectors)
+            # Find and fill job title search box (selectors tried in hit-rate order;
+            # wait for whichever appears first instead of up to 5s per selector)
             title_input = None
-            title_selectors = [
-                "input[aria-label*='Search jobs']",
-                "input[aria-label*='Search by title']",
-                "input.jobs-search-box__text-input[aria-label*='Search']",
-                "input[placeholder*='Search jobs']"
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    title_input = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    break
-                except:
-                    continue
+            try:
+                WebDriverWait(self.driver, 10).until(lambda driver: self.selectors.find(
+                    driver, 'search_title_input', SELECTORS['search_title_input'], record=False)[0])
+                title_input, _ = self.selectors.find(self.driver, 'search_title_input',
+                                                     SELECTORS['search_title_input'])
+            except Exception:
+                pass
             
             if not title_input:
                 raise Exception("Could not find job title search input")
@@ -209,21 +569,9 @@ class LinkedInJobScraper:
             title_input.send_keys(title)
             time.sleep(1)
             
-            # Find and fill location search box (try multiple selectors)
-            location_input = None
-            location_selectors = [
-                "input[aria-label*='City, state, or zip code']",
-                "input[aria-label*='Location']",
-                "input.jobs-search-box__text-input[aria-label*='Location']",
-                "input[placeholder*='Location']"
-            ]
-            
-            for selector in location_selectors:
-                try:
-                    location_input = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except:
-                    continue
+            # Find and fill location search box
+            location_input, _ = self.selectors.find(self.driver, 'search_location_input',
+                                                    SELECTORS['search_location_input'])
             
             if not location_input:
                 raise Exception("Could not find location search input")
@@ -237,24 +585,13 @@ class LinkedInJobScraper:
             time.sleep(5)
             
             # Scroll and collect jobs
-            title_jobs = []
+            title_jobs = JobIndex()
             collected_count = 0
             last_height = self.driver.execute_script("return document.body.scrollHeight")
             
             while collected_count < max_results:
                 # Get current page jobs (try multiple selectors)
-                job_cards = []
-                job_selectors = [
-                    "div.job-search-card",
-                    "li.jobs-search-results__list-item",
-                    "div[data-job-id]",
-                    "article.job-card-container"
-                ]
-                
-                for selector in job_selectors:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if job_cards:
-                        break
+                job_cards = self._find_job_cards()
                 
                 for card in job_cards:
                     if collected_count >= max_results:
@@ -263,10 +600,8 @@ class LinkedInJobScraper:
                     try:
                         job_data = self._extract_job_data(card)
                         if job_data:
-                            # Check for duplicates by link
-                            job_link = job_data.get('link', '')
-                            if job_link and not any(j.get('link') == job_link for j in title_jobs):
-                                title_jobs.append(job_data)
+                            # Check for duplicates by job ID
+                            if title_jobs.add(job_data):
                                 collected_count += 1
                                 print(f"Collected job {collected_count}/{max_results}: {job_data.get('title', 'N/A')}")
                     except Exception as e:
@@ -292,110 +627,143 @@ class LinkedInJobScraper:
                 if collected_count >= max_results:
                     break
             
-            return title_jobs
+            return title_jobs.jobs()
             
         except Exception as e:
             print(f"Error searching jobs: {e}")
             raise
 
+    def _find_job_cards(self, record=True):
+        """Job card elements on the current page (first selector that matches)"""
+        job_cards, _ = self.selectors.find(self.driver, 'job_card', SELECTORS['job_card'],
+                                           multiple=True, record=record)
+        return job_cards
+
+    def _load_result_page(self, url, timeout=10):
+        """
+        Open a results page and wait until its job cards are rendered
+
+        The logged-in results list only renders cards as they scroll into view,
+        so the list is scrolled until the card count stops growing.
+
+        Returns:
+            list: Job card elements
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+        self.driver.get(url)
+        try:
+            # Polling while the page loads is not counted in the selector statistics
+            WebDriverWait(self.driver, timeout).until(lambda driver: self._find_job_cards(record=False))
+        except Exception:
+            return []
+        job_cards = self._find_job_cards()
+        for _ in range(10):
+            self.driver.execute_script(
+                "var cards = arguments[0]; if (cards.length) cards[cards.length - 1].scrollIntoView();", job_cards)
+            time.sleep(0.3)
+            more_cards = self._find_job_cards()
+            if len(more_cards) <= len(job_cards):
+                break
+            job_cards = more_cards
+        return job_cards
+
+    def _search_by_url(self, title, location, max_results=50, filters=None, stats=None):
+        """
+        Search for a single job title by loading result pages directly
+
+        Each page is opened from its own URL (keywords, location, filters and
+        `start` offset), so no search form, scrolling or "See more jobs" clicks
+        are needed and pages do not depend on each other.
+
+        Args:
+            title (str): Job title to search for
+            location (str): Location to search in
+            max_results (int): Maximum number of results to scrape
+            filters (dict): Optional search filters (see search_urls.build_search_url)
+            stats (dict): Optional stats dict; 'pages' is set to the pages loaded
+
+        Returns:
+            list: List of job dictionaries
+        """
+        title_jobs = JobIndex()
+        pages = 0
+        for start in page_offsets(max_results):
+            url = build_search_url(title, location, filters, start=start)
+            job_cards = self._load_result_page(url)
+            pages += 1
+            added = 0
+            for card in job_cards:
+                if len(title_jobs) >= max_results:
+                    break
+                job_data = self._extract_job_data(card)
+                if job_data and title_jobs.add(job_data):
+                    added += 1
+                    print(f"Collected job {len(title_jobs)}/{max_results}: {job_data.get('title', 'N/A')}")
+            # A short, empty or fully repeated page means the results ran out
+            if len(job_cards) < RESULTS_PER_PAGE or not added or len(title_jobs) >= max_results:
+                break
+        if stats is not None:
+            stats['pages'] = pages
+        return title_jobs.jobs()
+
     def _extract_job_data(self, card):
         """
         Extract job data from a job card element
         
+        Each field's selectors are tried in hit-rate order (see SelectorRegistry),
+        so cards of the layout LinkedIn currently serves need one lookup per field.
+        
         Args:
             card: Selenium WebElement representing a job card
             
         Returns:
             dict: Job data dictionary
         """
+        find = self.selectors.find
         try:
             job_data = {}
             
-            # Title (try multiple selectors)
-            title_selectors = [
-                "h3.base-search-card__title a",
-                "h3.job-card-list__title a",
-                "a.job-card-list__title-link",
-                "h3 a[data-control-name='job_card_title_link']"
-            ]
-            for selector in title_selectors:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    job_data['title'] = title_elem.text.strip()
-                    job_data['link'] = title_elem.get_attribute('href')
-                    break
-                except:
-                    continue
-            if 'title' not in job_data:
+            # Title
+            title_elem, _ = find(card, 'card_title', SELECTORS['card_title'])
+            if title_elem:
+                job_data['title'] = title_elem.text.strip()
+                job_data['link'] = title_elem.get_attribute('href')
+            else:
                 job_data['title'] = "N/A"
                 job_data['link'] = "N/A"
             
-            # Company (try multiple selectors)
-            company_selectors = [
-                "h4.base-search-card__subtitle a",
-                "h4.job-card-container__company-name a",
-                "a.job-card-container__link",
-                "span.job-card-container__primary-description"
-            ]
-            for selector in company_selectors:
-                try:
-                    company_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    job_data['company'] = company_elem.text.strip()
-                    job_data['company_link'] = company_elem.get_attribute('href') or "N/A"
+            # Job ID from the card's data-job-id attribute, falling back to the link
+            job_id = None
+            for attribute in ('data-job-id', 'data-entity-urn'):
+                job_id = extract_job_id(card.get_attribute(attribute))
+                if job_id:
                     break
-                except:
-                    continue
-            if 'company' not in job_data:
+            job_data['job_id'] = job_id or extract_job_id(job_data['link'])
+            if job_data['link'] in (None, "", "N/A") and job_data['job_id']:
+                job_data['link'] = canonical_job_url(job_data['job_id'])
+            job_data['link'] = normalize_job_url(job_data['link']) or "N/A"
+            
+            # Company
+            company_elem, _ = find(card, 'card_company', SELECTORS['card_company'])
+            if company_elem:
+                job_data['company'] = company_elem.text.strip()
+                job_data['company_link'] = company_elem.get_attribute('href') or "N/A"
+            else:
                 job_data['company'] = "N/A"
                 job_data['company_link'] = "N/A"
             
-            # Location (try multiple selectors)
-            location_selectors = [
-                "span.job-search-card__location",
-                "li.job-card-container__metadata-item",
-                "span.job-card-container__metadata-item"
-            ]
-            for selector in location_selectors:
-                try:
-                    location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    job_data['location'] = location_elem.text.strip()
-                    break
-                except:
-                    continue
-            if 'location' not in job_data:
-                job_data['location'] = "N/A"
-            
-            # Posted date (try multiple selectors)
-            date_selectors = [
-                "time.job-search-card__listdate",
-                "time.job-card-container__listed-date",
-                "time[datetime]"
-            ]
-            for selector in date_selectors:
-                try:
-                    date_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    job_data['posted_date'] = date_elem.get_attribute('datetime') or date_elem.text.strip()
-                    break
-                except:
-                    continue
-            if 'posted_date' not in job_data:
-                job_data['posted_date'] = "N/A"
-            
-            # Description snippet (try multiple selectors)
-            desc_selectors = [
-                "p.base-search-card__snippet",
-                "p.job-card-container__description",
-                "div.job-card-container__description"
-            ]
-            for selector in desc_selectors:
-                try:
-                    desc_elem = card.find_element(By.CSS_SELECTOR, selector)
-                    job_data['description_snippet'] = desc_elem.text.strip()
-                    break
-                except:
-                    continue
-            if 'description_snippet' not in job_data:
-                job_data['description_snippet'] = "N/A"
+            # Location
+            location_elem, _ = find(card, 'card_location', SELECTORS['card_location'])
+            job_data['location'] = location_elem.text.strip() if location_elem else "N/A"
+            
+            # Posted date
+            date_elem, _ = find(card, 'card_date', SELECTORS['card_date'])
+            job_data['posted_date'] = ((date_elem.get_attribute('datetime') or date_elem.text.strip())
+                                       if date_elem else "N/A")
+            
+            # Description snippet
+            desc_elem, _ = find(card, 'card_snippet', SELECTORS['card_snippet'])
+            job_data['description_snippet'] = desc_elem.text.strip() if desc_elem else "N/A"
             
             job_data['scraped_at'] = datetime.now().isoformat()
             
@@ -416,6 +784,7 @@ class LinkedInJobScraper:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"jobs_{timestamp}.json"
         
+        ensure_output_dirs()
         filepath = os.path.join(JOBS_DIR, filename)
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(self.jobs, f, indent=2, ensure_ascii=False)
@@ -434,6 +803,7 @@ class LinkedInJobScraper:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"jobs_{timestamp}.txt"
         
+        ensure_output_dirs()
         filepath = os.path.join(JOBS_DIR, filename)
         with open(filepath, 'w', encoding='utf-8') as f:
             for i, job in enumerate(self.jobs, 1):
@@ -458,7 +828,7 @@ class LinkedInJobScraper:
         Args:
             filename (str): Optional filename, defaults to timestamp-based name
             max_results (int): Maximum number of results to export (default: 50)
-            cover_letters (dict): Dictionary mapping job links to cover letters
+            cover_letters (dict): Dictionary mapping job IDs (see job_identity.job_key) to cover letters
         """
         if not self.jobs:
             print("No jobs to export")
@@ -471,29 +841,19 @@ class LinkedInJobScraper:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"jobs_{timestamp}.xlsx"
         
+        ensure_output_dirs()
         filepath = os.path.join(OUTPUT_DIR, filename)
         
         # Prepare data for XLSX
-        xlsx_data = []
-        for job in jobs_to_export:
-            job_link = job.get('link', '')
-            cover_letter = cover_letters.get(job_link, 'N/A') if cover_letters else 'N/A'
-            
-            xlsx_data.append({
-                'Title': job.get('title', 'N/A'),
-                'Company': job.get('company', 'N/A'),
-                'Location': job.get('location', 'N/A'),
-                'Posted Date': job.get('posted_date', 'N/A'),
-                'Link': job_link,
-                'Description Snippet': job.get('description_snippet', 'N/A'),
-                'Recommended Cover Letter': cover_letter,
-                'Scraped At': job.get('scraped_at', 'N/A')
-            })
+        xlsx_data = [xlsx_row(job, cover_letters.get(job_key(job)) if cover_letters else None)
+                     for job in jobs_to_export]
+        
+        import pandas as pd
+        from openpyxl.utils import get_column_letter
         
         df = pd.DataFrame(xlsx_data)
         
         # Create Excel writer with formatting
-        from openpyxl.utils import get_column_letter
         
         with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
             df.to_excel(writer, index=False, sheet_name='Jobs')
@@ -513,10 +873,39 @@ class LinkedInJobScraper:
         print(f"Exported {len(jobs_to_export)} jobs to {filepath}")
         return filepath
 
+    def export_to_tracker(self, path=TRACKER_FILE, max_results=None, cover_letters=None):
+        """
+        Upsert jobs into the master tracker workbook (see job_tracker.JobTracker)
+        
+        New jobs are appended, changed ones updated in place, and columns the
+        user added (status, notes, ...) are left untouched.
+        
+        Args:
+            path (str): Tracker workbook path
+            max_results (int): Maximum number of jobs to upsert (default: all)
+            cover_letters (dict): Dictionary mapping job IDs (see job_identity.job_key) to cover letters
+            
+        Returns:
+            dict: Tracker stats (new, updated, unchanged, written), or None without jobs
+        """
+        if not self.jobs:
+            print("No jobs to export")
+            return None
+        rows = [xlsx_row(job, cover_letters.get(job_key(job)) if cover_letters else None)
+                for job in self.jobs[:max_results]]
+        return JobTracker(path).upsert(rows)
+
     def close(self):
-        """Close the browser driver"""
+        """Close the browser driver and the HTTP search session, and save selector statistics"""
+        if self.selectors.attempts:
+            self.selectors.print_report()
+            self.selectors.save()
+        if self.http_search:
+            self.http_search.close()
+            self.http_search = None
         if self.driver:
             self.driver.quit()
+            self.driver = None
             print("Browser closed")
 
 
@@ -0,0 +1,304 @@
+"""
+Pluggable chat-completion backends for LLMHelper
+
+- groq:   Groq cloud API (default)
+- openai: any OpenAI-compatible server (vLLM, llama.cpp, Ollama, LM Studio, ...)
+- mock:   deterministic offline completions with simulated latency and token rate
+- replay: record/replay completions to a JSONL cassette file
+
+All backends return a Completion, and HTTP failures surface as exceptions with
+status_code and response.headers so the adaptive rate controller can react to
+429s the same way for every provider.
+"""
+import os
+import json
+import time
+import random
+import hashlib
+import threading
+
+DEFAULT_MODEL = "openai/gpt-oss-120b"
+
+
+class Completion:
+    """Result of one chat completion"""
+
+    def __init__(self, text, model, input_tokens=0, output_tokens=0, latency=0.0,
+                 finish_reason="stop", headers=None):
+        self.text = text
+        self.model = model
+        self.input_tokens = input_tokens
+        self.output_tokens = output_tokens
+        self.latency = latency
+        self.finish_reason = finish_reason
+        self.headers = headers or {}
+
+    def to_dict(self):
+        return {'text': self.text, 'model': self.model, 'input_tokens': self.input_tokens,
+                'output_tokens': self.output_tokens, 'latency': self.latency,
+                'finish_reason': self.finish_reason}
+
+
+class _ErrorResponse:
+    def __init__(self, status_code, headers):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class BackendHTTPError(Exception):
+    """HTTP error from a backend, shaped like SDK errors (status_code, response.headers)"""
+
+    def __init__(self, status_code, message="", headers=None):
+        super().__init__(f"HTTP {status_code}: {message}" if message else f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = _ErrorResponse(status_code, headers)
+
+
+class LLMBackend:
+    """Base class: one chat completion per complete() call"""
+    name = "base"
+
+    def complete(self, model, messages, temperature=0.7, max_tokens=1000, stop=None):
+        """
+        Run one chat completion
+
+        Args:
+            model (str): Model identifier
+            messages (list): Chat messages ({"role", "content"} dicts)
+            temperature (float): Sampling temperature
+            max_tokens (int): Output token cap
+            stop (list): Optional stop sequences
+
+        Returns:
+            Completion: Generated text with token usage and latency
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class GroqBackend(LLMBackend):
+    name = "groq"
+
+    def __init__(self, api_key=None, base_url=None, timeout=60.0):
+        if not api_key:
+            raise ValueError("Groq API key is required. Please provide it when initializing LLMHelper or set it in config.")
+        from groq import Groq
+        # Retries are handled by the rate controller, not the SDK
+        self.client = Groq(api_key=api_key, base_url=base_url, max_retries=0, timeout=timeout)
+
+    def complete(self, model, messages, temperature=0.7, max_tokens=1000, stop=None):
+        started = time.monotonic()
+        options = {'stop': stop} if stop else {}
+        raw = self.client.chat.completions.with_raw_response.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **options
+        )
+        response = raw.parse()
+        usage = response.usage
+        return Completion(
+            text=response.choices[0].message.content or "",
+            model=model,
+            input_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+            output_tokens=getattr(usage, 'completion_tokens', 0) or 0,
+            latency=time.monotonic() - started,
+            finish_reason=response.choices[0].finish_reason,
+            headers=raw.headers,
+        )
+
+
+class OpenAICompatibleBackend(LLMBackend):
+    name = "openai"
+
+    def __init__(self, base_url="http://127.0.0.1:8000/v1", api_key=None, timeout=(5, 120)):
+        import requests
+        self.url = base_url.rstrip('/') + "/chat/completions"
+        self.timeout = timeout
+        self.session = requests.Session()
+        if api_key:
+            self.session.headers['Authorization'] = f"Bearer {api_key}"
+
+    def complete(self, model, messages, temperature=0.7, max_tokens=1000, stop=None):
+        payload = {'model': model, 'messages': messages, 'temperature': temperature, 'max_tokens': max_tokens}
+        if stop:
+            payload['stop'] = stop
+        started = time.monotonic()
+        response = self.session.post(self.url, json=payload, timeout=self.timeout)
+        if response.status_code >= 400:
+            raise BackendHTTPError(response.status_code, response.text[:200], response.headers)
+        body = response.json()
+        usage = body.get('usage') or {}
+        choice = body['choices'][0]
+        return Completion(
+            text=choice['message'].get('content') or "",
+            model=model,
+            input_tokens=usage.get('prompt_tokens', 0),
+            output_tokens=usage.get('completion_tokens', 0),
+            latency=time.monotonic() - started,
+            finish_reason=choice.get('finish_reason', 'stop'),
+            headers=response.headers,
+        )
+
+    def close(self):
+        self.session.close()
+
+
+_MOCK_WORDS = (
+    "experience team delivered reliable scalable services python data platform customers "
+    "impact ownership collaborated improved performance designed built shipped mentored "
+    "engineering product quality growth results passion role company mission opportunity"
+).split()
+
+
+class MockBackend(LLMBackend):
+    name = "mock"
+
+    def __init__(self, latency=0.2, tokens_per_second=150.0, prefill_tokens_per_second=0.0,
+                 output_tokens=350, rate_limit_rate=0.0, seed=0, model_profiles=None):
+        """
+        Deterministic offline backend
+
+        Args:
+            latency (float): Fixed latency per call in seconds (time to first token)
+            tokens_per_second (float): Simulated output token rate (0 = instant)
+            prefill_tokens_per_second (float): Simulated input processing rate (0 = free)
+            output_tokens (int): Tokens to generate (capped by max_tokens)
+            rate_limit_rate (float): Probability of raising a simulated HTTP 429
+            seed (int): Seed mixed into the per-prompt text generator
+            model_profiles (dict): Optional per-model overrides of latency and
+                tokens_per_second, e.g. {"llama-3.1-8b-instant": {"tokens_per_second": 600}}
+        """
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.prefill_tokens_per_second = prefill_tokens_per_second
+        self.output_tokens = output_tokens
+        self.rate_limit_rate = rate_limit_rate
+        self.seed = seed
+        self.model_profiles = model_profiles or {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def complete(self, model, messages, temperature=0.7, max_tokens=1000, stop=None):
+        with self._lock:
+            rate_limited = self._rng.random() < self.rate_limit_rate
+        if rate_limited:
+            raise BackendHTTPError(429, "simulated rate limit", {'retry-after': '0.5'})
+
+        digest = hashlib.sha256(json.dumps([model, messages], sort_keys=True).encode('utf-8')).hexdigest()
+        rng = random.Random(f"{self.seed}:{digest}")
+        n_tokens = min(self.output_tokens, max_tokens)
+        words = [rng.choice(_MOCK_WORDS) for _ in range(max(1, int(n_tokens * 0.75)))]
+        paragraphs = [" ".join(words[i:i + 60]).capitalize() + "." for i in range(0, len(words), 60)]
+        text = "\n\n".join(paragraphs)
+
+        input_tokens = sum(len(str(m.get('content', '')).split()) for m in messages)
+        profile = self.model_profiles.get(model, {})
+        delay = profile.get('latency', self.latency)
+        tokens_per_second = profile.get('tokens_per_second', self.tokens_per_second)
+        if tokens_per_second:
+            delay += n_tokens / tokens_per_second
+        if self.prefill_tokens_per_second:
+            delay += input_tokens / self.prefill_tokens_per_second
+        time.sleep(delay)
+        return Completion(text, model, input_tokens, n_tokens, delay,
+                          finish_reason="length" if n_tokens == max_tokens else "stop")
+
+
+class ReplayBackend(LLMBackend):
+    name = "replay"
+
+    def __init__(self, cassette, inner=None, mode="auto", simulate_latency=False):
+        """
+        Record/replay completions keyed by a hash of the request
+
+        Args:
+            cassette (str): JSONL cassette file path
+            inner (LLMBackend): Backend used to record misses (required for record/auto)
+            mode (str): 'replay' (misses raise KeyError), 'record' (always call inner
+                and append) or 'auto' (replay hits, record misses)
+            simulate_latency (bool): Sleep for the recorded latency on replay
+        """
+        if mode not in ('replay', 'record', 'auto'):
+            raise ValueError(f"Unknown replay mode '{mode}'")
+        if mode != 'replay' and inner is None:
+            raise ValueError("Recording needs an inner backend")
+        self.cassette = cassette
+        self.inner = inner
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self._lock = threading.Lock()
+        self._entries = {}
+        if os.path.exists(cassette):
+            with open(cassette, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry['key']] = entry['completion']
+
+    @staticmethod
+    def request_key(model, messages, temperature, max_tokens, stop):
+        request = {'model': model, 'messages': messages, 'temperature': temperature,
+                   'max_tokens': max_tokens, 'stop': stop}
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def complete(self, model, messages, temperature=0.7, max_tokens=1000, stop=None):
+        key = self.request_key(model, messages, temperature, max_tokens, stop)
+        if self.mode != 'record':
+            recorded = self._entries.get(key)
+            if recorded is not None:
+                if self.simulate_latency:
+                    time.sleep(recorded.get('latency', 0.0))
+                return Completion(**recorded)
+            if self.mode == 'replay':
+                raise KeyError(f"No recorded completion for request {key[:12]} in {self.cassette}")
+
+        completion = self.inner.complete(model, messages, temperature, max_tokens, stop)
+        with self._lock:
+            self._entries[key] = completion.to_dict()
+            directory = os.path.dirname(self.cassette)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.cassette, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'key': key, 'completion': completion.to_dict()}, ensure_ascii=False) + "\n")
+        return completion
+
+    def close(self):
+        if self.inner:
+            self.inner.close()
+
+
+BACKENDS = {
+    'groq': GroqBackend,
+    'openai': OpenAICompatibleBackend,
+    'mock': MockBackend,
+    'replay': ReplayBackend,
+}
+
+
+def create_backend(name="groq", **options):
+    """
+    Create a backend by name
+
+    For 'replay', pass cassette= and optionally record_with= (the name of the
+    backend used to record misses) plus that backend's options.
+
+    Args:
+        name (str): 'groq', 'openai', 'mock' or 'replay'
+        **options: Backend constructor options
+
+    Returns:
+        LLMBackend: Backend instance
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown LLM backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+    if name == 'replay':
+        record_with = options.pop('record_with', None)
+        replay_options = {k: options.pop(k) for k in ('cassette', 'mode', 'simulate_latency') if k in options}
+        inner = create_backend(record_with, **options) if record_with else None
+        replay_options.setdefault('mode', 'auto' if inner else 'replay')
+        return ReplayBackend(inner=inner, **replay_options)
+    return BACKENDS[name](**options)
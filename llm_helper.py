@@ -1,26 +1,259 @@
 """
 LLM Helper for generating cover letters and customizing CV sections using Groq API
+(or another backend from llm_backends.py)
 """
-from groq import Groq
-from config import GROQ_API_KEY, COVER_LETTERS_DIR, CV_SECTIONS_DIR
-import os
-from datetime import datetime
+from config import GROQ_API_KEY, LLM_BACKEND, LLM_BASE_URL, LLM_CASSETTE, MODEL_ROUTES
+from llm_backends import create_backend, DEFAULT_MODEL
+from prompt_compression import (compress_job_description, fit_to_budget, count_tokens,
+                                CONTEXT_TOKEN_BUDGET, CV_TOKEN_BUDGET)
+from cv_parser import parse_cv, select_cv_context
+from rate_control import AdaptiveConcurrencyController, is_transient
+from length_control import (END_MARKER, CV_ABOUT_ME_WORDS, cover_letter_target_words, token_cap,
+                            check_output, count_words, percentile)
+from artifact_writer import write_artifact
+import threading
+
+
+def job_description(job_data):
+    """
+    Best available description for a job: the full description fetched from the
+    job page (see job_details.py) if present, otherwise the search card snippet
+    """
+    return job_data.get('description') or job_data.get('description_snippet', '')
+
+
+class LLMError(Exception):
+    """Raised when an LLM call still fails after retries"""
+
+
+# Retries on a model before failing over to the next one in its route
+FALLBACK_RETRIES = 1
 
 
 class LLMHelper:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, base_url=None, rate_controller=None, backend=None, model=None, routes=None,
+                 artifact_writer=None):
         """
-        Initialize Groq client
+        Initialize the LLM backend
         
         Args:
             api_key (str): Groq API key (if None, uses config)
+            base_url (str): Optional API base URL (e.g. a local fake server for testing)
+            rate_controller (AdaptiveConcurrencyController): Optional shared controller;
+                a default one is created if omitted
+            backend (LLMBackend or str): Backend instance or name ('groq', 'openai', 'mock',
+                'replay'); defaults to LLM_BACKEND from config
+            model (str): Use this model for every operation instead of the routes
+            routes (dict): Operation -> list of models (preferred first, then fallbacks);
+                defaults to MODEL_ROUTES from config
+            artifact_writer (ArtifactWriter): Optional background writer for saved
+                cover letters and CV sections (default: write each file directly)
+        """
+        if backend is None or isinstance(backend, str):
+            backend = self._create_backend(backend or LLM_BACKEND, api_key or GROQ_API_KEY,
+                                           base_url or LLM_BASE_URL)
+        self.backend = backend
+        self.rate_controller = rate_controller or AdaptiveConcurrencyController()
+        self.model = model or DEFAULT_MODEL  # Using GPT-OSS-120B model on Groq
+        if model:
+            self.routes = {operation: [model] for operation in MODEL_ROUTES}
+        else:
+            self.routes = {operation: list(models) for operation, models in (routes or MODEL_ROUTES).items()}
+        self.artifact_writer = artifact_writer
+        self.model_stats = {}
+        self.output_stats = {}
+        self._stats_lock = threading.Lock()
+        self.prompt_stats = {'prompts': 0, 'prompt_tokens': 0,
+                             'description_tokens_raw': 0, 'description_tokens_sent': 0}
+
+    @staticmethod
+    def _create_backend(name, api_key, base_url):
+        if name == 'groq':
+            return create_backend('groq', api_key=api_key, base_url=base_url)
+        if name == 'openai':
+            return create_backend('openai', base_url=base_url or "http://127.0.0.1:8000/v1", api_key=api_key)
+        if name == 'replay':
+            # Record misses through Groq when a key is available, otherwise replay only
+            if api_key:
+                return create_backend('replay', cassette=LLM_CASSETTE, record_with='groq',
+                                      api_key=api_key, base_url=base_url)
+            return create_backend('replay', cassette=LLM_CASSETTE)
+        return create_backend(name)
+
+    def _compress_description(self, job_data, profile_text):
+        """Compress the job description for a prompt and record the token savings"""
+        raw = job_description(job_data)
+        compressed = compress_job_description(raw, profile_text)
+        raw_tokens, sent_tokens = count_tokens(raw), count_tokens(compressed)
+        with self._stats_lock:
+            self.prompt_stats['description_tokens_raw'] += raw_tokens
+            self.prompt_stats['description_tokens_sent'] += sent_tokens
+        return compressed
+
+    def _record_prompt(self, messages):
+        tokens = sum(count_tokens(m['content']) for m in messages)
+        with self._stats_lock:
+            self.prompt_stats['prompts'] += 1
+            self.prompt_stats['prompt_tokens'] += tokens
+
+    def _record_model_call(self, model, completion=None, fallback=False):
+        with self._stats_lock:
+            stats = self.model_stats.setdefault(model, {'calls': 0, 'failures': 0, 'fallbacks': 0, 'latency': 0.0,
+                                                        'input_tokens': 0, 'output_tokens': 0})
+            stats['fallbacks'] += int(fallback)
+            if completion is None:
+                stats['failures'] += 1
+                return
+            stats['calls'] += 1
+            stats['latency'] += completion.latency
+            stats['input_tokens'] += completion.input_tokens
+            stats['output_tokens'] += completion.output_tokens
+
+    def _record_output(self, operation, completion=None, status=None):
+        with self._stats_lock:
+            stats = self.output_stats.setdefault(operation, {'output_tokens': [], 'latency': [],
+                                                             'trimmed': 0, 'regenerated': 0})
+            if completion is not None:
+                stats['output_tokens'].append(completion.output_tokens)
+                stats['latency'].append(completion.latency)
+            if status in ('trimmed', 'regenerated'):
+                stats[status] += 1
+
+    def _chat(self, messages, temperature, max_tokens=None, operation=None, target_words=None, stop=None):
+        """
+        Run one chat completion under the adaptive rate controller
+        
+        The operation's route decides the model. When a model is rate limited or
+        times out after FALLBACK_RETRIES retries, the next model in the route is
+        tried; the last one gets the controller's full retry budget.
+        
+        Args:
+            messages (list): Chat messages
+            temperature (float): Sampling temperature
+            max_tokens (int): Output token cap (default: sized from target_words per model)
+            operation (str): Route name in self.routes (default: self.model only)
+            target_words (int): Expected output length in words
+            stop (list): Optional stop sequences
+        
+        Returns:
+            Completion: Generated text with token usage and latency
+        
+        Raises:
+            LLMError: If the call fails on every model
+        """
+        models = self.routes.get(operation) or [self.model]
+        for i, model in enumerate(models):
+            last = i == len(models) - 1
+            
+            cap = max_tokens or token_cap(target_words, model)
+            
+            def request():
+                completion = self.backend.complete(model, messages, temperature, cap, stop)
+                return completion, completion.headers
+            
+            try:
+                completion, _ = self.rate_controller.call_with_headers(
+                    request, max_retries=None if last else FALLBACK_RETRIES)
+            except Exception as e:
+                self._record_model_call(model, fallback=i > 0)
+                if last or not is_transient(e):
+                    raise LLMError(str(e)) from e
+                print(f"  → {model} unavailable ({e}), falling back to {models[i + 1]}")
+                continue
+            self._record_model_call(model, completion, fallback=i > 0)
+            self._record_output(operation, completion)
+            return completion
+
+    def _generate(self, messages, temperature, operation, target_words):
+        """
+        Generate text of about target_words words, validating the length
+        
+        The model is asked to finish with END_MARKER, which is also the stop
+        sequence. Output cut off by the token cap is trimmed to its last complete
+        paragraph; output that is empty or far off target is regenerated once.
+        
+        Returns:
+            str: Generated text
+        
+        Raises:
+            LLMError: If the call fails after retries
         """
-        api_key = api_key or GROQ_API_KEY
-        if not api_key:
-            raise ValueError("Groq API key is required. Please provide it when initializing LLMHelper or set it in config.")
+        completion = self._chat(messages, temperature, operation=operation, target_words=target_words,
+                                stop=[END_MARKER])
+        text, status = check_output(completion.text, target_words, completion.finish_reason)
+        if status == 'regenerate':
+            retry_messages, retry_words = messages, target_words
+            if completion.finish_reason == 'length':
+                # Cut off early (e.g. reasoning used up the cap): retry with a larger cap
+                retry_words = target_words * 2
+            elif text:
+                # Complete but far off target: ask for a rewrite at the right length
+                retry_messages = messages + [
+                    {"role": "assistant", "content": text},
+                    {"role": "user", "content": f"That is {count_words(text)} words. Rewrite it in about "
+                                                f"{target_words} words and finish with {END_MARKER}."}
+                ]
+            completion = self._chat(retry_messages, temperature, operation=operation, target_words=retry_words,
+                                    stop=[END_MARKER])
+            retry_text, _ = check_output(completion.text, target_words, completion.finish_reason)
+            # Keep the first attempt if the retry came back empty
+            text = retry_text or text
+        self._record_output(operation, status='regenerated' if status == 'regenerate' else status)
+        return text
+
+    def print_prompt_stats(self):
+        """Print prompt token usage and the savings from description compression"""
+        stats = self.prompt_stats
+        if not stats['prompts']:
+            return
+        saved = stats['description_tokens_raw'] - stats['description_tokens_sent']
+        print(f"  - LLM prompts: {stats['prompts']} "
+              f"(avg {stats['prompt_tokens'] // stats['prompts']} input tokens, "
+              f"{saved} description tokens saved by compression)")
+
+    def print_model_stats(self):
+        """Print per-model call counts, latency and token usage"""
+        if not self.model_stats:
+            return
+        print(f"  - LLM models:")
+        for model, stats in sorted(self.model_stats.items()):
+            calls = stats['calls']
+            avg_latency = stats['latency'] / calls if calls else 0.0
+            rate = stats['output_tokens'] / stats['latency'] if stats['latency'] else 0.0
+            print(f"      {model}: {calls} calls ({stats['fallbacks']} as fallback, {stats['failures']} failed), "
+                  f"avg {avg_latency:.2f}s, {stats['input_tokens']} in / {stats['output_tokens']} out tokens, "
+                  f"{rate:.0f} tokens/s")
+
+    def output_summary(self):
+        """
+        Output length and latency distribution per operation
         
-        self.client = Groq(api_key=api_key)
-        self.model = "openai/gpt-oss-120b"  # Using GPT-OSS-120B model on Groq
+        Returns:
+            dict: Operation -> {outputs, tokens_p50, tokens_p95, tokens_max, latency_p50, latency_p95, trimmed, regenerated}
+        """
+        summary = {}
+        with self._stats_lock:
+            for operation, stats in self.output_stats.items():
+                tokens, latency = stats['output_tokens'], stats['latency']
+                summary[operation] = {
+                    'outputs': len(tokens),
+                    'tokens_p50': percentile(tokens, 50),
+                    'tokens_p95': percentile(tokens, 95),
+                    'tokens_max': max(tokens) if tokens else 0,
+                    'latency_p50': round(percentile(latency, 50), 3),
+                    'latency_p95': round(percentile(latency, 95), 3),
+                    'trimmed': stats['trimmed'],
+                    'regenerated': stats['regenerated'],
+                }
+        return summary
+
+    def print_output_stats(self):
+        """Print the output token and latency distribution per operation"""
+        for operation, s in sorted(self.output_summary().items()):
+            print(f"  - {operation} outputs: {s['outputs']} "
+                  f"(tokens p50 {s['tokens_p50']} / p95 {s['tokens_p95']} / max {s['tokens_max']}, "
+                  f"latency p50 {s['latency_p50']:.2f}s / p95 {s['latency_p95']:.2f}s, "
+                  f"{s['trimmed']} trimmed, {s['regenerated']} regenerated)")
 
     def adapt_cover_letter(self, job_data, base_cover_letter, additional_context=None):
         """
@@ -33,11 +266,14 @@ class LLMHelper:
         
         Returns:
             str: Adapted cover letter
+        
+        Raises:
+            LLMError: If generation fails after retries
         """
         job_title = job_data.get('title', 'the position')
         company = job_data.get('company', 'your company')
         location = job_data.get('location', '')
-        description = job_data.get('description_snippet', '')
+        description = self._compress_description(job_data, base_cover_letter)
         job_link = job_data.get('link', '')
         
         # Build additional context string
@@ -50,7 +286,8 @@ class LLMHelper:
             if additional_context.get('motivation'):
                 context_parts.append(f"Why I'm particularly interested in this role: {additional_context['motivation']}")
         
-        additional_context_str = "\n".join(context_parts) if context_parts else "None"
+        additional_context_str = fit_to_budget("\n".join(context_parts), CONTEXT_TOKEN_BUDGET) if context_parts else "None"
+        target_words = cover_letter_target_words(base_cover_letter)
         
         prompt = f"""PROMPT:
 I need you to adapt my cover letter to perfectly match a job description I found on LinkedIn. Please analyze both documents and create a tailored cover letter that highlights the most relevant aspects of my experience for this specific position.
@@ -72,7 +309,7 @@ Instructions:
 3. Reorganize and rewrite my cover letter to emphasize the most relevant points for THIS specific position
 4. Use keywords and terminology from the job description naturally throughout the letter
 5. Maintain a professional tone that matches the company culture (as suggested by the job posting)
-6. Keep the letter concise (ideally 3-4 paragraphs, maximum 1 page)
+6. Keep the letter concise: about {target_words} words (3-4 paragraphs, maximum 1 page)
 7. Include a strong opening that shows genuine interest in this specific role and company
 8. Provide concrete examples that demonstrate I meet their requirements
 9. End with a compelling call to action
@@ -80,25 +317,19 @@ Instructions:
 Additional context (optional):
 {additional_context_str}
 
-Please provide the adapted cover letter in a format ready to copy and use in my application."""
+Please provide the adapted cover letter in a format ready to copy and use in my application, with no comments before or after it. Write {END_MARKER} on its own line right after the signature."""
 
+        messages = [
+            {"role": "system", "content": "You are a professional career coach and cover letter writing expert specializing in tailoring cover letters to specific job descriptions."},
+            {"role": "user", "content": prompt}
+        ]
+        self._record_prompt(messages)
+        
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional career coach and cover letter writing expert specializing in tailoring cover letters to specific job descriptions."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
-            
-            adapted_cover_letter = response.choices[0].message.content
-            return adapted_cover_letter
-            
-        except Exception as e:
+            return self._generate(messages, temperature=0.7, operation='cover_letter', target_words=target_words)
+        except LLMError as e:
             print(f"Error adapting cover letter: {e}")
-            return f"Error adapting cover letter: {str(e)}"
+            raise
 
     def customize_cv_about_me(self, job_data, current_about_me=None, entire_cv=None):
         """
@@ -111,10 +342,13 @@ Please provide the adapted cover letter in a format ready to copy and use in my
         
         Returns:
             str: Customized "About Me" section
+        
+        Raises:
+            LLMError: If generation fails after retries
         """
         job_title = job_data.get('title', 'the position')
         company = job_data.get('company', '')
-        description = job_data.get('description_snippet', '')
+        description = self._compress_description(job_data, entire_cv)
         
         if not current_about_me:
             current_about_me = """I am a dedicated professional with a passion for excellence and a proven track record of success. 
@@ -123,7 +357,8 @@ Please provide the adapted cover letter in a format ready to copy and use in my
         # Build prompt with CV context if available
         cv_context = ""
         if entire_cv:
-            cv_context = f"\n\nFull CV Context (for reference):\n{entire_cv[:2000]}"  # Limit CV context to avoid token limits
+            # Only the CV sections most relevant to this job, within the token budget
+            cv_context = f"\n\nRelevant CV Sections (for reference):\n{select_cv_context(parse_cv(entire_cv), job_data, CV_TOKEN_BUDGET)}"
         
         prompt = f"""You are a professional CV/resume consultant. Customize the "About Me" section of a CV to better match a specific job opportunity.
 
@@ -148,33 +383,38 @@ The customized section should:
 - Incorporate relevant keywords from the job description
 - Maintain the professional tone
 - Be specific and impactful
-- Not exceed 150 words
+- Not exceed {CV_ABOUT_ME_WORDS} words
 - Only mention skills, experiences, or achievements that are actually in the CV
 
+Reply with the section only and write {END_MARKER} right after it.
+
 Customized "About Me" Section:"""
 
+        messages = [
+            {"role": "system", "content": "You are a professional CV/resume consultant specializing in tailoring resumes to specific job opportunities."},
+            {"role": "user", "content": prompt}
+        ]
+        self._record_prompt(messages)
+        
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional CV/resume consultant specializing in tailoring resumes to specific job opportunities."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.6,
-                max_tokens=300
-            )
-            
-            customized_section = response.choices[0].message.content
-            return customized_section
-            
-        except Exception as e:
+            return self._generate(messages, temperature=0.6, operation='cv_about_me',
+                                  target_words=CV_ABOUT_ME_WORDS * 4 // 5)
+        except LLMError as e:
             print(f"Error customizing CV section: {e}")
-            return f"Error customizing CV section: {str(e)}"
+            raise
+
+    def _save_artifact(self, kind, text, job_data, filename=None):
+        if self.artifact_writer is not None:
+            return self.artifact_writer.submit(kind, text, job_data, filename)
+        return write_artifact(kind, text, job_data, filename)
 
     def save_cover_letter(self, cover_letter, job_data, filename=None):
         """
         Save cover letter to a text file
         
+        The file is named after the LinkedIn job ID. With an artifact writer
+        attached, the write is queued and done in a batch in the background.
+        
         Args:
             cover_letter (str): Cover letter text
             job_data (dict): Job information
@@ -183,28 +423,9 @@ Customized "About Me" Section:"""
         Returns:
             str: File path where cover letter was saved
         """
-        if not filename:
-            company = job_data.get('company', 'company').replace(' ', '_').replace('/', '_')
-            title = job_data.get('title', 'position').replace(' ', '_').replace('/', '_')[:30]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"cover_letter_{company}_{title}_{timestamp}.txt"
-        
-        filepath = os.path.join(COVER_LETTERS_DIR, filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("="*80 + "\n")
-            f.write("ADAPTED COVER LETTER\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Job Title: {job_data.get('title', 'N/A')}\n")
-            f.write(f"Company: {job_data.get('company', 'N/A')}\n")
-            f.write(f"Location: {job_data.get('location', 'N/A')}\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("\n" + "="*80 + "\n\n")
-            f.write(cover_letter)
-            f.write("\n\n" + "="*80 + "\n")
-            f.write(f"Job Link: {job_data.get('link', 'N/A')}\n")
-        
-        print(f"Cover letter saved to {filepath}")
+        filepath = self._save_artifact('cover_letter', cover_letter, job_data, filename)
+        if self.artifact_writer is None:
+            print(f"Cover letter saved to {filepath}")
         return filepath
 
     def save_cv_section(self, cv_section, job_data, filename=None):
@@ -219,28 +440,7 @@ Customized "About Me" Section:"""
         Returns:
             str: File path where CV section was saved
         """
-        if not filename:
-            company = job_data.get('company', 'company').replace(' ', '_').replace('/', '_')
-            title = job_data.get('title', 'position').replace(' ', '_').replace('/', '_')[:30]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"cv_about_me_{company}_{title}_{timestamp}.txt"
-        
-        filepath = os.path.join(CV_SECTIONS_DIR, filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("="*80 + "\n")
-            f.write("CUSTOMIZED CV - ABOUT ME SECTION\n")
-            f.write("="*80 + "\n\n")
-            f.write(f"Job Title: {job_data.get('title', 'N/A')}\n")
-            f.write(f"Company: {job_data.get('company', 'N/A')}\n")
-            f.write(f"Location: {job_data.get('location', 'N/A')}\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("\n" + "="*80 + "\n\n")
-            f.write("CUSTOMIZED 'ABOUT ME' SECTION:\n")
-            f.write("-"*80 + "\n\n")
-            f.write(cv_section)
-            f.write("\n\n" + "="*80 + "\n")
-            f.write(f"Job Link: {job_data.get('link', 'N/A')}\n")
-        
-        print(f"CV section saved to {filepath}")
+        filepath = self._save_artifact('cv_section', cv_section, job_data, filename)
+        if self.artifact_writer is None:
+            print(f"CV section saved to {filepath}")
         return filepath
@@ -2,14 +2,27 @@
 Main script to run the LinkedIn Job Scraper with LLM integration
 """
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from linkedin_scraper import LinkedInJobScraper
 from llm_helper import LLMHelper
+from job_identity import job_key
+from near_duplicates import group_near_duplicates, adapt_for_duplicate
+from job_ranking import rank_jobs
+from job_details import JobDetailFetcher
+from cv_parser import parse_cv
+from config import (LLM_BACKEND, ARTIFACT_FORMAT, COOKIES_FILE, CHROME_PROFILE_DIR, SEARCH_ENGINE, TRACKER_FILE,
+                    XLSX_PER_RUN, ensure_output_dirs)
+from artifact_writer import ArtifactWriter
+from profiling import StageProfiler, profiling_requested
 
 
 def main():
     """Main function to run the job scraper and generate cover letters/CV sections"""
     
+    ensure_output_dirs()
+    # Per-stage profiles and a summary at the end (--profile or JOBBOT_PROFILE=1)
+    profiler = StageProfiler(enabled=profiling_requested())
+    
     print("="*80)
     print("LinkedIn Job Scraper with AI-Powered Cover Letter & CV Customization")
     print("="*80)
@@ -18,11 +31,15 @@ def main():
     # Step 1: Get Groq API Key (FIRST STEP)
     print("STEP 1: Groq API Configuration")
     print("-"*80)
-    groq_api_key = input("Enter your Groq API key: ").strip()
-    
-    if not groq_api_key:
-        print("Error: Groq API key is required. Exiting...")
-        return
+    groq_api_key = None
+    if LLM_BACKEND == 'groq':
+        groq_api_key = input("Enter your Groq API key: ").strip()
+        
+        if not groq_api_key:
+            print("Error: Groq API key is required. Exiting...")
+            return
+    else:
+        print(f"Using the '{LLM_BACKEND}' LLM backend (LLM_BACKEND), no Groq API key needed")
     
     # API key will be passed directly to LLMHelper
     
@@ -51,35 +68,8 @@ def main():
     if not entire_cv:
         print("Warning: No CV provided. CV customization will be skipped.")
     
-    # Extract About Me section from CV if possible (for backward compatibility)
-    current_about_me = ""
-    if entire_cv:
-        # Try to extract About Me section (look for common headers)
-        about_me_keywords = ["about me", "about", "summary", "profile", "overview"]
-        lines = entire_cv.split('\n')
-        in_about_section = False
-        about_lines = []
-        
-        for i, line in enumerate(lines):
-            line_lower = line.lower().strip()
-            # Check if this line is an About Me header
-            if any(keyword in line_lower for keyword in about_me_keywords) and len(line.strip()) < 50:
-                in_about_section = True
-                continue
-            # Check if we hit another major section (usually capitalized or has colons)
-            if in_about_section:
-                if line.strip() and (line.strip().isupper() or ':' in line or line.strip().startswith('#')):
-                    # Might be a new section, but continue if it's short
-                    if len(line.strip()) < 50:
-                        break
-                about_lines.append(line)
-        
-        if about_lines:
-            current_about_me = '\n'.join(about_lines).strip()
-        else:
-            # If no About Me section found, use first paragraph or first few lines
-            first_paragraph = entire_cv.split('\n\n')[0] if '\n\n' in entire_cv else '\n'.join(entire_cv.split('\n')[:5])
-            current_about_me = first_paragraph.strip()
+    # Parse the CV once into sections; the "About Me" text is its summary section
+    current_about_me = parse_cv(entire_cv).summary if entire_cv else ""
     
     # Base cover letter template
     print("\nCover Letter Template:")
@@ -127,23 +117,33 @@ def main():
     else:
         job_titles = [job_titles_input]
     
-    location = input("Enter location (e.g., 'New York, NY'): ").strip()
+    print("You can enter multiple locations separated by semicolons (e.g., 'New York, NY; Boston, MA')")
+    locations_input = input("Enter location(s) (e.g., 'New York, NY'): ").strip()
+    locations = [loc.strip() for loc in locations_input.split(';') if loc.strip()]
     
     # Number of results per title (TOP 50 per location)
     try:
-        max_results = int(input("Enter maximum number of results per job title (default 50): ").strip() or "50")
+        max_results = int(input("Enter maximum number of results per job title and location (default 50): ").strip() or "50")
     except ValueError:
         max_results = 50
     
-    # LinkedIn credentials (moved to end, before starting browser)
-    print("\nLinkedIn Login:")
-    email = input("Enter your LinkedIn email: ").strip()
-    password = input("Enter your LinkedIn password: ").strip()
+    # LinkedIn credentials (moved to end, before starting browser); guest HTTP
+    # searches (SEARCH_ENGINE=http) never log in
+    email, password = None, None
+    if SEARCH_ENGINE != 'http':
+        print("\nLinkedIn Login:")
+        if SEARCH_ENGINE == 'auto':
+            print("Searches run as a logged-out guest; credentials are only used if LinkedIn refuses them.")
+        if os.path.exists(COOKIES_FILE) or CHROME_PROFILE_DIR:
+            print("A saved session will be reused if it is still valid (credentials are only needed if it expired).")
+        email = input("Enter your LinkedIn email: ").strip()
+        password = input("Enter your LinkedIn password: ").strip()
     
     # Export options
     print("\nExport Options:")
     generate_cover_letters = input("Generate adapted cover letters for all jobs? (y/n, default y): ").strip().lower() != 'n'
     customize_cv = input("Customize CV 'About Me' section for all jobs? (y/n, default n): ").strip().lower() == 'y'
+    fetch_details = input("Fetch full job descriptions for better tailoring? (y/n, default y): ").strip().lower() != 'n'
     
     print("\n" + "="*80)
     print("Starting job scraping...")
@@ -151,87 +151,84 @@ def main():
     
     # Initialize scraper
     scraper = LinkedInJobScraper(headless=False)
-    llm_helper = LLMHelper(api_key=groq_api_key)
+    # Generated cover letters/CV sections are written in batches in the background
+    artifact_writer = ArtifactWriter(ARTIFACT_FORMAT)
+    llm_helper = LLMHelper(api_key=groq_api_key, artifact_writer=artifact_writer)
     
     try:
-        # Start browser and login
-        scraper.start_driver()
-        scraper.login(email, password)
+        # Start browser and login (deferred until needed unless SEARCH_ENGINE=selenium)
+        with profiler.stage("session"):
+            scraper.open_session(email, password)
         
         # Search for jobs (supports multiple titles, TOP 50 per location)
-        print(f"\nSearching for {len(job_titles)} job title(s) in '{location}'...")
+        print(f"\nSearching for {len(job_titles)} job title(s) in {len(locations)} location(s)...")
         print(f"Job titles: {', '.join(job_titles)}")
-        jobs = scraper.search_jobs(job_titles, location, max_results=max_results)
+        print(f"Locations: {'; '.join(locations)}")
+        with profiler.stage("search"):
+            jobs = scraper.search_jobs(job_titles, locations, max_results=max_results)
         
         if not jobs:
             print("No jobs found. Exiting...")
             return
         
+        # Rank jobs against the CV so the LLM budget goes to the best fits first
+        with profiler.stage("rank"):
+            jobs = rank_jobs(jobs, entire_cv, job_titles)
+        scraper.jobs = jobs
+        
+        # Fetch full descriptions (cached on disk) for the jobs sent to the LLM
+        if fetch_details and (generate_cover_letters or customize_cv):
+            with profiler.stage("job_details"):
+                fetch_job_details(jobs[:50])
+        
+        # Group near-duplicate postings so the LLM runs once per cluster
+        with profiler.stage("near_duplicates"):
+            clusters = group_jobs_for_generation(jobs)
+        
         # Generate cover letters
         cover_letters_dict = {}
         if generate_cover_letters:
-            print("\n" + "="*80)
-            print("Generating AI-powered adapted cover letters...")
-            print("="*80)
-            
-            # Limit to first 50 for LLM processing
-            jobs_to_process = jobs[:50]
-            
-            for i, job in enumerate(jobs_to_process, 1):
-                print(f"\nProcessing job {i}/{len(jobs_to_process)}: {job.get('title', 'N/A')} at {job.get('company', 'N/A')}")
-                
-                print("  → Adapting cover letter...")
-                try:
-                    if base_cover_letter:
-                        cover_letter = llm_helper.adapt_cover_letter(job, base_cover_letter, additional_context)
-                    else:
-                        # Fallback if no template provided
-                        cover_letter = "Cover letter template not provided. Please provide a base cover letter template."
-                    
-                    job_link = job.get('link', '')
-                    if job_link:
-                        cover_letters_dict[job_link] = cover_letter
-                    
-                    # Save individual cover letter file
-                    llm_helper.save_cover_letter(cover_letter, job)
-                    time.sleep(1)  # Rate limiting
-                except Exception as e:
-                    print(f"  ✗ Error generating cover letter: {e}")
-                    job_link = job.get('link', '')
-                    if job_link:
-                        cover_letters_dict[job_link] = f"Error: {str(e)}"
+            with profiler.stage("cover_letters"):
+                cover_letters_dict = generate_cover_letters_for_jobs(
+                    llm_helper, jobs, base_cover_letter, additional_context, clusters=clusters
+                )
         
         # Customize CV sections
         if customize_cv and entire_cv:
-            print("\n" + "="*80)
-            print("Customizing CV 'About Me' sections...")
-            print("="*80)
-            
-            jobs_to_process = jobs[:50]
-            
-            for i, job in enumerate(jobs_to_process, 1):
-                print(f"\nProcessing job {i}/{len(jobs_to_process)}: {job.get('title', 'N/A')} at {job.get('company', 'N/A')}")
-                
-                print("  → Customizing CV 'About Me' section...")
-                try:
-                    cv_section = llm_helper.customize_cv_about_me(job, current_about_me, entire_cv)
-                    llm_helper.save_cv_section(cv_section, job)
-                    time.sleep(1)  # Rate limiting
-                except Exception as e:
-                    print(f"  ✗ Error customizing CV section: {e}")
+            with profiler.stage("cv_sections"):
+                customize_cv_for_jobs(llm_helper, jobs, current_about_me, entire_cv, clusters=clusters)
+        
+        with profiler.stage("artifacts"):
+            artifact_writer.close()
+        if artifact_writer.stats['artifacts']:
+            print(f"\nArtifacts: {artifact_writer.summary()}")
         
         # Export to XLSX with cover letters
         print("\nExporting to XLSX...")
-        scraper.export_to_xlsx(max_results=50, cover_letters=cover_letters_dict)
+        xlsx_path, tracker_stats = None, None
+        if XLSX_PER_RUN:
+            with profiler.stage("export_xlsx"):
+                xlsx_path = scraper.export_to_xlsx(max_results=50, cover_letters=cover_letters_dict)
+        if TRACKER_FILE:
+            with profiler.stage("export_tracker"):
+                tracker_stats = scraper.export_to_tracker(TRACKER_FILE, max_results=50,
+                                                          cover_letters=cover_letters_dict)
         
         print("\n" + "="*80)
         print("Process completed successfully!")
         print("="*80)
         print(f"\nSummary:")
         print(f"  - Jobs scraped: {len(jobs)}")
+        print(f"  - Near-duplicate postings sharing generated text: {sum(len(c) - 1 for c in clusters)}")
         print(f"  - Job titles searched: {', '.join(job_titles)}")
-        print(f"  - Location: {location}")
-        print(f"  - XLSX exported to: output/")
+        print(f"  - Locations: {'; '.join(locations)}")
+        if xlsx_path:
+            print(f"  - XLSX exported to: {xlsx_path}")
+        if tracker_stats:
+            print(f"  - Tracker {TRACKER_FILE}: {tracker_stats['new']} new, {tracker_stats['updated']} updated")
+        llm_helper.print_prompt_stats()
+        llm_helper.print_model_stats()
+        llm_helper.print_output_stats()
         if generate_cover_letters:
             print(f"  - Cover letters saved to: output/cover_letters/")
         if customize_cv:
@@ -245,8 +242,174 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        artifact_writer.close()
         scraper.close()
+        profiler.print_summary()
+
+
+def fetch_job_details(jobs):
+    """
+    Add full job descriptions to jobs, from the on-disk cache or fetched concurrently
+    
+    Args:
+        jobs (list): Job dictionaries
+    
+    Returns:
+        dict: Fetch statistics (see JobDetailFetcher.fetch_all)
+    """
+    print("\nFetching full job descriptions...")
+    fetcher = JobDetailFetcher()
+    try:
+        return fetcher.fetch_all(jobs)
+    finally:
+        fetcher.close()
+
+
+def group_jobs_for_generation(jobs, max_jobs=50):
+    """
+    Group the jobs selected for LLM processing into near-duplicate clusters
+    
+    Args:
+        jobs (list): Job dictionaries
+        max_jobs (int): Maximum number of jobs to process (default: 50)
+    
+    Returns:
+        list: Clusters of near-duplicate jobs; the LLM runs once per cluster
+    """
+    jobs_to_process = jobs[:max_jobs]
+    clusters = group_near_duplicates(jobs_to_process)
+    saved = len(jobs_to_process) - len(clusters)
+    if saved:
+        print(f"\nNear-duplicate detection: {len(jobs_to_process)} jobs in {len(clusters)} clusters "
+              f"({saved} LLM calls saved per generation step)")
+        for cluster in clusters:
+            if len(cluster) > 1:
+                print(f"  - {cluster[0].get('title', 'N/A')} at {cluster[0].get('company', 'N/A')}: "
+                      f"{len(cluster)} postings")
+    return clusters
 
 
+def _run_clusters(llm_helper, clusters, work):
+    """
+    Run work(i, cluster) for every cluster on a thread pool
+    
+    The LLM helper's adaptive rate controller decides how many calls are
+    actually in flight, so the pool only needs to be large enough to keep it fed.
+    
+    Returns:
+        int: Number of clusters whose work raised an exception
+    """
+    failures = 0
+    workers = max(1, min(len(clusters), llm_helper.rate_controller.max_limit))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(work, i, cluster) for i, cluster in enumerate(clusters, 1)]
+        for future in as_completed(futures):
+            if future.exception() is not None:
+                failures += 1
+    return failures
+
+
+def generate_cover_letters_for_jobs(llm_helper, jobs, base_cover_letter, additional_context=None, max_jobs=50,
+                                    clusters=None):
+    """
+    Generate and save an adapted cover letter for each job
+    
+    Near-duplicate postings share one generated cover letter. Jobs whose
+    generation fails after retries get no entry, so no error text ends up in
+    the export.
+    
+    Args:
+        llm_helper (LLMHelper): LLM helper used for generation
+        jobs (list): Job dictionaries
+        base_cover_letter (str): The user's cover letter template
+        additional_context (dict): Optional additional context
+        max_jobs (int): Maximum number of jobs to process (default: 50)
+        clusters (list): Optional precomputed clusters from group_jobs_for_generation
+    
+    Returns:
+        dict: Dictionary mapping job IDs (see job_identity.job_key) to cover letters
+    """
+    print("\n" + "="*80)
+    print("Generating AI-powered adapted cover letters...")
+    print("="*80)
+    
+    if clusters is None:
+        clusters = group_jobs_for_generation(jobs, max_jobs)
+    
+    cover_letters_dict = {}
+    
+    def generate(i, cluster):
+        job = cluster[0]
+        print(f"\nProcessing job {i}/{len(clusters)}: {job.get('title', 'N/A')} at {job.get('company', 'N/A')}")
+        
+        print("  → Adapting cover letter...")
+        try:
+            if base_cover_letter:
+                cover_letter = llm_helper.adapt_cover_letter(job, base_cover_letter, additional_context)
+            else:
+                # Fallback if no template provided
+                cover_letter = "Cover letter template not provided. Please provide a base cover letter template."
+            
+            for duplicate in cluster:
+                duplicate_letter = adapt_for_duplicate(cover_letter, job, duplicate)
+                key = job_key(duplicate)
+                if key:
+                    cover_letters_dict[key] = duplicate_letter
+                
+                # Save individual cover letter file
+                llm_helper.save_cover_letter(duplicate_letter, duplicate)
+            if len(cluster) > 1:
+                print(f"  → Reused for {len(cluster) - 1} near-duplicate posting(s)")
+        except Exception as e:
+            print(f"  ✗ Error generating cover letter for {job.get('title', 'N/A')}: {e}")
+            raise
+    
+    failures = _run_clusters(llm_helper, clusters, generate)
+    if failures:
+        print(f"\n{failures} cover letter(s) could not be generated; they are left empty in the export")
+    print(f"LLM rate control: {llm_helper.rate_controller.summary()}")
+    
+    return cover_letters_dict
+
+
+def customize_cv_for_jobs(llm_helper, jobs, current_about_me, entire_cv, max_jobs=50, clusters=None):
+    """
+    Customize and save the CV "About Me" section for each job
+    
+    Near-duplicate postings share one customized section.
+    
+    Args:
+        llm_helper (LLMHelper): LLM helper used for generation
+        jobs (list): Job dictionaries
+        current_about_me (str): Current "About Me" section text
+        entire_cv (str): Entire CV content
+        max_jobs (int): Maximum number of jobs to process (default: 50)
+        clusters (list): Optional precomputed clusters from group_jobs_for_generation
+    """
+    print("\n" + "="*80)
+    print("Customizing CV 'About Me' sections...")
+    print("="*80)
+    
+    if clusters is None:
+        clusters = group_jobs_for_generation(jobs, max_jobs)
+    
+    def customize(i, cluster):
+        job = cluster[0]
+        print(f"\nProcessing job {i}/{len(clusters)}: {job.get('title', 'N/A')} at {job.get('company', 'N/A')}")
+        
+        print("  → Customizing CV 'About Me' section...")
+        try:
+            cv_section = llm_helper.customize_cv_about_me(job, current_about_me, entire_cv)
+            for duplicate in cluster:
+                llm_helper.save_cv_section(adapt_for_duplicate(cv_section, job, duplicate), duplicate)
+        except Exception as e:
+            print(f"  ✗ Error customizing CV section for {job.get('title', 'N/A')}: {e}")
+            raise
+    
+    failures = _run_clusters(llm_helper, clusters, customize)
+    if failures:
+        print(f"\n{failures} CV section(s) could not be customized")
+    print(f"LLM rate control: {llm_helper.rate_controller.summary()}")
+
 if __name__ == "__main__":
     main()
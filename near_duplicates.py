@@ -0,0 +1,226 @@
+"""
+Near-duplicate job detection using MinHash with LSH banding
+
+Reposts of the same role (same company re-listing, or agencies re-posting it)
+get a new job ID and a slightly different title or snippet. Jobs are reduced to
+feature sets over title + company + description (the fetched description when
+present, else the snippet), MinHash signatures are
+bucketed by band so only likely pairs are compared, and candidates whose
+Jaccard similarity clears the threshold are grouped into one cluster so the LLM
+stage runs once per cluster.
+"""
+import re
+import random
+import hashlib
+
+NUM_PERMUTATIONS = 64
+# 16 bands x 4 rows: pairs above ~0.5 Jaccard almost always share a bucket
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+# Minimum Jaccard similarity of feature sets for two jobs to be near-duplicates
+SIMILARITY_THRESHOLD = 0.7
+# Jobs from different companies are only compared when both snippets are
+# informative; otherwise any two "Software Engineer" titles would collide
+MIN_SNIPPET_WORDS = 15
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1729)  # fixed seed: signatures are stable across runs
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+                 for _ in range(NUM_PERMUTATIONS)]
+
+_SALUTATION_RE = re.compile(r"^\s*(?:dear|to whom|hello|hi)\b", re.I)
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+_COMPANY_SUFFIX_RE = re.compile(r"\b(inc|llc|ltd|corp|corporation|co|company|gmbh|plc)\b\.?")
+# Title decorations that do not change the role
+_TITLE_NOISE = {'remote', 'hybrid', 'onsite', 'on', 'site', 'urgent', 'hiring', 'immediate', 'start'}
+# Seniority and level words: jobs are only grouped when their titles carry the
+# same ones, so one cover letter is never reused across levels
+_SENIORITY = {'intern', 'junior', 'jr', 'entry', 'associate', 'mid', 'senior', 'sr', 'staff', 'principal',
+              'lead', 'head', 'chief', 'distinguished', 'i', 'ii', 'iii', 'iv', 'l1', 'l2', 'l3', 'l4', 'l5',
+              'l6', 'l7'}
+
+
+def _tokens(text):
+    if not text or text == "N/A":
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+_LOCATION_NOISE = {'united', 'states', 'usa', 'us', 'greater', 'metropolitan', 'area'}
+
+
+def normalize_location(location):
+    """Lowercase a location and drop country and metro-area words"""
+    if not location or location == "N/A":
+        return ""
+    return " ".join(token for token in _tokens(location) if token not in _LOCATION_NOISE)
+
+
+def _description(job):
+    """Full description fetched from the job page (job_details.py) if present, else the snippet"""
+    description = job.get('description')
+    if description and description != "N/A":
+        return description
+    return job.get('description_snippet')
+
+
+def normalize_company(company):
+    """Lowercase a company name and drop legal suffixes (Inc, LLC, ...)"""
+    if not company or company == "N/A":
+        return ""
+    name = _COMPANY_SUFFIX_RE.sub(" ", company.lower())
+    return " ".join(_tokens(name))
+
+
+_SENIORITY_ALIASES = {'sr': 'senior', 'jr': 'junior'}
+
+
+def seniority(title):
+    """Seniority and level words of a title, e.g. {'senior'} or {'ii'}"""
+    return frozenset(_SENIORITY_ALIASES.get(token, token) for token in _tokens(title) if token in _SENIORITY)
+
+
+def job_features(job):
+    """
+    Build the feature set used for similarity
+
+    Seniority words are left out: they block grouping (see seniority) rather
+    than count towards similarity.
+
+    Args:
+        job (dict): Job data dictionary
+
+    Returns:
+        set: Title words, company name and description word bigrams (the
+            fetched description when present, otherwise the snippet)
+    """
+    features = {'t:' + token for token in _tokens(job.get('title'))
+                if token not in _TITLE_NOISE and token not in _SENIORITY}
+
+    company = normalize_company(job.get('company'))
+    if company:
+        features.add('c:' + company)
+
+    snippet = _tokens(_description(job))
+    if len(snippet) > 1:
+        features.update('s:' + snippet[i] + ' ' + snippet[i + 1] for i in range(len(snippet) - 1))
+    else:
+        features.update('s:' + token for token in snippet)
+    return features
+
+
+def _hash64(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def minhash_signature(features):
+    """
+    Compute the MinHash signature of a feature set
+
+    Args:
+        features (set): Feature strings
+
+    Returns:
+        tuple: NUM_PERMUTATIONS minimum hash values
+    """
+    if not features:
+        return (_MERSENNE_PRIME,) * NUM_PERMUTATIONS
+    hashes = [_hash64(feature) for feature in features]
+    return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _comparable(job_a, job_b):
+    """
+    Same seniority and location, and either the same company or both
+    descriptions long enough to compare across companies
+    """
+    if seniority(job_a.get('title')) != seniority(job_b.get('title')):
+        return False
+    if normalize_location(job_a.get('location')) != normalize_location(job_b.get('location')):
+        # Generated text mentions the location, and one city's posting is not another's
+        return False
+    company_a = normalize_company(job_a.get('company'))
+    if company_a and company_a == normalize_company(job_b.get('company')):
+        return True
+    return (len(_tokens(_description(job_a))) >= MIN_SNIPPET_WORDS
+            and len(_tokens(_description(job_b))) >= MIN_SNIPPET_WORDS)
+
+
+def group_near_duplicates(jobs, threshold=SIMILARITY_THRESHOLD):
+    """
+    Group jobs into near-duplicate clusters
+
+    Only jobs that share at least one LSH band bucket are compared, so the cost
+    grows with the number of likely duplicates rather than quadratically.
+
+    Args:
+        jobs (list): Job dictionaries
+        threshold (float): Minimum Jaccard similarity for near-duplicates
+
+    Returns:
+        list: Clusters (lists of jobs) in original order; the first job of each
+            cluster is its representative
+    """
+    features = [job_features(job) for job in jobs]
+    parent = list(range(len(jobs)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets = {}
+    for i, feature_set in enumerate(features):
+        if not feature_set:
+            continue
+        signature = minhash_signature(feature_set)
+        for band in range(LSH_BANDS):
+            key = (band, signature[band * LSH_ROWS:(band + 1) * LSH_ROWS])
+            for j in buckets.setdefault(key, []):
+                root_i, root_j = find(i), find(j)
+                if root_i == root_j:
+                    continue
+                if jaccard(feature_set, features[j]) >= threshold and _comparable(jobs[i], jobs[j]):
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+            buckets[key].append(i)
+
+    clusters = {}
+    for i, job in enumerate(jobs):
+        clusters.setdefault(find(i), []).append(job)
+    return list(clusters.values())
+
+
+def adapt_for_duplicate(text, representative, job):
+    """
+    Reuse text generated for a cluster representative for another job in the cluster
+
+    When the companies differ (e.g. agency reposts), the representative's company
+    name is replaced with the job's own, but only in the letter's header and
+    salutation (up to the first "Dear ..." line); the body is left as generated.
+    Text without a salutation is returned unchanged.
+
+    Args:
+        text (str): Text generated for the representative
+        representative (dict): Job the text was generated for
+        job (dict): Duplicate job reusing the text
+
+    Returns:
+        str: Text for the duplicate job
+    """
+    source = representative.get('company')
+    target = job.get('company')
+    if not source or not target or "N/A" in (source, target) or source == target:
+        return text
+    lines = text.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        if _SALUTATION_RE.match(line):
+            header = "".join(lines[:i + 1]).replace(source, target)
+            return header + "".join(lines[i + 1:])
+    return text
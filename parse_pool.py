@@ -0,0 +1,147 @@
+"""
+Process-pool parsing of job search result pages
+
+BeautifulSoup parsing and title filtering are pure Python and hold the GIL, so
+threads that fetch many result pages still parse them on one core. ParsePool
+sends raw page bytes to worker processes in chunks (fewer, larger pickles) and
+gets back compact tuples instead of soup objects or dictionaries:
+
+    (job_id, title, company, location, link, posted_date, relevant)
+
+`relevant` is the result of the title filter given as a picklable spec
+(include, exclude, default_excludes) for job_filters.make_title_filter.
+With workers <= 1 everything runs inline in the calling process.
+"""
+import os
+import threading
+import multiprocessing
+from functools import lru_cache
+from concurrent.futures import Future, ProcessPoolExecutor
+from job_filters import make_title_filter
+
+# Default title filter spec: job_filters.is_relevant_title
+DEFAULT_FILTER = (None, None, True)
+
+COMPACT_FIELDS = ('job_id', 'title', 'company', 'location', 'link', 'posted_date', 'relevant')
+
+
+@lru_cache(maxsize=64)
+def _title_filter(filter_spec):
+    include, exclude, default_excludes = filter_spec
+    return make_title_filter(list(include) if include else None, list(exclude) if exclude else None,
+                             default_excludes)
+
+
+def filter_spec(include=None, exclude=None, default_excludes=True):
+    """Hashable, picklable title filter spec for parse_page_compact"""
+    return (tuple(include) if include else None, tuple(exclude) if exclude else None, bool(default_excludes))
+
+
+def parse_page_compact(page, spec=DEFAULT_FILTER):
+    """
+    Parse one result page into compact tuples
+
+    Args:
+        page (bytes or str): Raw page HTML
+        spec (tuple): Title filter spec (see filter_spec)
+
+    Returns:
+        list: (job_id, title, company, location, link, posted_date, relevant) tuples;
+            missing company/location are empty strings
+    """
+    from http_search import parse_job_cards
+    if isinstance(page, bytes):
+        page = page.decode('utf-8', errors='replace')
+    relevant = _title_filter(spec)
+    return [(card['job_id'], card['title'],
+             card['company'] if card['company'] != "N/A" else "",
+             card['location'] if card['location'] != "N/A" else "",
+             card['link'], card['posted_date'], relevant(card['title']))
+            for card in parse_job_cards(page)]
+
+
+def _parse_chunk(items):
+    """Worker entry point: parse a chunk of (page, spec) pairs"""
+    return [parse_page_compact(page, spec) for page, spec in items]
+
+
+class ParsePool:
+    def __init__(self, workers=None, chunk_size=4, min_pages=4):
+        """
+        Initialize the parse stage
+
+        Args:
+            workers (int): Worker processes (default: CPU count; <= 1 parses inline)
+            chunk_size (int): Pages sent to a worker per task
+            min_pages (int): Batches smaller than this are parsed inline, where
+                process round-trips would cost more than they save
+        """
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+        self.min_pages = min_pages
+        self.stats = {'pages': 0, 'pooled_pages': 0}
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _pool(self):
+        # Several fetch threads may submit the first pages at once
+        with self._lock:
+            if self._executor is None:
+                # spawn: the pool is often started from fetch threads, where fork is unsafe
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+            return self._executor
+
+    def parse_pages(self, pages, spec=DEFAULT_FILTER):
+        """
+        Parse a batch of pages, in order
+
+        Args:
+            pages (list): Raw page bytes/str, or (page, spec) pairs for per-page filters
+            spec (tuple): Title filter spec for plain pages
+
+        Returns:
+            list: One list of compact tuples per page
+        """
+        items = [page if isinstance(page, tuple) else (page, spec) for page in pages]
+        if self.workers <= 1 or len(items) < self.min_pages:
+            results = _parse_chunk(items)
+        else:
+            chunks = [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+            results = [page for chunk in self._pool().map(_parse_chunk, chunks) for page in chunk]
+            self.stats['pooled_pages'] += len(items)
+        self.stats['pages'] += len(items)
+        return results
+
+    def submit(self, page, spec=DEFAULT_FILTER):
+        """
+        Parse one page in a worker process (for fetch threads that parse as pages arrive)
+
+        Returns:
+            concurrent.futures.Future: Resolves to the page's compact tuples;
+                already resolved when parsing inline
+        """
+        with self._lock:
+            self.stats['pages'] += 1
+            if self.workers > 1:
+                self.stats['pooled_pages'] += 1
+        if self.workers <= 1:
+            future = Future()
+            try:
+                future.set_result(parse_page_compact(page, spec))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        return self._pool().submit(parse_page_compact, page, spec)
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
@@ -0,0 +1,171 @@
+"""
+Adaptive polling interval for the job notifier
+
+New postings do not arrive at a constant rate: there are many during business
+hours and almost none at night. PollScheduler keeps an arrival rate (new jobs
+per hour) for every hour of the day, learned from what each cycle found, and
+picks the next interval so a cycle is expected to find about one new job:
+short during busy hours, long when little is posted. Empty cycles (and
+failed ones) stretch the interval further. All of it stays within configured
+bounds and is saved to a JSON file, so a restart keeps what was learned.
+"""
+import os
+import json
+import time
+import random
+import tempfile
+from datetime import datetime
+
+DEFAULT_STATE_FILE = "poll_state.json"
+
+
+class PollScheduler:
+    def __init__(self, state_file=DEFAULT_STATE_FILE, base_interval=300, min_interval=60, max_interval=1800,
+                 target_jobs_per_cycle=1.0, backoff=1.5, smoothing=0.2, prior_cycles=3, jitter=0.1):
+        """
+        Initialize the scheduler and load saved state
+
+        Args:
+            state_file (str): JSON file holding the learned rates (None keeps state in memory)
+            base_interval (float): Interval in seconds before anything has been learned
+            min_interval (float): Shortest interval in seconds
+            max_interval (float): Longest interval in seconds
+            target_jobs_per_cycle (float): Expected new jobs per cycle the interval aims for
+            backoff (float): Interval multiplier per consecutive empty or failed cycle
+            smoothing (float): Weight of the newest observation in the per-hour moving average
+            prior_cycles (int): Observations an hour needs before its own rate outweighs
+                the all-day rate
+            jitter (float): Random +/- fraction applied to each interval
+        """
+        self.state_file = state_file
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_jobs_per_cycle = target_jobs_per_cycle
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.prior_cycles = prior_cycles
+        self.jitter = jitter
+        # hourly: hour of day ("0".."23") -> {'rate': new jobs per hour, 'cycles': observations}
+        self.state = {'hourly': {}, 'rate': None, 'cycles': 0, 'empty_streak': 0,
+                      'last_poll': None, 'interval': base_interval}
+        self.load()
+
+    def load(self):
+        """Load saved state; a missing or unreadable file starts fresh"""
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                self.state.update(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Could not read poll state {self.state_file}: {e}")
+
+    def save(self):
+        """Write the state atomically"""
+        if not self.state_file:
+            return
+        directory = os.path.dirname(os.path.abspath(self.state_file))
+        fd, tmp = tempfile.mkstemp(prefix="poll_state_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, indent=2)
+            os.replace(tmp, self.state_file)
+        except OSError as e:
+            print(f"Could not save poll state {self.state_file}: {e}")
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _ewma(self, old, value):
+        return value if old is None else (1 - self.smoothing) * old + self.smoothing * value
+
+    def record(self, new_jobs, now=None):
+        """
+        Record the outcome of a polling cycle
+
+        Args:
+            new_jobs (int): New jobs the cycle found, or None if the cycle failed
+            now (float): Unix time of the cycle (default: now)
+        """
+        now = now or time.time()
+        last_poll = self.state.get('last_poll')
+        self.state['last_poll'] = now
+
+        if new_jobs is None or new_jobs == 0:
+            self.state['empty_streak'] += 1
+        else:
+            self.state['empty_streak'] = 0
+
+        # A rate needs the time the jobs accumulated over; skip the first cycle,
+        # failed cycles and long gaps (restarts) where the window is unknown
+        if new_jobs is None or last_poll is None:
+            self.save()
+            return
+        elapsed_hours = (now - last_poll) / 3600.0
+        if elapsed_hours <= 0 or elapsed_hours > self.max_interval * 2 / 3600.0:
+            self.save()
+            return
+        rate = new_jobs / elapsed_hours
+
+        hour = str(datetime.fromtimestamp(now).hour)
+        bucket = self.state['hourly'].setdefault(hour, {'rate': None, 'cycles': 0})
+        bucket['rate'] = self._ewma(bucket['rate'], rate)
+        bucket['cycles'] += 1
+        self.state['rate'] = self._ewma(self.state['rate'], rate)
+        self.state['cycles'] += 1
+        self.save()
+
+    def expected_rate(self, now=None):
+        """
+        New jobs per hour expected at a given time
+
+        The hour's own rate is blended with the all-day rate until the hour has
+        prior_cycles observations.
+
+        Returns:
+            float: Jobs per hour, or None before any cycle has been measured
+        """
+        overall = self.state.get('rate')
+        if overall is None:
+            return None
+        hour = str(datetime.fromtimestamp(now or time.time()).hour)
+        bucket = self.state['hourly'].get(hour)
+        if not bucket or bucket.get('rate') is None:
+            return overall
+        n = bucket['cycles']
+        return (n * bucket['rate'] + self.prior_cycles * overall) / (n + self.prior_cycles)
+
+    def next_interval(self, now=None):
+        """
+        Seconds to wait before the next cycle
+
+        Returns:
+            float: Interval within [min_interval, max_interval]
+        """
+        rate = self.expected_rate(now)
+        if rate is None:
+            interval = self.base_interval
+        elif rate <= 0:
+            interval = self.max_interval
+        else:
+            interval = self.target_jobs_per_cycle / rate * 3600.0
+        # Back off further after consecutive empty cycles
+        interval *= self.backoff ** min(self.state['empty_streak'], 10)
+        interval *= 1 + random.uniform(-self.jitter, self.jitter)
+        interval = max(self.min_interval, min(self.max_interval, interval))
+        self.state['interval'] = round(interval, 1)
+        return interval
+
+    def summary(self, now=None):
+        """One-line description of the current schedule"""
+        rate = self.expected_rate(now)
+        rate_text = f"{rate:.1f} jobs/h" if rate is not None else "unknown rate"
+        return (f"next poll in {self.state['interval']:.0f}s | expected {rate_text} | "
+                f"empty streak={self.state['empty_streak']} | cycles learned={self.state['cycles']}")
+
+    def busiest_hours(self, top=3):
+        """Hours of day with the highest learned arrival rates, as (hour, jobs per hour)"""
+        rates = [(int(hour), bucket['rate']) for hour, bucket in self.state['hourly'].items()
+                 if bucket.get('rate') is not None]
+        return sorted(rates, key=lambda item: item[1], reverse=True)[:top]
@@ -0,0 +1,167 @@
+"""
+On-demand per-stage profiling
+
+Wrap each pipeline stage in `profiler.stage("name")`. When profiling is on
+(--profile flag or JOBBOT_PROFILE=1), every stage runs under cProfile and
+tracemalloc: its profile is written to output/profiles/<run>/<stage>.prof
+(open with `python -m pstats` or snakeviz) and a summary of wall time, peak
+traced memory, the top-N functions and the top allocation sites per stage is
+printed at the end of the run. When it is off, stage() does nothing.
+
+Only stages entered on the main thread run under cProfile and tracemalloc
+(Python 3.12+ allows a single active profiler). Work done in thread pools shows
+up there as time spent waiting on futures (e.g. LLM calls); stages entered in
+worker threads are timed only, summed over threads. A stage entered while
+another one is active in the same thread is timed but profiled as part of the
+outer stage.
+"""
+import os
+import sys
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from config import PROFILES_DIR
+
+
+def profiling_requested(argv=None):
+    """True if --profile is on the command line or JOBBOT_PROFILE is set"""
+    argv = sys.argv[1:] if argv is None else argv
+    return "--profile" in argv or os.getenv("JOBBOT_PROFILE", "0").lower() not in ("", "0", "false", "no")
+
+
+class StageProfiler:
+    def __init__(self, enabled=False, output_dir=PROFILES_DIR, top=10, memory=True, run_id=None):
+        """
+        Initialize the profiler
+
+        Args:
+            enabled (bool): Profile stages (False makes stage() a no-op)
+            output_dir (str): Directory for the run's .prof files
+            top (int): Functions and allocation sites listed per stage in the summary
+            memory (bool): Trace allocations with tracemalloc (slower, but shows memory)
+            run_id (str): Sub-directory name for this run (default: timestamp)
+        """
+        self.enabled = enabled
+        self.top = top
+        self.memory = memory
+        self.run_dir = os.path.join(output_dir, run_id or datetime.now().strftime("%Y%m%d_%H%M%S"))
+        self.stages = {}
+        # stage name -> pstats.Stats merged over calls and threads
+        self._profiles = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def stage(self, name):
+        """Profile the enclosed block as stage `name` (repeated stages accumulate)"""
+        if not self.enabled:
+            yield
+            return
+        worker = threading.current_thread() is not threading.main_thread()
+        with self._lock:
+            stats = self.stages.setdefault(name, {'calls': 0, 'seconds': 0.0, 'peak_mb': 0.0,
+                                                  'allocated_mb': 0.0, 'allocations': [], 'nested': False,
+                                                  'worker': False})
+            stats['calls'] += 1
+            if worker:
+                # Runs inside another stage's wall time (summed over threads)
+                stats['worker'] = True
+        started = time.perf_counter()
+        nested = getattr(self._local, 'active', None) is not None
+        if nested:
+            # Nested stage: cProfile already runs for the outer stage in this thread
+            stats['nested'] = True
+
+        profile = None
+        if not nested and not worker:
+            # Profiling modules are only loaded when profiling is on
+            import cProfile
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError as e:
+                # Python 3.12+ allows one active profiler; time the stage instead
+                print(f"Stage '{name}' is timed only: {e}")
+                profile = None
+        if profile is None:
+            # Worker threads, nested stages and stages that could not be profiled are only timed
+            try:
+                yield
+            finally:
+                with self._lock:
+                    stats['seconds'] += time.perf_counter() - started
+            return
+
+        import pstats
+        import tracemalloc
+        self._local.active = name
+        trace_memory = self.memory
+        started_tracing = False
+        if trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(10)
+                started_tracing = True
+            if hasattr(tracemalloc, 'reset_peak'):
+                # Python 3.9+; on 3.8 the peak covers everything since tracing started
+                tracemalloc.reset_peak()
+            base_memory = tracemalloc.get_traced_memory()[0]
+            before = tracemalloc.take_snapshot()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._local.active = None
+            if trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                diff = tracemalloc.take_snapshot().compare_to(before, 'lineno')
+                if started_tracing:
+                    tracemalloc.stop()
+            with self._lock:
+                stats['seconds'] += time.perf_counter() - started
+                if trace_memory:
+                    stats['peak_mb'] = max(stats['peak_mb'], (peak - base_memory) / 1024 / 1024)
+                    stats['allocated_mb'] += (current - base_memory) / 1024 / 1024
+                    stats['allocations'] = [(str(d.traceback[0]), d.size_diff / 1024)
+                                            for d in diff[:self.top] if d.size_diff > 0]
+                profile.create_stats()
+                if name in self._profiles:
+                    self._profiles[name].add(profile)
+                else:
+                    self._profiles[name] = pstats.Stats(profile)
+                self._dump(name)
+
+    def _dump(self, name):
+        try:
+            os.makedirs(self.run_dir, exist_ok=True)
+            self._profiles[name].dump_stats(os.path.join(self.run_dir, f"{name}.prof"))
+        except OSError as e:
+            print(f"Could not write profile for stage '{name}': {e}")
+
+    def print_summary(self):
+        """Print per-stage time and memory, then the top functions and allocations of each stage"""
+        if not self.enabled or not self.stages:
+            return
+        total = sum(s['seconds'] for s in self.stages.values() if not (s['nested'] or s['worker'])) or 1.0
+        print("\n" + "="*80)
+        print("PROFILE SUMMARY")
+        print("="*80)
+        print(f"{'Stage':<28} {'Calls':>5} {'Seconds':>9} {'Share':>6} {'Peak MB':>8} {'Kept MB':>8}")
+        print("-"*80)
+        for name, s in sorted(self.stages.items(), key=lambda item: item[1]['seconds'], reverse=True):
+            share = "  (in)" if s['nested'] else " (thr)" if s['worker'] else f"{100 * s['seconds'] / total:>5.0f}%"
+            print(f"{name[:28]:<28} {s['calls']:>5} {s['seconds']:>9.2f} {share:>6} "
+                  f"{s['peak_mb']:>8.1f} {s['allocated_mb']:>8.1f}")
+
+        for name, profile in self._profiles.items():
+            print(f"\n--- {name}: top {self.top} functions by cumulative time ---")
+            profile.stream = sys.stdout
+            profile.strip_dirs().sort_stats('cumulative').print_stats(self.top)
+            allocations = self.stages[name]['allocations']
+            if allocations:
+                print(f"--- {name}: top allocation sites (last call) ---")
+                for site, kb in allocations:
+                    print(f"  {kb:>9.1f} KB  {site}")
+        if any(s['worker'] for s in self.stages.values()):
+            print("(thr): stage ran in worker threads (timed only); seconds are summed over threads")
+        print(f"\nProfiles written to {self.run_dir}/ (python -m pstats <file>.prof)")
@@ -0,0 +1,269 @@
+"""
+Local prompt compression: requirement extraction, boilerplate removal and token budgets
+
+Full job descriptions are mostly company pitch, benefits and EEO statements.
+Before a description goes into an LLM prompt it is reduced to its requirement
+and responsibility sentences plus a keyword line, and every variable prompt
+section is fitted to a token budget measured with a real tokenizer when one is
+installed.
+"""
+import re
+from job_ranking import tokenize
+
+# Token budgets for variable prompt sections
+DESCRIPTION_TOKEN_BUDGET = 450
+CONTEXT_TOKEN_BUDGET = 200
+CV_TOKEN_BUDGET = 500
+KEYWORD_COUNT = 15
+
+_BOILERPLATE_PATTERNS = [
+    r"equal (?:employment )?opportunity",
+    r"without regard to",
+    r"\b(?:race|religion|sexual orientation|gender identity|national origin|veteran status)\b",
+    r"reasonable accommodation",
+    r"e-verify",
+    r"\b401\s*\(?k\)?",
+    r"\b(?:medical|dental|vision)\b.*\binsurance\b",
+    r"\b(?:paid time off|pto|parental leave|vacation|wellness|gym|commuter|stipend)\b",
+    r"\b(?:competitive (?:salary|pay|compensation)|equity)\b",
+    r"\bsalary range\b|\bpay range\b|\bbase pay\b|\$\d",
+    r"\bapply (?:now|today)\b|\bclick apply\b",
+    r"\bprivacy (?:policy|notice)\b",
+]
+BOILERPLATE_RE = re.compile("|".join(_BOILERPLATE_PATTERNS), re.I)
+
+# Section headings whose whole section is boilerplate
+BOILERPLATE_HEADING_RE = re.compile(
+    r"^(?:benefits|perks|what we offer|compensation|our benefits|eeo|equal opportunity|about us|about the company)\b",
+    re.I)
+
+# Other section names recognized as headings without a trailing ':'
+SECTION_HEADING_RE = re.compile(
+    r"^(?:requirements|qualifications|(?:minimum|basic|preferred) qualifications|responsibilities|"
+    r"key responsibilities|what you(?:'ll| will) do|what we(?:'re| are) looking for|what you(?:'ll| will) bring|"
+    r"about the (?:role|team|job)|the role|your role|nice to have|skills|tech stack|who you are|"
+    r"benefits|perks|what we offer|compensation|our benefits|eeo|equal opportunity|about us|about the company)"
+    r"\s*:?$", re.I)
+
+_REQUIREMENT_PATTERNS = [
+    r"\brequire", r"\bmust\b", r"\bshould have\b", r"\bexperience (?:with|in|building|using)\b",
+    r"\b\d+\+?\s*(?:years|yrs)\b", r"\bproficien", r"\bknowledge of\b", r"\bfamiliar", r"\bdegree\b",
+    r"\bexpertise\b", r"\bnice to have\b", r"\bbonus points\b",
+    r"\bbackground in\b",
+]
+REQUIREMENT_RE = re.compile("|".join(_REQUIREMENT_PATTERNS), re.I)
+
+_RESPONSIBILITY_RE = re.compile(
+    r"^(?:you will|you'll|design|build|develop|own|lead|maintain|operate|improve|implement|work with|"
+    r"collaborate|mentor|drive|deliver|create|manage|support|analy[sz]e|write)\b", re.I)
+
+# Words too generic to be useful keywords
+_GENERIC_WORDS = frozenset("""
+experience work team years strong knowledge ability skills working including using role job company
+new build building etc must will well good great help join looking across within based plus
+""".split())
+
+_encoder = None
+_encoder_loaded = False
+
+
+def _get_encoder():
+    """tiktoken encoder if installed (o200k_base matches gpt-oss), else None"""
+    global _encoder, _encoder_loaded
+    if not _encoder_loaded:
+        _encoder_loaded = True
+        try:
+            import tiktoken
+            _encoder = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            _encoder = None
+    return _encoder
+
+
+_APPROX_TOKEN_RE = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]")
+
+
+def count_tokens(text):
+    """
+    Count prompt tokens
+
+    Uses tiktoken when installed. Otherwise approximates BPE tokenization by
+    counting words, short digit runs and punctuation, with long words counted
+    as several tokens.
+
+    Args:
+        text (str): Text to measure
+
+    Returns:
+        int: Token count
+    """
+    if not text:
+        return 0
+    encoder = _get_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text, disallowed_special=()))
+    return sum(1 + len(piece) // 8 for piece in _APPROX_TOKEN_RE.findall(text))
+
+
+def split_sentences(text):
+    """Split text into sentences and list items, one per entry"""
+    sentences = []
+    for line in text.splitlines():
+        line = line.strip(" \t•-*·")
+        if not line:
+            continue
+        sentences.extend(part.strip() for part in re.split(r"(?<=[.!?])\s+(?=[A-Z])", line) if part.strip())
+    return sentences
+
+
+def _is_heading(sentence, has_content):
+    """A short line ending with ':' or naming a known section, followed by content"""
+    if not has_content or len(sentence) >= 60:
+        return False
+    return sentence.endswith(':') or bool(SECTION_HEADING_RE.match(sentence))
+
+
+def strip_boilerplate(sentences):
+    """
+    Drop boilerplate sentences, boilerplate sections and repeated sentences
+
+    Boilerplate is checked first: sentences matching BOILERPLATE_RE and everything
+    under a boilerplate heading are dropped. Other headings are dropped unless they
+    name requirements ("Requirements", "Nice to have"), and other requirement
+    sentences are always kept.
+
+    Args:
+        sentences (list): Sentences in document order
+
+    Returns:
+        list: Remaining sentences in document order
+    """
+    kept = []
+    seen = set()
+    in_boilerplate_section = False
+    for i, sentence in enumerate(sentences):
+        if _is_heading(sentence, i + 1 < len(sentences)):
+            in_boilerplate_section = bool(BOILERPLATE_HEADING_RE.match(sentence.rstrip(':')))
+            if in_boilerplate_section or not REQUIREMENT_RE.search(sentence):
+                continue
+        elif in_boilerplate_section or BOILERPLATE_RE.search(sentence):
+            continue
+        normalized = " ".join(tokenize(sentence))
+        if not normalized or normalized in seen:
+            continue
+        seen.add(normalized)
+        kept.append(sentence)
+    return kept
+
+
+def extract_keywords(text, profile_text=None, top_n=KEYWORD_COUNT):
+    """
+    Extract the most salient keywords of a job text
+
+    Terms are ranked by frequency in the job text, with terms that also appear
+    in the candidate's profile (CV or cover letter) and technical-looking terms
+    (containing digits, '+', '#' or '.') boosted.
+
+    Args:
+        text (str): Job text
+        profile_text (str): Optional CV or cover letter text
+        top_n (int): Number of keywords to return
+
+    Returns:
+        list: Keywords, most salient first
+    """
+    profile_terms = set(tokenize(profile_text)) if profile_text else set()
+    scores = {}
+    for token in tokenize(text):
+        if token in _GENERIC_WORDS or len(token) < 2 or token.isdigit():
+            continue
+        scores[token] = scores.get(token, 0.0) + 1.0
+    for token in scores:
+        if token in profile_terms:
+            scores[token] *= 2.0
+        if re.search(r"[\d+#.]", token):
+            scores[token] *= 1.5
+    return sorted(scores, key=lambda t: (-scores[t], t))[:top_n]
+
+
+def fit_to_budget(text, max_tokens):
+    """
+    Truncate text to a token budget at a sentence or line boundary
+
+    Args:
+        text (str): Text to fit
+        max_tokens (int): Token budget
+
+    Returns:
+        str: Text within budget
+    """
+    if not text or count_tokens(text) <= max_tokens:
+        return text or ""
+    kept, used = [], 0
+    for line in text.splitlines():
+        cost = count_tokens(line) + 1
+        if used + cost <= max_tokens:
+            kept.append(line)
+            used += cost
+            continue
+        # Line does not fit: keep as many of its sentences as the budget allows
+        partial = []
+        for sentence in re.split(r"(?<=[.!?])\s+", line):
+            cost = count_tokens(sentence) + 1
+            if used + cost > max_tokens:
+                break
+            partial.append(sentence)
+            used += cost
+        if partial:
+            kept.append(" ".join(partial))
+        break
+    return "\n".join(kept).strip()
+
+
+def compress_job_description(description, profile_text=None, max_tokens=DESCRIPTION_TOKEN_BUDGET):
+    """
+    Reduce a job description to its requirements within a token budget
+
+    Requirement sentences are kept first, then responsibilities, then other
+    content, each group in document order, one per line. When sentences had to
+    be cut for the budget, a keyword line of the whole description follows.
+    Descriptions already within budget and free of boilerplate pass through
+    unchanged, as does any description the compression would not shorten.
+
+    Args:
+        description (str): Job description or snippet
+        profile_text (str): Optional CV or cover letter text used to boost keywords
+        max_tokens (int): Token budget for the result
+
+    Returns:
+        str: Compressed description
+    """
+    if not description or description == "N/A":
+        return description or ""
+    sentences = split_sentences(description)
+    kept = strip_boilerplate(sentences)
+    if len(kept) == len(sentences) and count_tokens(description) <= max_tokens:
+        return description
+
+    keywords = extract_keywords(" ".join(kept), profile_text)
+    keyword_line = f"Keywords: {', '.join(keywords)}" if keywords else ""
+    budget = max_tokens - count_tokens(keyword_line) - 4
+
+    requirements = [s for s in kept if REQUIREMENT_RE.search(s)]
+    responsibilities = [s for s in kept if s not in requirements and _RESPONSIBILITY_RE.search(s)]
+    other = [s for s in kept if s not in requirements and s not in responsibilities]
+
+    selected, used = set(), 0
+    for sentence in requirements + responsibilities + other:
+        cost = count_tokens(sentence) + 2
+        if used + cost > budget:
+            continue
+        selected.add(sentence)
+        used += cost
+
+    lines = [s for s in kept if s in selected]
+    if not lines or count_tokens("\n".join(lines)) >= count_tokens(description):
+        return description
+    if keyword_line and len(lines) < len(kept):
+        lines.append(keyword_line)
+    return "\n".join(lines)
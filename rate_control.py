@@ -0,0 +1,259 @@
+"""
+Adaptive (AIMD) concurrency control and retries for rate-limited API calls
+
+Instead of fixed sleeps between LLM calls, the controller lets a number of
+calls run at once and adapts that number: it grows additively while calls
+succeed and is cut multiplicatively when the API answers 429, much like TCP
+congestion control. Retry-After and rate-limit headers pause all callers until
+the window resets, and transient failures (timeouts, connection errors, 5xx)
+are retried with exponential backoff and jitter.
+"""
+import re
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+
+TRANSIENT_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def parse_duration(value):
+    """
+    Parse a rate-limit reset value into seconds
+
+    Accepts plain seconds ("7", "0.5"), Go-style durations used by Groq/OpenAI
+    reset headers ("2m59.56s", "120ms") and HTTP dates (Retry-After).
+
+    Args:
+        value (str): Header value
+
+    Returns:
+        float: Seconds, or None if the value cannot be parsed
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART_RE.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        scale = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+        return sum(float(n) * scale[u] for n, u in parts)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _header(headers, name):
+    if not headers:
+        return None
+    try:
+        return headers.get(name)
+    except AttributeError:
+        return None
+
+
+def error_status(exc):
+    """HTTP status code of an API exception (Groq/OpenAI SDK or requests), if any"""
+    status = getattr(exc, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(exc, 'response', None), 'status_code', None)
+    return status
+
+
+def error_headers(exc):
+    """Response headers of an API exception, if any"""
+    return getattr(getattr(exc, 'response', None), 'headers', None)
+
+
+def is_transient(exc):
+    """True for errors worth retrying: rate limits, 5xx, timeouts and connection errors"""
+    status = error_status(exc)
+    if status is not None:
+        return status in TRANSIENT_STATUS_CODES
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    name = type(exc).__name__.lower()
+    return 'timeout' in name or 'connection' in name
+
+
+class AdaptiveConcurrencyController:
+    def __init__(self, initial_limit=2, min_limit=1, max_limit=16, decrease_factor=0.5,
+                 max_retries=5, base_backoff=1.0, max_backoff=60.0, latency_tolerance=2.5):
+        """
+        Initialize the controller
+
+        Args:
+            initial_limit (int): Concurrent calls allowed at start
+            min_limit (int): Lower bound for the concurrency limit
+            max_limit (int): Upper bound for the concurrency limit
+            decrease_factor (float): Multiplier applied to the limit on a 429
+            max_retries (int): Retries per call for transient failures
+            base_backoff (float): First retry delay in seconds (doubles each retry)
+            max_backoff (float): Cap for retry delays and Retry-After pauses
+            latency_tolerance (float): Stop growing the limit while latency exceeds
+                this multiple of the best latency seen (the API is queueing)
+        """
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.latency_tolerance = latency_tolerance
+
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._best_latency = None
+        self.stats = {'calls': 0, 'successes': 0, 'failures': 0, 'retries': 0,
+                      'rate_limited': 0, 'peak_limit': self.limit}
+
+    # ── admission ──────────────────────────────────────────────────────
+    def acquire(self):
+        """Block until a call may start"""
+        with self._cond:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0 and self._in_flight < max(self.min_limit, int(self.limit)):
+                    self._in_flight += 1
+                    return
+                self._cond.wait(timeout=wait if wait > 0 else None)
+
+    def release(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def pause(self, seconds):
+        """Hold back all new calls for the given number of seconds"""
+        seconds = min(seconds, self.max_backoff)
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._cond.notify_all()
+
+    # ── feedback ───────────────────────────────────────────────────────
+    def on_success(self, latency, headers=None):
+        """
+        Record a successful call: grow the limit by roughly one call per window
+
+        Args:
+            latency (float): Call latency in seconds
+            headers (dict): Optional response headers with rate-limit information
+        """
+        with self._cond:
+            self.stats['successes'] += 1
+            if self._best_latency is None or latency < self._best_latency:
+                self._best_latency = latency
+            congested = latency > self._best_latency * self.latency_tolerance
+            if not congested:
+                self.limit = min(self.max_limit, self.limit + 1.0 / max(self.limit, 1.0))
+                self.stats['peak_limit'] = max(self.stats['peak_limit'], self.limit)
+            self._cond.notify_all()
+
+        # Out of requests in the current window: wait for it to reset
+        remaining = _header(headers, 'x-ratelimit-remaining-requests')
+        if remaining is not None and str(remaining).strip() == '0':
+            reset = parse_duration(_header(headers, 'x-ratelimit-reset-requests'))
+            if reset:
+                self.pause(reset)
+
+    def on_rate_limited(self, headers=None):
+        """
+        Record a 429: cut the limit (once per congestion event) and honour Retry-After
+
+        Args:
+            headers (dict): Optional response headers
+        """
+        retry_after = (parse_duration(_header(headers, 'retry-after'))
+                       or parse_duration(_header(headers, 'x-ratelimit-reset-requests'))
+                       or parse_duration(_header(headers, 'x-ratelimit-reset-tokens')))
+        now = time.monotonic()
+        with self._cond:
+            self.stats['rate_limited'] += 1
+            # Several in-flight calls fail together; count that as one event
+            if now - self._last_decrease > (self._best_latency or 1.0):
+                self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+                self._last_decrease = now
+        self.pause(retry_after if retry_after is not None else self.base_backoff)
+
+    def _backoff(self, attempt):
+        delay = min(self.max_backoff, self.base_backoff * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    # ── execution ──────────────────────────────────────────────────────
+    def call(self, fn, *args, **kwargs):
+        """
+        Run fn under the concurrency limit, retrying transient failures
+
+        Args:
+            fn (callable): Function performing one API call
+
+        Returns:
+            Result of fn
+
+        Raises:
+            The last exception if retries are exhausted or the error is not transient
+        """
+        result, _ = self.call_with_headers(lambda: (fn(*args, **kwargs), None))
+        return result
+
+    def call_with_headers(self, fn, max_retries=None):
+        """
+        Run fn, which returns (result, response_headers), under the limit with retries
+
+        Args:
+            fn (callable): Function returning (result, headers)
+            max_retries (int): Optional override of the controller's retry count,
+                e.g. to fail over to another model quickly
+
+        Returns:
+            tuple: (result, headers) of the successful attempt
+        """
+        if max_retries is None:
+            max_retries = self.max_retries
+        with self._cond:
+            self.stats['calls'] += 1
+        attempt = 0
+        while True:
+            self.acquire()
+            started = time.monotonic()
+            try:
+                result, headers = fn()
+            except Exception as e:
+                self.release()
+                if error_status(e) == 429:
+                    self.on_rate_limited(error_headers(e))
+                    delay = 0.0    # the pause set by on_rate_limited gates the retry
+                elif is_transient(e):
+                    delay = self._backoff(attempt)
+                else:
+                    with self._cond:
+                        self.stats['failures'] += 1
+                    raise
+                if attempt >= max_retries:
+                    with self._cond:
+                        self.stats['failures'] += 1
+                    raise
+                attempt += 1
+                with self._cond:
+                    self.stats['retries'] += 1
+                if delay:
+                    time.sleep(delay)
+                continue
+            self.release()
+            self.on_success(time.monotonic() - started, headers)
+            return result, headers
+
+    def summary(self):
+        """One-line description of the controller state"""
+        s = self.stats
+        return (f"{s['successes']}/{s['calls']} calls succeeded, {s['retries']} retries, "
+                f"{s['rate_limited']} rate-limited, concurrency limit {self.limit:.1f} "
+                f"(peak {s['peak_limit']:.1f})")
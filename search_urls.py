@@ -0,0 +1,69 @@
+"""
+LinkedIn job search URL builder
+
+Search results can be loaded directly from a URL carrying the keywords,
+location, filters and a `start` offset, instead of typing into the search form
+and scrolling. Every results page is then an independent request.
+"""
+from urllib.parse import urlencode
+
+JOBS_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+RESULTS_PER_PAGE = 25
+
+# Filter name -> (query parameter, friendly value -> LinkedIn code)
+SEARCH_FILTERS = {
+    'date_posted': ('f_TPR', {'hour': 'r3600', '24h': 'r86400', 'day': 'r86400',
+                              'week': 'r604800', 'month': 'r2592000'}),
+    'job_type': ('f_JT', {'full_time': 'F', 'part_time': 'P', 'contract': 'C', 'temporary': 'T',
+                          'internship': 'I', 'volunteer': 'V', 'other': 'O'}),
+    'experience': ('f_E', {'internship': '1', 'entry': '2', 'associate': '3', 'mid_senior': '4',
+                           'director': '5', 'executive': '6'}),
+    'workplace': ('f_WT', {'on_site': '1', 'remote': '2', 'hybrid': '3'}),
+    'easy_apply': ('f_AL', {True: 'true', 'true': 'true'}),
+    'sort': ('sortBy', {'recent': 'DD', 'relevant': 'R'}),
+    'geo_id': ('geoId', {}),
+    'distance': ('distance', {}),
+}
+
+
+def _filter_value(codes, value):
+    """Map friendly filter values (or lists of them) to LinkedIn codes; unknown values pass through"""
+    values = value if isinstance(value, (list, tuple, set)) else [value]
+    return ",".join(str(codes.get(v, v)) for v in values)
+
+
+def build_search_url(keywords, location=None, filters=None, start=0, base_url=JOBS_SEARCH_URL):
+    """
+    Build a job search results URL
+
+    Args:
+        keywords (str): Search keywords (job title)
+        location (str): Location name
+        filters (dict): Optional filters by friendly name, e.g.
+            {"date_posted": "week", "experience": ["entry", "associate"], "workplace": "remote"};
+            raw LinkedIn parameters (e.g. {"f_C": "1035"}) are passed through
+        start (int): Result offset (multiple of RESULTS_PER_PAGE)
+        base_url (str): Search endpoint (the guest API or a local fixture server also work)
+
+    Returns:
+        str: URL
+    """
+    params = {'keywords': keywords}
+    if location:
+        params['location'] = location
+    for name, value in (filters or {}).items():
+        if value is None or value is False or value == [] or value == "":
+            continue
+        if name in SEARCH_FILTERS:
+            param, codes = SEARCH_FILTERS[name]
+            params[param] = _filter_value(codes, value)
+        else:
+            params[name] = _filter_value({}, value)
+    if start:
+        params['start'] = int(start)
+    return f"{base_url}?{urlencode(params)}"
+
+
+def page_offsets(max_results, per_page=RESULTS_PER_PAGE):
+    """start offsets of the result pages needed for max_results jobs"""
+    return list(range(0, max(max_results, 1), per_page))
@@ -0,0 +1,166 @@
+"""
+Self-ordering CSS selector fallbacks with hit-rate statistics
+
+The scraper tries several selectors per field because LinkedIn serves more
+than one page layout. Every selector that misses costs a WebDriver round-trip,
+so SelectorRegistry records hits and misses per selector, tries the selector
+with the best hit rate first, and saves the statistics between runs (older
+runs count half as much at each load, so a layout change is picked up
+quickly). Selectors that keep missing are reported as dead.
+"""
+import os
+import json
+import tempfile
+import threading
+from config import SELECTOR_STATS_FILE
+
+# Weight of previous runs' counts when the statistics are loaded
+CARRY_OVER = 0.5
+
+
+class SelectorRegistry:
+    def __init__(self, path=SELECTOR_STATS_FILE):
+        """
+        Initialize the registry and load saved statistics
+
+        Args:
+            path (str): JSON file holding the statistics (None keeps them in memory)
+        """
+        self.path = path
+        # group -> selector -> {'hits': float, 'misses': float}
+        self.stats = {}
+        self.lookups = 0
+        self.attempts = 0
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load saved statistics, down-weighting them by CARRY_OVER"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not read selector statistics {self.path}: {e}")
+            return
+        for group, selectors in saved.items():
+            for selector, counts in selectors.items():
+                self.stats.setdefault(group, {})[selector] = {
+                    'hits': counts.get('hits', 0) * CARRY_OVER,
+                    'misses': counts.get('misses', 0) * CARRY_OVER,
+                }
+
+    def save(self):
+        """Write the statistics atomically"""
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix="selector_stats_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                with self._lock:
+                    rounded = {group: {selector: {k: round(v, 2) for k, v in counts.items()}
+                                       for selector, counts in selectors.items()}
+                               for group, selectors in self.stats.items()}
+                json.dump(rounded, f, indent=2)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Could not save selector statistics {self.path}: {e}")
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _hit_rate(self, group, selector):
+        counts = self.stats.get(group, {}).get(selector)
+        if not counts:
+            return None
+        # Laplace smoothing: one miss does not bury a selector that has never been tried much
+        return (counts['hits'] + 1) / (counts['hits'] + counts['misses'] + 2)
+
+    def ordered(self, group, selectors):
+        """
+        Selectors of a group, best hit rate first
+
+        Selectors without statistics keep their position relative to each other
+        and are tried after those known to hit.
+
+        Args:
+            group (str): Field or element name, e.g. 'card_title'
+            selectors (list): Selectors in their default order
+
+        Returns:
+            list: Reordered selectors
+        """
+        with self._lock:
+            rates = {selector: self._hit_rate(group, selector) for selector in selectors}
+        return sorted(selectors, key=lambda s: (-(rates[s] if rates[s] is not None else 0.5),
+                                                selectors.index(s)))
+
+    def record(self, group, selector, hit):
+        """Count one hit or miss for a selector"""
+        with self._lock:
+            counts = self.stats.setdefault(group, {}).setdefault(selector, {'hits': 0, 'misses': 0})
+            counts['hits' if hit else 'misses'] += 1
+            self.attempts += 1
+
+    def find(self, context, group, selectors, multiple=False, record=True):
+        """
+        Find the first element (or elements) matching any selector of a group
+
+        Uses find_elements, which returns an empty list on a miss instead of
+        raising, and tries the selectors in hit-rate order.
+
+        Args:
+            context: Selenium WebDriver or WebElement to search within
+            group (str): Group name for the statistics
+            selectors (list): CSS selectors in their default order
+            multiple (bool): Return all elements matched by the first hitting selector
+            record (bool): Count the attempts (False while polling for a page to load)
+
+        Returns:
+            tuple: (element, or list of elements when multiple, or None; selector that hit or None)
+        """
+        from selenium.webdriver.common.by import By
+        if record:
+            with self._lock:
+                self.lookups += 1
+        for selector in self.ordered(group, selectors):
+            elements = context.find_elements(By.CSS_SELECTOR, selector)
+            if record:
+                self.record(group, selector, bool(elements))
+            if elements:
+                return (elements if multiple else elements[0]), selector
+        return ([] if multiple else None), None
+
+    def dead_selectors(self, min_attempts=20):
+        """
+        Selectors that never hit in at least min_attempts (weighted) tries
+
+        Returns:
+            list: (group, selector, attempts) tuples
+        """
+        with self._lock:
+            return [(group, selector, counts['misses'])
+                    for group, selectors in sorted(self.stats.items())
+                    for selector, counts in selectors.items()
+                    if counts['hits'] == 0 and counts['misses'] >= min_attempts]
+
+    def print_report(self, min_attempts=20):
+        """Print hit rates per group and the dead selectors"""
+        if not self.stats:
+            return
+        print("\n" + "-"*80)
+        print(f"Selector hit rates ({self.attempts} attempts for {self.lookups} lookups this run, "
+              f"{self.attempts / max(self.lookups, 1):.2f} per lookup)")
+        print("-"*80)
+        for group, selectors in sorted(self.stats.items()):
+            ranked = self.ordered(group, list(selectors))
+            print(f"{group}: " + ", ".join(f"{s} {100 * self._hit_rate(group, s):.0f}%" for s in ranked[:3]))
+        dead = self.dead_selectors(min_attempts)
+        if dead:
+            print("Dead selectors (no hits):")
+            for group, selector, attempts in dead:
+                print(f"  {group}: {selector} ({attempts:.0f} misses)")
+        print("-"*80)
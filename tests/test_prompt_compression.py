@@ -0,0 +1,35 @@
+import os
+
+from job_details import parse_description
+from prompt_compression import compress_job_description, count_tokens
+
+FIXTURE = os.path.join(os.path.dirname(__file__), os.pardir, "fixtures", "job_posting.html")
+
+
+def _fixture_description():
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        return parse_description(f.read())
+
+
+def test_fixture_drops_benefits_and_eeo():
+    description = _fixture_description()
+    compressed = compress_job_description(description)
+
+    for boilerplate in ("Competitive salary", "dental and vision insurance", "401(k)", "paid time off",
+                        "equal opportunity employer", "without regard to race"):
+        assert boilerplate in description
+        assert boilerplate not in compressed
+    assert count_tokens(compressed) < count_tokens(description)
+
+
+def test_fixture_keeps_requirements():
+    compressed = compress_job_description(_fixture_description())
+
+    for requirement in ("3+ years of experience", "Strong knowledge of SQL", "You must be comfortable",
+                        "Familiarity with Terraform", "Nice to have"):
+        assert requirement in compressed
+
+
+def test_short_requirement_lines_pass_through():
+    assert compress_job_description("Python, Django, PostgreSQL") == "Python, Django, PostgreSQL"
+    assert compress_job_description("Join our team") == "Join our team"
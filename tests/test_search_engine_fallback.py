@@ -0,0 +1,80 @@
+import pytest
+
+from http_search import HTTPSearchError
+from linkedin_scraper import LinkedInJobScraper
+
+BROWSER_JOBS = [{'job_id': '3900000001', 'title': 'Backend Engineer', 'link': 'https://www.linkedin.com/jobs/view/3900000001/'}]
+
+
+class FakeHTTPSearch:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def search(self, title, location, max_results=50, filters=None, stats=None):
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return list(self.result)
+
+    def close(self):
+        pass
+
+
+def make_scraper(engine, http_result):
+    scraper = LinkedInJobScraper(engine=engine, cookies_file=None, profile_dir=None)
+    scraper.http_search = FakeHTTPSearch(http_result)
+    scraper.browser_searches = 0
+
+    def ensure_browser():
+        scraper.browser_started = True
+
+    def search_by_url(title, location, quota, filters, stats):
+        scraper.browser_searches += 1
+        return list(BROWSER_JOBS)
+
+    scraper._ensure_browser = ensure_browser
+    scraper._search_by_url = search_by_url
+    return scraper
+
+
+def test_auto_falls_back_to_browser_on_empty_first_page():
+    scraper = make_scraper('auto', [])
+    stats = {}
+
+    jobs = scraper._search_combination("Backend Engineer", "Boston, MA", 25, None, 'url', stats)
+
+    assert jobs == BROWSER_JOBS
+    assert stats['engine'] == 'selenium'
+    assert scraper.browser_searches == 1
+    # An empty page does not rule out HTTP for later searches
+    assert not scraper._http_refused
+
+
+def test_auto_falls_back_and_stops_using_http_when_refused():
+    scraper = make_scraper('auto', HTTPSearchError("HTTP 999"))
+
+    jobs = scraper._search_combination("Backend Engineer", "Boston, MA", 25, None, 'url', {})
+
+    assert jobs == BROWSER_JOBS
+    assert scraper._http_refused
+
+
+def test_auto_keeps_http_results():
+    scraper = make_scraper('auto', BROWSER_JOBS)
+    stats = {}
+
+    scraper._search_combination("Backend Engineer", "Boston, MA", 25, None, 'url', stats)
+
+    assert stats['engine'] == 'http'
+    assert scraper.browser_searches == 0
+
+
+def test_http_engine_never_falls_back():
+    scraper = make_scraper('http', [])
+    assert scraper._search_combination("Backend Engineer", "Boston, MA", 25, None, 'url', {}) == []
+    assert scraper.browser_searches == 0
+
+    scraper = make_scraper('http', HTTPSearchError("HTTP 429"))
+    with pytest.raises(HTTPSearchError):
+        scraper._search_combination("Backend Engineer", "Boston, MA", 25, None, 'url', {})